@@ -11,6 +11,7 @@ from .markdown_to_tracwiki import (
     TracWikiRenderer,
     convert_with_warnings,
     markdown_to_tracwiki,
+    markdown_to_tracwiki_batch,
 )
 from .tracwiki_to_markdown import tracwiki_to_markdown
 
@@ -21,6 +22,7 @@ __all__ = [
     "convert_with_warnings",
     "detect_format_heuristic",
     "markdown_to_tracwiki",
+    "markdown_to_tracwiki_batch",
     "markdown_to_tracwiki_lang",
     "tracwiki_to_markdown",
     "tracwiki_to_markdown_lang",
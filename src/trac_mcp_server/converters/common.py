@@ -147,6 +147,10 @@ def tracwiki_to_markdown_lang(processor: str) -> str:
     return processor
 
 
+# Distinct documents remembered by each converter's LRU cache
+CONVERSION_CACHE_SIZE = 128
+
+
 @dataclass
 class ConversionResult:
     """Result of format conversion with metadata and warnings.
@@ -172,6 +176,13 @@ class ConversionResult:
         return self.text
 
 
+# Unambiguous heading markers for detect_format_heuristic
+_TRACWIKI_HEADING_RE = re.compile(
+    r"={1,6}\s+.+?\s+={1,6}", re.MULTILINE
+)
+_MARKDOWN_HEADING_RE = re.compile(r"^#{1,6}\s+[^=]", re.MULTILINE)
+
+
 def detect_format_heuristic(text: str) -> str:
     """Heuristic format detection (fallback when capabilities unavailable).
 
@@ -184,12 +195,12 @@ def detect_format_heuristic(text: str) -> str:
     """
     # Check for unambiguous TracWiki markers
     # Heading with trailing equals: = H1 = or == H2 ==
-    if re.search(r"={1,6}\s+.+?\s+={1,6}", text, re.MULTILINE):
+    if _TRACWIKI_HEADING_RE.search(text):
         return "tracwiki"
 
     # Check for unambiguous Markdown markers
     # Heading without trailing equals: # H1 or ## H2
-    if re.search(r"^#{1,6}\s+[^=]", text, re.MULTILINE):
+    if _MARKDOWN_HEADING_RE.search(text):
         return "markdown"
 
     # Score ambiguous markers
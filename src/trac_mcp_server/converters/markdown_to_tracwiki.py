@@ -1,11 +1,23 @@
 """Markdown to TracWiki conversion using mistune AST rendering."""
 
+import functools
 import re
 from typing import Any
 
 import mistune
 
-from .common import ConversionResult, markdown_to_tracwiki_lang
+from .common import (
+    CONVERSION_CACHE_SIZE,
+    ConversionResult,
+    markdown_to_tracwiki_lang,
+)
+
+# Three or more newlines, collapsed to one blank line after rendering
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+
+# Source features that TracWiki cannot represent faithfully
+_HTML_TAG_RE = re.compile(r"<[a-zA-Z][^>]*>")
+_TOC_MACRO_RE = re.compile(r"\[TOC\]|\[\[TOC\]\]", re.IGNORECASE)
 
 
 class TracWikiRenderer(mistune.BaseRenderer):
@@ -382,30 +394,53 @@ class TracWikiRenderer(mistune.BaseRenderer):
                     return func(text)
 
 
+def _create_markdown() -> mistune.Markdown:
+    """Create a Markdown parser rendering to TracWiki, with tables."""
+    return mistune.create_markdown(
+        renderer=TracWikiRenderer(), plugins=["table"]
+    )
+
+
+def _render(markdown: mistune.Markdown, markdown_text: str) -> str:
+    """Render one document with an existing parser."""
+    # Parse and render
+    result: str = markdown(markdown_text)  # type: ignore[assignment]
+
+    # Clean up extra newlines (but preserve double newlines for paragraph separation)
+    result = _EXTRA_NEWLINES_RE.sub("\n\n", result)
+    result = result.rstrip("\n")
+
+    return result
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
 def markdown_to_tracwiki(markdown_text: str) -> str:
     """
     Convert Markdown text to TracWiki format.
 
+    Results are cached per input text (LRU).
+
     Args:
         markdown_text: Markdown formatted text
 
     Returns:
         TracWiki formatted text
     """
-    # Create renderer and parser with table plugin enabled
-    renderer = TracWikiRenderer()
-    markdown = mistune.create_markdown(
-        renderer=renderer, plugins=["table"]
-    )
+    return _render(_create_markdown(), markdown_text)
 
-    # Parse and render
-    result: str = markdown(markdown_text)  # type: ignore[assignment]
 
-    # Clean up extra newlines (but preserve double newlines for paragraph separation)
-    result = re.sub(r"\n{3,}", "\n\n", result)
-    result = result.rstrip("\n")
+def markdown_to_tracwiki_batch(markdown_texts: list[str]) -> list[str]:
+    """
+    Convert several Markdown texts to TracWiki, sharing one parser.
 
-    return result
+    Args:
+        markdown_texts: Markdown formatted texts
+
+    Returns:
+        TracWiki formatted texts, in the same order
+    """
+    markdown = _create_markdown()
+    return [_render(markdown, text) for text in markdown_texts]
 
 
 def convert_with_warnings(markdown_text: str) -> ConversionResult:
@@ -423,13 +458,13 @@ def convert_with_warnings(markdown_text: str) -> ConversionResult:
     # Tables are now fully supported via mistune table plugin
 
     # Check for HTML tags
-    if re.search(r"<[a-zA-Z][^>]*>", markdown_text):
+    if _HTML_TAG_RE.search(markdown_text):
         warnings.append(
             "HTML tags detected - these may not render correctly in TracWiki."
         )
 
     # Check for TOC macros
-    if re.search(r"\[TOC\]|\[\[TOC\]\]", markdown_text, re.IGNORECASE):
+    if _TOC_MACRO_RE.search(markdown_text):
         warnings.append(
             "TOC macro detected - use [[PageOutline]] in TracWiki instead."
         )
@@ -1,8 +1,68 @@
 """TracWiki to Markdown conversion using regex patterns."""
 
+import dataclasses
+import functools
 import re
 
-from .common import ConversionResult, tracwiki_to_markdown_lang
+from .common import (
+    CONVERSION_CACHE_SIZE,
+    ConversionResult,
+    tracwiki_to_markdown_lang,
+)
+
+# Lossy-element probes used by _detect_lossy_elements
+_UNKNOWN_MACRO_PROBE_RE = re.compile(r"\[\[(?!Image|BR)\w+")
+_DEFINITION_LIST_PROBE_RE = re.compile(r"^\s*.+?::\s*.+$", re.MULTILINE)
+_TABLE_PROBE_RE = re.compile(r"\|\|.*\|\|")
+_PROCESSOR_TABLE_PROBE_RE = re.compile(r"\{\{\{#!t[dh]")
+_CELL_SPAN_PROBE_RE = re.compile(r"\|\|\|\|")
+_TRACLINK_PROBE_RE = re.compile(
+    r"(#\d+|ticket:\d+|wiki:\w+|changeset:\w+)"
+)
+
+# Backslash-continued table row, joined before table parsing
+_ROW_CONTINUATION_RE = re.compile(r"\\\s*\n\s*\|\|")
+
+# Block-level constructs
+_PROCESSOR_CELL_RE = re.compile(
+    r"\{\{\{#!(t[dh])\s*(.*?)\s*\}\}\}", re.DOTALL
+)
+_CODE_BLOCK_LANG_RE = re.compile(
+    r"\{\{\{#!(\w+)\n(.*?)\n\}\}\}", re.DOTALL
+)
+_CODE_BLOCK_RE = re.compile(r"\{\{\{\n(.*?)\n\}\}\}", re.DOTALL)
+
+# Macros
+_IMAGE_MACRO_RE = re.compile(r"\[\[Image\(([^)]+)\)\]\]", re.IGNORECASE)
+_BR_MACRO_RE = re.compile(r"\[\[BR\]\]", re.IGNORECASE)
+_UNKNOWN_MACRO_RE = re.compile(
+    r"\[\[(?!Image|BR)(\w+)(\([^)]*\))?\]\]", re.IGNORECASE
+)
+_MACRO_PLACEHOLDER_RE = re.compile(
+    r"\x00MACRO:([^)]+(?:\([^)]*\))?)\x00"
+)
+
+# Inline formatting, bold+italic before bold before italic
+_BOLD_ITALIC_RE = re.compile(r"'''''(.*?)'''''")
+_BOLD_RE = re.compile(r"'''(.*?)'''")
+_ITALIC_RE = re.compile(r"''(.*?)''")
+
+# Links
+_LINK_WITH_TEXT_RE = re.compile(r"\[(\S+)\s+([^\]]+)\]")
+_SIMPLE_LINK_RE = re.compile(r"\[(\S+)\](?!\()")
+
+# Lists, rules, blockquotes and definition lists
+_LIST_MARKER_RE = re.compile(r"^( +)(\* )+", re.MULTILINE)
+_HRULE_RE = re.compile(r"^----+\s*$", re.MULTILINE)
+_BLOCKQUOTE_RE = re.compile(
+    r"(?:^|\n\n)((?:  [^\n]+\n?)+)", re.MULTILINE
+)
+_DEFINITION_LIST_RE = re.compile(r"^(\s*)(.+?)::\s*(.+)$", re.MULTILINE)
+
+# Tables
+_TABLE_ROW_RE = re.compile(r"^\s*\|\|.*\|\|\s*$")
+_HEADER_ROW_RE = re.compile(r"\|\|=.*=\|\|")
+_HEADER_CELL_RE = re.compile(r"^=(.*)=$")
 
 
 class TracWikiParser:
@@ -51,29 +111,29 @@ class TracWikiParser:
     def _detect_lossy_elements(self, text: str) -> None:
         """Detect lossy elements before conversion and add warnings."""
         # Detect unsupported macros (preserved but not functional)
-        if re.search(r"\[\[(?!Image|BR)\w+", text):
+        if _UNKNOWN_MACRO_PROBE_RE.search(text):
             self.warnings.append(
                 "Unknown macros detected - preserved as [MACRO: ...] notation (not functional in Markdown)"
             )
 
         # Detect definition lists
-        if re.search(r"^\s*.+?::\s*.+$", text, re.MULTILINE):
+        if _DEFINITION_LIST_PROBE_RE.search(text):
             self.warnings.append(
                 "Definition lists detected - converted to bold text (semantic preservation)"
             )
 
         # Detect tables and their features
-        has_regular_tables = re.search(r"\|\|.*\|\|", text)
-        has_processor_tables = re.search(r"\{\{\{#!t[dh]", text)
+        has_regular_tables = _TABLE_PROBE_RE.search(text)
+        has_processor_tables = _PROCESSOR_TABLE_PROBE_RE.search(text)
 
         if has_regular_tables:
             # Check for cell spanning (|||| indicates spanning)
-            if re.search(r"\|\|\|\|", text):
+            if _CELL_SPAN_PROBE_RE.search(text):
                 self.warnings.append(
                     "Table cell spanning detected - merged into single cell (Markdown limitation)"
                 )
             # Check for multi-line rows (backslash continuation)
-            if re.search(r"\\\s*\n\s*\|\|", text):
+            if _ROW_CONTINUATION_RE.search(text):
                 self.warnings.append(
                     "Multi-line table rows detected - joined into single line (Markdown limitation)"
                 )
@@ -85,7 +145,7 @@ class TracWikiParser:
             )
 
         # Detect TracLinks
-        if re.search(r"(#\d+|ticket:\d+|wiki:\w+|changeset:\w+)", text):
+        if _TRACLINK_PROBE_RE.search(text):
             self.warnings.append(
                 "TracLinks detected - preserved as-is (agents can interpret, but not clickable in Markdown renderers)"
             )
@@ -107,12 +167,7 @@ class TracWikiParser:
             else:
                 return f"||{content}||"
 
-        return re.sub(
-            r"\{\{\{#!(t[dh])\s*(.*?)\s*\}\}\}",
-            convert_processor_cell,
-            text,
-            flags=re.DOTALL,
-        )
+        return _PROCESSOR_CELL_RE.sub(convert_processor_cell, text)
 
     def _convert_code_blocks(self, text: str) -> str:
         """Convert code blocks (after processor cells).
@@ -128,19 +183,11 @@ class TracWikiParser:
             md_lang = tracwiki_to_markdown_lang(tracwiki_lang)
             return f"```{md_lang}\n{code}\n```"
 
-        text = re.sub(
-            r"\{\{\{#!(\w+)\n(.*?)\n\}\}\}",
-            convert_code_block_with_lang,
-            text,
-            flags=re.DOTALL,
+        text = _CODE_BLOCK_LANG_RE.sub(
+            convert_code_block_with_lang, text
         )
         # Code block without language
-        text = re.sub(
-            r"\{\{\{\n(.*?)\n\}\}\}",
-            r"```\n\1\n```",
-            text,
-            flags=re.DOTALL,
-        )
+        text = _CODE_BLOCK_RE.sub(r"```\n\1\n```", text)
         return text
 
     def _convert_macros(self, text: str) -> str:
@@ -151,15 +198,10 @@ class TracWikiParser:
         Unknown macros: [[MacroName(args)]] -> placeholder for later restoration
         """
         # Images
-        text = re.sub(
-            r"\[\[Image\(([^)]+)\)\]\]",
-            r"![](\1)",
-            text,
-            flags=re.IGNORECASE,
-        )
+        text = _IMAGE_MACRO_RE.sub(r"![](\1)", text)
 
         # Line break
-        text = re.sub(r"\[\[BR\]\]", "\n", text, flags=re.IGNORECASE)
+        text = _BR_MACRO_RE.sub("\n", text)
 
         # TracLinks: Keep as-is since Markdown has no equivalent
         # Examples: #123, ticket:1, wiki:Page, changeset:abc123
@@ -176,12 +218,7 @@ class TracWikiParser:
             args = match.group(2) if match.group(2) else ""
             return f"\x00MACRO:{macro_name}{args}\x00"
 
-        text = re.sub(
-            r"\[\[(?!Image|BR)(\w+)(\([^)]*\))?\]\]",
-            preserve_unknown_macro,
-            text,
-            flags=re.IGNORECASE,
-        )
+        text = _UNKNOWN_MACRO_RE.sub(preserve_unknown_macro, text)
         return text
 
     def _convert_headings(self, text: str) -> str:
@@ -189,16 +226,23 @@ class TracWikiParser:
 
         Handle headings with or without trailing equals (trailing = is optional in TracWiki).
         """
-        # Process from H6 to H1 to avoid conflicts
-        for level in range(6, 0, -1):
-            marker = "=" * level
-            text = re.sub(
-                rf"^{re.escape(marker)}\s+(.*?)(?:\s+{re.escape(marker)})?\s*$",
-                r"%s \1" % ("#" * level),
-                text,
-                flags=re.MULTILINE,
-            )
-        return text
+        lines = text.split("\n")
+        for i, line in enumerate(lines):
+            if not line.startswith("="):
+                continue
+            body = line.lstrip("=")
+            level = len(line) - len(body)
+            if level > 6 or not body[:1].isspace():
+                continue
+            body = body.strip()
+            # Drop a matching trailing marker, e.g. "== Title =="
+            if (
+                body.endswith("=" * level)
+                and body[:-level][-1:].isspace()
+            ):
+                body = body[:-level].rstrip()
+            lines[i] = f"{'#' * level} {body}"
+        return "\n".join(lines)
 
     def _convert_formatting(self, text: str) -> str:
         """Convert bold/italic formatting (bold before italic to handle nesting).
@@ -206,11 +250,18 @@ class TracWikiParser:
         Bold+italic: '''''text''''' -> ***text***
         Bold: '''text''' -> **text**
         Italic: ''text'' -> *text*
+
+        Only paired delimiters on one line are converted, so a plain
+        str.replace would mangle unpaired quotes such as ``a = ''``.
+        Each pass is skipped when its delimiter is absent.
         """
-        text = re.sub(r"'''''(.*?)'''''", r"***\1***", text)
-        text = re.sub(r"'''(.*?)'''", r"**\1**", text)
-        text = re.sub(r"''(.*?)''", r"*\1*", text)
-        return text
+        if "''" not in text:
+            return text
+        if "'''''" in text:
+            text = _BOLD_ITALIC_RE.sub(r"***\1***", text)
+        if "'''" in text:
+            text = _BOLD_RE.sub(r"**\1**", text)
+        return _ITALIC_RE.sub(r"*\1*", text)
 
     def _convert_links(self, text: str) -> str:
         """Convert links.
@@ -219,7 +270,7 @@ class TracWikiParser:
         Link without text: [url] -> <url>
         """
         # Link with text
-        text = re.sub(r"\[(\S+)\s+([^\]]+)\]", r"[\2](\1)", text)
+        text = _LINK_WITH_TEXT_RE.sub(r"[\2](\1)", text)
 
         # Link without text
         # Must not match if followed by (url), which would be a Markdown link we just created
@@ -230,7 +281,7 @@ class TracWikiParser:
                 return match.group(0)  # Keep macros unchanged
             return f"<{content}>"
 
-        text = re.sub(r"\[(\S+)\](?!\()", convert_simple_link, text)
+        text = _SIMPLE_LINK_RE.sub(convert_simple_link, text)
         return text
 
     def _convert_lists(self, text: str) -> str:
@@ -249,12 +300,7 @@ class TracWikiParser:
             count = asterisk_part.count("* ")
             return leading_space + "- " * count
 
-        text = re.sub(
-            r"^( +)(\* )+",
-            convert_list_marker,
-            text,
-            flags=re.MULTILINE,
-        )
+        text = _LIST_MARKER_RE.sub(convert_list_marker, text)
         return text
 
     def _convert_other_elements(self, text: str) -> str:
@@ -265,7 +311,7 @@ class TracWikiParser:
         Definition lists: term:: definition -> **term**: definition
         """
         # Horizontal rule
-        text = re.sub(r"^----+\s*$", r"---", text, flags=re.MULTILINE)
+        text = _HRULE_RE.sub(r"---", text)
 
         # Blockquote: two-space indent -> > prefix
         # This is tricky because two-space indent is also used for other things in TracWiki
@@ -281,22 +327,12 @@ class TracWikiParser:
             return "\n".join(converted)
 
         # Apply blockquote conversion to paragraphs (between blank lines)
-        text = re.sub(
-            r"(?:^|\n\n)((?:  [^\n]+\n?)+)",
-            convert_blockquote,
-            text,
-            flags=re.MULTILINE,
-        )
+        text = _BLOCKQUOTE_RE.sub(convert_blockquote, text)
 
         # Definition lists: term:: definition -> **term**: definition
         # TracWiki uses :: separator, Markdown has no native definition list
         # Convert to bold term + regular text (semantic preservation)
-        text = re.sub(
-            r"^(\s*)(.+?)::\s*(.+)$",
-            r"\1**\2**: \3",
-            text,
-            flags=re.MULTILINE,
-        )
+        text = _DEFINITION_LIST_RE.sub(r"\1**\2**: \3", text)
 
         return text
 
@@ -307,7 +343,7 @@ class TracWikiParser:
         """
         # Handle multi-line rows (backslash continuation) before parsing
         # Join lines that end with \ followed by lines starting with ||
-        text = re.sub(r"\\\s*\n\s*\|\|", "||", text)
+        text = _ROW_CONTINUATION_RE.sub("||", text)
 
         # Note: Processor-based table cells ({{{#!td}}} / {{{#!th}}}) are already
         # handled at the beginning of conversion, before code block processing.
@@ -362,7 +398,7 @@ class TracWikiParser:
             table_alignments = []
 
         for line in lines:
-            if re.match(r"^\s*\|\|.*\|\|\s*$", line):
+            if _TABLE_ROW_RE.match(line):
                 cells, aligns, is_header = self._parse_tracwiki_row(
                     line
                 )
@@ -423,7 +459,7 @@ class TracWikiParser:
         is_header = False
 
         # Check if row has header markers
-        if re.search(r"\|\|=.*=\|\|", row):
+        if _HEADER_ROW_RE.search(row):
             is_header = True
 
         # Split by || but preserve empty cells for spanning detection
@@ -448,7 +484,7 @@ class TracWikiParser:
                 cell = raw_cell
 
                 # Check for header markers: =text= or = text =
-                header_match = re.match(r"^=(.*)=$", cell.strip())
+                header_match = _HEADER_CELL_RE.match(cell.strip())
                 if header_match:
                     cell = header_match.group(1)
                     is_header = True
@@ -497,9 +533,13 @@ class TracWikiParser:
 
         Convert \x00MACRO:Name(args)\x00 back to [MACRO: Name(args)]
         """
-        return re.sub(
-            r"\x00MACRO:([^)]+(?:\([^)]*\))?)\x00", r"[MACRO: \1]", text
-        )
+        return _MACRO_PLACEHOLDER_RE.sub(r"[MACRO: \1]", text)
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _convert_cached(tracwiki_text: str) -> ConversionResult:
+    """Parse one document; shared result, never handed out directly."""
+    return TracWikiParser().parse(tracwiki_text)
 
 
 def tracwiki_to_markdown(tracwiki_text: str) -> ConversionResult:
@@ -508,6 +548,8 @@ def tracwiki_to_markdown(tracwiki_text: str) -> ConversionResult:
 
     This is a best-effort conversion using regex replacements. Unknown TracWiki
     macros and unsupported features pass through unchanged without errors.
+    Repeated inputs are served from an LRU cache; each call still gets its
+    own result object.
 
     Args:
         tracwiki_text: TracWiki formatted text
@@ -515,5 +557,5 @@ def tracwiki_to_markdown(tracwiki_text: str) -> ConversionResult:
     Returns:
         ConversionResult with Markdown text and warnings about lossy conversions
     """
-    parser = TracWikiParser()
-    return parser.parse(tracwiki_text)
+    cached = _convert_cached(tracwiki_text)
+    return dataclasses.replace(cached, warnings=list(cached.warnings))
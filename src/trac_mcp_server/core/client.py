@@ -175,6 +175,23 @@ class TracClient:
             ValueError: If summary or description is empty
             xmlrpc.client.Fault: If server validation fails or permissions denied
         """
+        params = self._create_ticket_params(
+            summary, description, ticket_type, attributes, notify
+        )
+        result = self._rpc_request("ticket", "create", *params)
+        return int(result)
+
+    def _create_ticket_params(
+        self,
+        summary: str,
+        description: str,
+        ticket_type: str | None,
+        attributes: dict[str, Any] | None,
+        notify: bool,
+    ) -> tuple[Any, ...]:
+        """
+        Validate create arguments and build ticket.create params.
+        """
         # Validate required fields
         if not summary or not summary.strip():
             raise ValueError("Summary is required and cannot be empty")
@@ -190,10 +207,7 @@ class TracClient:
         attrs: dict[str, Any] = attributes.copy() if attributes else {}
         attrs["type"] = ticket_type
 
-        result = self._rpc_request(
-            "ticket", "create", summary, description, attrs, notify
-        )
-        return int(result)
+        return self._check_params(summary, description, attrs, notify)
 
     def update_ticket(
         self,
@@ -218,14 +232,36 @@ class TracClient:
             ValueError: If comment exceeds 10000 characters
             xmlrpc.client.Fault: If ticket not found, validation fails, or concurrent update
         """
-        # Validate comment length
+        self._check_comment(comment)
+
+        # Get current state for optimistic locking timestamp
+        ticket_data = self._rpc_request("ticket", "get", ticket_id)
+        params = self._update_ticket_params(
+            ticket_id, comment, attributes, notify, ticket_data
+        )
+        result = self._rpc_request("ticket", "update", *params)
+        return result
+
+    def _check_comment(self, comment: str) -> None:
+        """
+        Reject comments longer than Trac's 10000 character limit.
+        """
         if comment and len(comment) > 10000:
             raise ValueError(
                 "Comment exceeds maximum length of 10000 characters"
             )
 
-        # Get current state for optimistic locking timestamp
-        ticket_data = self._rpc_request("ticket", "get", ticket_id)
+    def _update_ticket_params(
+        self,
+        ticket_id: int,
+        comment: str,
+        attributes: dict[str, Any] | None,
+        notify: bool,
+        ticket_data: Any,
+    ) -> tuple[Any, ...]:
+        """
+        Build ticket.update params, taking _ts from the current ticket data.
+        """
         if not isinstance(ticket_data, list) or len(ticket_data) < 4:
             raise ValueError("Invalid ticket data format from server")
         current_attrs = ticket_data[
@@ -246,10 +282,22 @@ class TracClient:
         if "action" not in update_attrs:
             update_attrs["action"] = "leave"
 
-        result = self._rpc_request(
-            "ticket", "update", ticket_id, comment, update_attrs, notify
+        return self._check_params(
+            ticket_id, comment, update_attrs, notify
         )
-        return result
+
+    def _check_params(self, *params: Any) -> tuple[Any, ...]:
+        """
+        Reject params XML-RPC cannot encode (e.g. None field values).
+
+        Checking before sending keeps one bad ticket from failing a
+        whole multicall request.
+        """
+        try:
+            xmlrpc.client.dumps(params)
+        except (TypeError, OverflowError) as e:
+            raise ValueError(f"Invalid ticket field value: {e}") from e
+        return params
 
     def get_ticket_actions(self, ticket_id: int) -> list[Any]:
         """
@@ -752,3 +800,157 @@ class TracClient:
         """
         result = self._rpc_request("ticket", "getTicketFields")
         return result
+
+    # Batch ticket operations (system.multicall round trips)
+
+    def multicall(
+        self, calls: list[tuple[str, tuple[Any, ...]]]
+    ) -> list[Any]:
+        """
+        Run several XML-RPC calls in a single system.multicall request.
+
+        Args:
+            calls: (method name, params) pairs, e.g. ("ticket.delete", (42,))
+
+        Returns:
+            One entry per call, in order: the call's return value, or an
+            xmlrpc.client.Fault instance if that call failed
+
+        Raises:
+            xmlrpc.client.Fault: If the multicall request itself fails
+        """
+        if not calls:
+            return []
+        payload = [
+            {"methodName": method, "params": list(params)}
+            for method, params in calls
+        ]
+        results = self._rpc_request("system", "multicall", payload)
+        return [
+            xmlrpc.client.Fault(
+                r.get("faultCode", 0),
+                r.get("faultString", "Unknown error"),
+            )
+            if isinstance(r, dict)
+            else r[0]
+            for r in results
+        ]
+
+    def create_tickets(
+        self,
+        tickets: list[
+            tuple[str, str, str | None, dict[str, Any] | None]
+        ],
+        notify: bool = False,
+    ) -> list[Any]:
+        """
+        Create several tickets in one round trip.
+
+        Args:
+            tickets: (summary, description, ticket_type, attributes) tuples,
+                as accepted by create_ticket()
+            notify: Send email notifications
+
+        Returns:
+            One entry per ticket, in order: the new ticket ID (int), or the
+            ValueError/xmlrpc.client.Fault that rejected it
+        """
+        results: list[Any] = [None] * len(tickets)
+        slots: list[int] = []
+        calls = []
+        for i, ticket in enumerate(tickets):
+            try:
+                params = self._create_ticket_params(*ticket, notify)
+            except ValueError as e:
+                results[i] = e
+                continue
+            slots.append(i)
+            calls.append(("ticket.create", params))
+
+        for i, result in zip(slots, self.multicall(calls), strict=True):
+            results[i] = (
+                result if isinstance(result, Exception) else int(result)
+            )
+        return results
+
+    def update_tickets(
+        self,
+        updates: list[tuple[int, str, dict[str, Any] | None]],
+        notify: bool = False,
+    ) -> list[Any]:
+        """
+        Update several tickets with optimistic locking in two round trips.
+
+        The first multicall fetches each ticket's _ts, the second applies
+        the updates.
+
+        Args:
+            updates: (ticket_id, comment, attributes) tuples, as accepted by
+                update_ticket()
+            notify: Send email notifications
+
+        Returns:
+            One entry per update, in order: the updated ticket data, or the
+            exception that rejected it (including a failed ticket.get
+            request, since no update was sent)
+        """
+        results: list[Any] = [None] * len(updates)
+        slots: list[int] = []
+        gets = []
+        for i, (ticket_id, comment, _) in enumerate(updates):
+            try:
+                self._check_comment(comment)
+            except ValueError as e:
+                results[i] = e
+                continue
+            slots.append(i)
+            gets.append(("ticket.get", (ticket_id,)))
+
+        try:
+            tickets = self.multicall(gets)
+        except xmlrpc.client.Fault:
+            raise
+        except Exception as e:
+            # Nothing has been changed yet, so each update simply failed
+            tickets = [e] * len(gets)
+
+        update_slots: list[int] = []
+        calls = []
+        for i, ticket_data in zip(slots, tickets, strict=True):
+            if isinstance(ticket_data, Exception):
+                results[i] = ticket_data
+                continue
+            try:
+                params = self._update_ticket_params(
+                    *updates[i], notify, ticket_data
+                )
+            except ValueError as e:
+                results[i] = e
+                continue
+            update_slots.append(i)
+            calls.append(("ticket.update", params))
+
+        for i, result in zip(
+            update_slots, self.multicall(calls), strict=True
+        ):
+            results[i] = result
+        return results
+
+    def delete_tickets(self, ticket_ids: list[int]) -> list[Any]:
+        """
+        Delete several tickets in one round trip.
+
+        Args:
+            ticket_ids: Ticket numbers to delete
+
+        Returns:
+            One entry per ticket, in order: True, or the
+            xmlrpc.client.Fault that rejected it
+        """
+        results = self.multicall(
+            [("ticket.delete", (tid,)) for tid in ticket_ids]
+        )
+        return [
+            result if isinstance(result, Exception) else True
+            for result in results
+        ]
@@ -64,6 +64,31 @@ def format_timestamp(timestamp: Any) -> str:
             return str(timestamp)
 
 
+# XML-RPC fault code for an unknown method
+METHOD_NOT_FOUND = -32601
+
+
+def is_method_not_found(error: xmlrpc.client.Fault) -> bool:
+    """Check whether a fault means the server lacks the called method.
+
+    Trac's XmlRpcPlugin answers with fault code -32601 and a message
+    like 'RPC method "x" not found'; other servers only say "no such
+    method" in the message.
+
+    Args:
+        error: XML-RPC fault exception
+
+    Returns:
+        True if the fault reports an unknown method
+    """
+    if error.faultCode == METHOD_NOT_FOUND:
+        return True
+    fault_str = str(error.faultString).lower()
+    return "no such method" in fault_str or (
+        "method" in fault_str and "not found" in fault_str
+    )
+
+
 # ---------------------------------------------------------------------------
 # Domain-specific corrective action messages
 # ---------------------------------------------------------------------------
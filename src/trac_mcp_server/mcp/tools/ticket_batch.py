@@ -3,30 +3,55 @@
 This module implements batch ticket operations: batch create, batch update,
 and batch delete. All operations use best-effort processing -- every item
 is attempted, and per-item success/failure is reported in the response.
-Parallelism is bounded by the existing gather_limited/run_sync_limited
-infrastructure.
+Each batch reaches Trac as bounded system.multicall requests (see
+TracClient.create_tickets/update_tickets/delete_tickets) rather than one
+XML-RPC round trip per item. Servers without system.multicall get one
+concurrent request per item instead. Items whose request failed after
+it may have reached Trac (read timeout, dropped connection, 5xx) are
+reported as unknown, since Trac may have applied them.
 """
 
 import logging
+import xmlrpc.client
+from collections.abc import Callable
 from typing import Any
 
 import mcp.types as types
+import requests
+import urllib3
 
-from ...converters import markdown_to_tracwiki
+from ...converters import markdown_to_tracwiki_batch
 from ...core.async_utils import gather_limited, run_sync_limited
 from ...core.client import TracClient
 from .constants import DEFAULT_TICKET_TYPE
-from .errors import build_error_response
+from .errors import build_error_response, is_method_not_found
 from .registry import ToolSpec
 
 logger = logging.getLogger(__name__)
 
+# Items per system.multicall request, keeping each POST well inside
+# the client's read timeout
+_MULTICALL_CHUNK = 50
+
+
+# Optional ticket fields accepted by batch create and update items
+_TICKET_ATTR_FIELDS = (
+    "priority",
+    "component",
+    "milestone",
+    "owner",
+    "keywords",
+    "cc",
+)
+_TICKET_ATTRS_SCHEMA: dict[str, Any] = {
+    field: {"type": "string"} for field in _TICKET_ATTR_FIELDS
+}
 
 # Tool definitions for list_tools()
 TICKET_BATCH_TOOLS = [
     types.Tool(
         name="ticket_batch_create",
-        description="Create multiple tickets in a single batch operation. Best-effort: all items attempted, per-item results reported. Bounded by TRAC_MAX_PARALLEL_REQUESTS semaphore.",
+        description="Create multiple tickets in a single batch operation. Best-effort: all items attempted, per-item results reported. Sent as system.multicall requests of up to 50 tickets, or one request per ticket if the server lacks system.multicall.",
         inputSchema={
             "type": "object",
             "properties": {
@@ -38,12 +63,7 @@ TICKET_BATCH_TOOLS = [
                             "summary": {"type": "string"},
                             "description": {"type": "string"},
                             "ticket_type": {"type": "string"},
-                            "priority": {"type": "string"},
-                            "component": {"type": "string"},
-                            "milestone": {"type": "string"},
-                            "owner": {"type": "string"},
-                            "keywords": {"type": "string"},
-                            "cc": {"type": "string"},
+                            **_TICKET_ATTRS_SCHEMA,
                         },
                         "required": ["summary", "description"],
                     },
@@ -55,7 +75,7 @@ TICKET_BATCH_TOOLS = [
     ),
     types.Tool(
         name="ticket_batch_delete",
-        description="Delete multiple tickets in a single batch operation. Best-effort: all items attempted, per-item results reported. Requires TICKET_ADMIN permission.",
+        description="Delete multiple tickets in a single batch operation. Best-effort: all items attempted, per-item results reported. Sent as system.multicall requests of up to 50 tickets, or one request per ticket if the server lacks system.multicall. Requires TICKET_ADMIN permission.",
         inputSchema={
             "type": "object",
             "properties": {
@@ -70,7 +90,7 @@ TICKET_BATCH_TOOLS = [
     ),
     types.Tool(
         name="ticket_batch_update",
-        description="Update multiple tickets in a single batch operation. Best-effort: all items attempted, per-item results reported.",
+        description="Update multiple tickets in a single batch operation. Best-effort: all items attempted, per-item results reported. Sent as system.multicall requests of up to 50 tickets, or one request per ticket if the server lacks system.multicall.",
         inputSchema={
             "type": "object",
             "properties": {
@@ -86,12 +106,7 @@ TICKET_BATCH_TOOLS = [
                             "comment": {"type": "string"},
                             "status": {"type": "string"},
                             "resolution": {"type": "string"},
-                            "priority": {"type": "string"},
-                            "component": {"type": "string"},
-                            "milestone": {"type": "string"},
-                            "owner": {"type": "string"},
-                            "keywords": {"type": "string"},
-                            "cc": {"type": "string"},
+                            **_TICKET_ATTRS_SCHEMA,
                         },
                         "required": ["ticket_id"],
                     },
@@ -102,6 +117,129 @@ TICKET_BATCH_TOOLS = [
         },
     ),
 ]
+_TOOLS_BY_NAME = {tool.name: tool for tool in TICKET_BATCH_TOOLS}
+
+
+class _OutcomeUnknown(Exception):
+    """A request failed in transit; Trac may still have applied it."""
+
+    def __init__(self, cause: Exception):
+        super().__init__(
+            f"outcome unknown ({cause}); check the ticket before retrying"
+        )
+
+
+def _may_have_applied(error: Exception) -> bool:
+    """Check whether Trac may have run a request that raised error."""
+    match error:
+        case xmlrpc.client.Fault() | ValueError() | TypeError():
+            # Answered with a fault, or rejected before sending
+            return False
+        case requests.HTTPError(response=response) if (
+            response is not None
+        ):
+            # 4xx responses are refused before the call runs
+            return response.status_code >= 500
+        case requests.ConnectTimeout() | requests.exceptions.SSLError():
+            return False
+        case requests.ConnectionError(args=(cause, *_)):
+            # No connection was made, so nothing was sent
+            return not isinstance(
+                getattr(cause, "reason", None),
+                urllib3.exceptions.NewConnectionError,
+            )
+        case _:
+            return True
+
+
+def _classify(error: Exception) -> Exception:
+    """Wrap error in _OutcomeUnknown if Trac may have applied it."""
+    return _OutcomeUnknown(error) if _may_have_applied(error) else error
+
+
+def _convert_each(texts: list[str]) -> list[Any]:
+    """Convert Markdown texts to TracWiki, capturing failures per text.
+
+    Returns one TracWiki string or Exception per text, in order.
+    """
+    try:
+        return markdown_to_tracwiki_batch(texts)
+    except Exception:
+        # Retry one at a time so only the failing texts are reported
+        converted: list[Any] = []
+        for text in texts:
+            try:
+                converted.extend(markdown_to_tracwiki_batch([text]))
+            except Exception as e:
+                converted.append(e)
+        return converted
+
+
+async def _run_batch(
+    batch_fn: Callable[[list[Any]], list[Any]],
+    item_fn: Callable[..., Any],
+    items: list[Any],
+) -> list[Any]:
+    """Run items through multicalls, or one RPC each if unsupported.
+
+    Items are sent in chunks of _MULTICALL_CHUNK. Tuple items are
+    unpacked into item_fn's arguments. Returns one result or Exception
+    per item, in order; _OutcomeUnknown marks items whose request
+    may have reached Trac before failing.
+    """
+
+    async def _one(item: Any) -> Any:
+        args = item if isinstance(item, tuple) else (item,)
+        try:
+            return await run_sync_limited(item_fn, *args)
+        except Exception as e:
+            return _classify(e)
+
+    async def _chunk(chunk: list[Any]) -> list[Any]:
+        try:
+            return await run_sync_limited(batch_fn, chunk)
+        except xmlrpc.client.Fault as e:
+            if not is_method_not_found(e):
+                # Rejected as a whole, so nothing in it was applied
+                return [e] * len(chunk)
+            logger.debug(
+                "system.multicall unavailable, calling per item"
+            )
+        except Exception as e:
+            return [_classify(e)] * len(chunk)
+        return await gather_limited([_one(item) for item in chunk])
+
+    chunks = await gather_limited(
+        [
+            _chunk(items[start : start + _MULTICALL_CHUNK])
+            for start in range(0, len(items), _MULTICALL_CHUNK)
+        ]
+    )
+    return [outcome for chunk in chunks for outcome in chunk]
+
+
+def _record_outcome(result: dict[str, Any], outcome: Any) -> None:
+    """Store a failed or unknown outcome on an item's result dict."""
+    if isinstance(outcome, _OutcomeUnknown):
+        result["unknown"] = str(outcome)
+    elif isinstance(outcome, Exception):
+        result["error"] = str(outcome)
+
+
+def _unknown_note(unknown: list[dict[str, Any]]) -> str:
+    """Summary-line suffix counting unknown outcomes, if any."""
+    return f", {len(unknown)} unknown" if unknown else ""
+
+
+def _append_unknown_ids(
+    lines: list[str], unknown: list[dict[str, Any]]
+) -> None:
+    """Append the "Outcome unknown" section for ID-keyed results."""
+    if unknown:
+        lines.append("")
+        lines.append("Outcome unknown:")
+        for item in unknown:
+            lines.append(f"  - #{item['id']}: {item['unknown']}")
 
 
 async def _handle_batch_create(
@@ -124,69 +262,84 @@ async def _handle_batch_create(
             "Reduce the number of tickets per request.",
         )
 
-    async def _create_one(
-        index: int, ticket_data: dict
-    ) -> dict[str, Any]:
+    # One result dict per ticket, in input order; valid tickets are
+    # filled in after the multicall.
+    results: list[dict[str, Any]] = []
+    pending: list[int] = []
+    items: list[tuple[str, str, str, dict[str, Any]]] = []
+    for index, ticket_data in enumerate(tickets):
         summary = ticket_data.get("summary")
         description = ticket_data.get("description")
 
         if not summary:
-            return {
-                "index": index,
-                "summary": "",
-                "error": "summary is required",
-            }
+            results.append(
+                {
+                    "index": index,
+                    "summary": "",
+                    "error": "summary is required",
+                }
+            )
+            continue
         if not description:
-            return {
-                "index": index,
-                "summary": summary,
-                "error": "description is required",
-            }
-
-        try:
-            description_tracwiki = markdown_to_tracwiki(description)
-            ticket_type = ticket_data.get(
-                "ticket_type", DEFAULT_TICKET_TYPE
+            results.append(
+                {
+                    "index": index,
+                    "summary": summary,
+                    "error": "description is required",
+                }
             )
-            attributes: dict[str, Any] = {}
-
-            for field in (
-                "priority",
-                "component",
-                "milestone",
-                "owner",
-                "cc",
-                "keywords",
-            ):
-                if field in ticket_data:
-                    attributes[field] = ticket_data[field]
-
-            ticket_id = await run_sync_limited(
-                client.create_ticket,
-                summary,
-                description_tracwiki,
-                ticket_type,
-                attributes,
+            continue
+
+        ticket_type = ticket_data.get(
+            "ticket_type", DEFAULT_TICKET_TYPE
+        )
+        attributes: dict[str, Any] = {}
+
+        for field in _TICKET_ATTR_FIELDS:
+            if field in ticket_data:
+                attributes[field] = ticket_data[field]
+
+        results.append({"index": index, "summary": summary})
+        pending.append(index)
+        items.append((summary, description, ticket_type, attributes))
+
+    if items:
+        # Convert all descriptions with one parser; a description that
+        # fails to convert only fails its own ticket
+        descriptions = _convert_each([item[1] for item in items])
+        converted: list[int] = []
+        converted_items: list[tuple[str, str, str, dict[str, Any]]] = []
+        for index, item, description in zip(
+            pending, items, descriptions, strict=True
+        ):
+            if isinstance(description, Exception):
+                results[index]["error"] = (
+                    f"description conversion failed: {description}"
+                )
+                continue
+            converted.append(index)
+            converted_items.append(
+                (item[0], description, item[2], item[3])
             )
-            return {"id": ticket_id, "summary": summary}
-        except Exception as e:
-            return {
-                "index": index,
-                "summary": ticket_data.get("summary", ""),
-                "error": str(e),
-            }
-
-    results = await gather_limited(
-        [_create_one(i, t) for i, t in enumerate(tickets)]
-    )
+        outcomes = await _run_batch(
+            client.create_tickets, client.create_ticket, converted_items
+        )
+        for index, outcome in zip(converted, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                _record_outcome(results[index], outcome)
+            else:
+                summary = results[index]["summary"]
+                results[index] = {"id": outcome, "summary": summary}
 
     created = [r for r in results if "id" in r]
     failed = [r for r in results if "error" in r]
+    unknown = [r for r in results if "unknown" in r]
     total = len(tickets)
 
     # Build text response
     lines = [
-        f"Batch create: {len(created)}/{total} succeeded, {len(failed)} failed."
+        f"Batch create: {len(created)}/{total} succeeded, "
+        f"{len(failed)} failed{_unknown_note(unknown)}."
     ]
     if created:
         lines.append("")
@@ -200,15 +353,24 @@ async def _handle_batch_create(
             lines.append(
                 f"  - [index {item.get('index', '?')}] {item.get('summary', '')}: {item['error']}"
             )
+    if unknown:
+        lines.append("")
+        lines.append("Outcome unknown:")
+        for item in unknown:
+            lines.append(
+                f"  - [index {item['index']}] {item['summary']}: {item['unknown']}"
+            )
 
     return types.CallToolResult(
         content=[types.TextContent(type="text", text="\n".join(lines))],
         structuredContent={
             "created": created,
             "failed": failed,
+            "unknown": unknown,
             "total": total,
             "succeeded": len(created),
             "failed_count": len(failed),
+            "unknown_count": len(unknown),
         },
     )
 
@@ -233,24 +395,24 @@ async def _handle_batch_delete(
             "Reduce the number of ticket IDs per request.",
         )
 
-    async def _delete_one(ticket_id: int) -> dict[str, Any]:
-        try:
-            await run_sync_limited(client.delete_ticket, ticket_id)
-            return {"id": ticket_id}
-        except Exception as e:
-            return {"id": ticket_id, "error": str(e)}
-
-    results = await gather_limited(
-        [_delete_one(tid) for tid in ticket_ids]
+    outcomes = await _run_batch(
+        client.delete_tickets, client.delete_ticket, ticket_ids
     )
 
-    deleted = [r for r in results if "error" not in r]
+    results: list[dict[str, Any]] = []
+    for tid, outcome in zip(ticket_ids, outcomes, strict=True):
+        results.append({"id": tid})
+        _record_outcome(results[-1], outcome)
+
+    deleted = [r for r in results if len(r) == 1]
     failed = [r for r in results if "error" in r]
+    unknown = [r for r in results if "unknown" in r]
     total = len(ticket_ids)
 
     # Build text response
     lines = [
-        f"Batch delete: {len(deleted)}/{total} succeeded, {len(failed)} failed."
+        f"Batch delete: {len(deleted)}/{total} succeeded, "
+        f"{len(failed)} failed{_unknown_note(unknown)}."
     ]
     if deleted:
         lines.append("")
@@ -262,15 +424,18 @@ async def _handle_batch_delete(
         lines.append("Failed:")
         for item in failed:
             lines.append(f"  - #{item['id']}: {item['error']}")
+    _append_unknown_ids(lines, unknown)
 
     return types.CallToolResult(
         content=[types.TextContent(type="text", text="\n".join(lines))],
         structuredContent={
             "deleted": [r["id"] for r in deleted],
             "failed": failed,
+            "unknown": unknown,
             "total": total,
             "succeeded": len(deleted),
             "failed_count": len(failed),
+            "unknown_count": len(unknown),
         },
     )
 
@@ -295,52 +460,69 @@ async def _handle_batch_update(
             "Reduce the number of updates per request.",
         )
 
-    async def _update_one(update_data: dict) -> dict[str, Any]:
+    # One result dict per update, in input order; valid updates are
+    # filled in after the multicall.
+    results: list[dict[str, Any]] = []
+    pending: list[int] = []
+    items: list[tuple[int, str, dict[str, Any]]] = []
+    for position, update_data in enumerate(updates):
         ticket_id = update_data.get("ticket_id")
         if not ticket_id:
-            return {
-                "id": update_data.get("ticket_id", 0),
-                "error": "ticket_id is required",
-            }
-
-        try:
-            comment = update_data.get("comment", "")
-            if comment:
-                comment = markdown_to_tracwiki(comment)
-
-            attributes: dict[str, Any] = {}
-            for field in (
-                "status",
-                "resolution",
-                "priority",
-                "component",
-                "milestone",
-                "owner",
-                "cc",
-                "keywords",
-            ):
-                if field in update_data:
-                    attributes[field] = update_data[field]
-
-            await run_sync_limited(
-                client.update_ticket, ticket_id, comment, attributes
+            results.append(
+                {
+                    "id": update_data.get("ticket_id", 0),
+                    "error": "ticket_id is required",
+                }
             )
-            return {"id": ticket_id}
-        except Exception as e:
-            return {
-                "id": update_data.get("ticket_id", 0),
-                "error": str(e),
-            }
-
-    results = await gather_limited([_update_one(u) for u in updates])
+            continue
+
+        comment = update_data.get("comment", "")
+        attributes: dict[str, Any] = {}
+        for field in ("status", "resolution", *_TICKET_ATTR_FIELDS):
+            if field in update_data:
+                attributes[field] = update_data[field]
+
+        results.append({"id": ticket_id})
+        pending.append(position)
+        items.append((ticket_id, comment, attributes))
+
+    if items:
+        # Convert all non-empty comments with one parser; a comment
+        # that fails to convert only fails its own update
+        comments = iter(
+            _convert_each(
+                [comment for _, comment, _ in items if comment]
+            )
+        )
+        converted: list[int] = []
+        converted_items: list[tuple[int, str, dict[str, Any]]] = []
+        for position, (ticket_id, comment, attrs) in zip(
+            pending, items, strict=True
+        ):
+            if comment:
+                comment = next(comments)
+                if isinstance(comment, Exception):
+                    results[position]["error"] = (
+                        f"comment conversion failed: {comment}"
+                    )
+                    continue
+            converted.append(position)
+            converted_items.append((ticket_id, comment, attrs))
+        outcomes = await _run_batch(
+            client.update_tickets, client.update_ticket, converted_items
+        )
+        for position, outcome in zip(converted, outcomes, strict=True):
+            _record_outcome(results[position], outcome)
 
-    updated = [r for r in results if "error" not in r]
+    updated = [r for r in results if len(r) == 1]
     failed = [r for r in results if "error" in r]
+    unknown = [r for r in results if "unknown" in r]
     total = len(updates)
 
     # Build text response
     lines = [
-        f"Batch update: {len(updated)}/{total} succeeded, {len(failed)} failed."
+        f"Batch update: {len(updated)}/{total} succeeded, "
+        f"{len(failed)} failed{_unknown_note(unknown)}."
     ]
     if updated:
         lines.append("")
@@ -352,15 +534,18 @@ async def _handle_batch_update(
         lines.append("Failed:")
         for item in failed:
             lines.append(f"  - #{item['id']}: {item['error']}")
+    _append_unknown_ids(lines, unknown)
 
     return types.CallToolResult(
         content=[types.TextContent(type="text", text="\n".join(lines))],
         structuredContent={
             "updated": [r["id"] for r in updated],
             "failed": failed,
+            "unknown": unknown,
             "total": total,
             "succeeded": len(updated),
             "failed_count": len(failed),
+            "unknown_count": len(unknown),
         },
     )
 
@@ -368,17 +553,17 @@ async def _handle_batch_update(
 # ToolSpec list for registry-based dispatch
 TICKET_BATCH_SPECS: list[ToolSpec] = [
     ToolSpec(
-        tool=TICKET_BATCH_TOOLS[0],
+        tool=_TOOLS_BY_NAME["ticket_batch_create"],
         permissions=frozenset({"TICKET_CREATE", "TICKET_BATCH_MODIFY"}),
         handler=_handle_batch_create,
     ),
     ToolSpec(
-        tool=TICKET_BATCH_TOOLS[1],
+        tool=_TOOLS_BY_NAME["ticket_batch_delete"],
         permissions=frozenset({"TICKET_ADMIN", "TICKET_BATCH_MODIFY"}),
         handler=_handle_batch_delete,
     ),
     ToolSpec(
-        tool=TICKET_BATCH_TOOLS[2],
+        tool=_TOOLS_BY_NAME["ticket_batch_update"],
         permissions=frozenset({"TICKET_MODIFY", "TICKET_BATCH_MODIFY"}),
         handler=_handle_batch_update,
     ),
@@ -17,7 +17,11 @@ from ...core.async_utils import (
     run_sync_limited,
 )
 from ...core.client import TracClient
-from .errors import build_error_response, format_timestamp
+from .errors import (
+    build_error_response,
+    format_timestamp,
+    is_method_not_found,
+)
 from .registry import ToolSpec
 
 # Tool definitions for list_tools()
@@ -465,10 +469,7 @@ async def _handle_actions(
         actions = await run_sync(client.get_ticket_actions, ticket_id)
     except xmlrpc.client.Fault as e:
         # If getActions is not available, provide helpful error
-        if (
-            "not found" in str(e).lower()
-            or "no such method" in str(e).lower()
-        ):
+        if is_method_not_found(e):
             return build_error_response(
                 "method_not_available",
                 "ticket.getActions() not available on this Trac instance",
@@ -127,7 +127,10 @@ WIKI_FILE_TOOLS = [
 ]
 
 
-_FRONTMATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+# Leading frontmatter block plus any blank lines after it (LF or CRLF)
+_FRONTMATTER_RE = re.compile(
+    r"\A---\r?\n.*?\r?\n---\r?\n(?:\r?\n)*", re.DOTALL
+)
 
 
 def _strip_yaml_frontmatter(content: str) -> str:
@@ -135,13 +138,11 @@ def _strip_yaml_frontmatter(content: str) -> str:
 
     Matches a block starting with ``---\\n`` at the beginning of the string,
     ending with the next ``---\\n``.  Returns content with the block removed
-    and leading whitespace stripped.  If no frontmatter is found, returns
+    and leading blank lines stripped.  If no frontmatter is found, returns
     content unchanged.
     """
     m = _FRONTMATTER_RE.match(content)
-    if m:
-        return content[m.end() :].lstrip("\n")
-    return content
+    return content[m.end() :] if m else content
 
 
 async def _handle_push(
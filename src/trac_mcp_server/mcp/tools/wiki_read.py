@@ -7,7 +7,7 @@ automatic Markdown conversion, and structured error responses.
 
 import asyncio
 import base64
-import json
+import struct
 import time
 import xmlrpc.client
 from datetime import datetime, timedelta
@@ -106,6 +106,10 @@ WIKI_READ_TOOLS = [
 ]
 
 
+# Cursor payload: big-endian unsigned (offset, total)
+_CURSOR_STRUCT = struct.Struct(">II")
+
+
 def encode_cursor(offset: int, total: int) -> str:
     """Encode pagination cursor.
 
@@ -114,19 +118,18 @@ def encode_cursor(offset: int, total: int) -> str:
         total: Total number of results
 
     Returns:
-        Base64-encoded cursor string
+        URL-safe base64 of the packed offset and total (12 chars)
     """
-    cursor_data = {"offset": offset, "total": total}
-    cursor_json = json.dumps(cursor_data)
-    cursor_bytes = cursor_json.encode("utf-8")
-    return base64.b64encode(cursor_bytes).decode("utf-8")
+    return base64.urlsafe_b64encode(
+        _CURSOR_STRUCT.pack(offset, total)
+    ).decode("ascii")
 
 
 def decode_cursor(cursor: str) -> tuple[int, int]:
     """Decode pagination cursor.
 
     Args:
-        cursor: Base64-encoded cursor string
+        cursor: Cursor string produced by encode_cursor
 
     Returns:
         Tuple of (offset, total)
@@ -135,11 +138,10 @@ def decode_cursor(cursor: str) -> tuple[int, int]:
         ValueError: If cursor is invalid
     """
     try:
-        cursor_bytes = base64.b64decode(cursor.encode("utf-8"))
-        cursor_json = cursor_bytes.decode("utf-8")
-        cursor_data = json.loads(cursor_json)
-        return cursor_data["offset"], cursor_data["total"]
-    except (KeyError, json.JSONDecodeError, ValueError) as e:
+        return _CURSOR_STRUCT.unpack(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+    except (struct.error, UnicodeError, ValueError) as e:
         raise ValueError(f"Invalid cursor: {e}") from e
 
 
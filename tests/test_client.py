@@ -1,6 +1,8 @@
+import xmlrpc.client
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from trac_mcp_server.config import Config
 from trac_mcp_server.core.client import TracClient
@@ -1940,3 +1942,202 @@ def test_list_methods_success(mock_post, mock_config):
     assert "wiki.getPage" in result
     payload = mock_post.call_args[1]["data"]
     assert "system.listMethods" in payload
+
+
+# ---------------------------------------------------------------------------
+# Batch ticket operations (system.multicall)
+# ---------------------------------------------------------------------------
+
+
+def _multicall_response(results):
+    """Build a mock system.multicall response from per-call results."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = xmlrpc.client.dumps(
+        (results,), methodresponse=True
+    ).encode()
+    return mock_response
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_multicall_maps_results_and_faults(mock_post, mock_config):
+    """Test multicall unwraps results and turns fault structs into Faults."""
+    mock_post.return_value = _multicall_response(
+        [
+            [True],
+            {"faultCode": 404, "faultString": "Ticket 2 not found"},
+        ]
+    )
+
+    client = TracClient(mock_config)
+    result = client.multicall(
+        [("ticket.delete", (1,)), ("ticket.delete", (2,))]
+    )
+
+    assert result[0] is True
+    assert isinstance(result[1], xmlrpc.client.Fault)
+    assert result[1].faultCode == 404
+    assert mock_post.call_count == 1
+    params, method = xmlrpc.client.loads(mock_post.call_args[1]["data"])
+    assert method == "system.multicall"
+    assert params[0] == [
+        {"methodName": "ticket.delete", "params": [1]},
+        {"methodName": "ticket.delete", "params": [2]},
+    ]
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_multicall_empty_makes_no_request(mock_post, mock_config):
+    """Test multicall with no calls skips the round trip."""
+    client = TracClient(mock_config)
+    assert client.multicall([]) == []
+    mock_post.assert_not_called()
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_create_tickets_single_round_trip(mock_post, mock_config):
+    """Test create_tickets validates locally and creates in one request."""
+    mock_post.return_value = _multicall_response([[7]])
+
+    client = TracClient(mock_config)
+    result = client.create_tickets(
+        [
+            ("Summary", "Description", None, {"priority": "high"}),
+            ("", "Description", None, None),
+        ]
+    )
+
+    assert result[0] == 7
+    assert isinstance(result[1], ValueError)
+    assert mock_post.call_count == 1
+    params, _ = xmlrpc.client.loads(mock_post.call_args[1]["data"])
+    assert params[0] == [
+        {
+            "methodName": "ticket.create",
+            "params": [
+                "Summary",
+                "Description",
+                {"priority": "high", "type": "defect"},
+                False,
+            ],
+        }
+    ]
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_create_tickets_rejects_unencodable_fields(
+    mock_post, mock_config
+):
+    """Test a None field fails only its ticket, before anything is sent."""
+    mock_post.return_value = _multicall_response([[7], [8]])
+
+    client = TracClient(mock_config)
+    result = client.create_tickets(
+        [
+            ("A", "Description", None, None),
+            ("B", "Description", None, {"priority": None}),
+            ("C", "Description", None, None),
+        ]
+    )
+
+    assert result[0] == 7
+    assert isinstance(result[1], ValueError)
+    assert "cannot marshal None" in str(result[1])
+    assert result[2] == 8
+    params, _ = xmlrpc.client.loads(mock_post.call_args[1]["data"])
+    assert [call["params"][0] for call in params[0]] == ["A", "C"]
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_update_tickets_fetches_timestamps_then_updates(
+    mock_post, mock_config
+):
+    """Test update_tickets batches ticket.get then ticket.update."""
+    mock_post.side_effect = [
+        _multicall_response(
+            [
+                [[1, 0, 0, {"_ts": "111", "status": "new"}]],
+                {"faultCode": 404, "faultString": "Ticket 2 not found"},
+            ]
+        ),
+        _multicall_response([[[1, 0, 0, {"status": "closed"}]]]),
+    ]
+
+    client = TracClient(mock_config)
+    result = client.update_tickets(
+        [(1, "Done", {"status": "closed"}), (2, "", None)]
+    )
+
+    assert result[0] == [1, 0, 0, {"status": "closed"}]
+    assert isinstance(result[1], xmlrpc.client.Fault)
+    assert mock_post.call_count == 2
+    params, _ = xmlrpc.client.loads(mock_post.call_args[1]["data"])
+    assert params[0] == [
+        {
+            "methodName": "ticket.update",
+            "params": [
+                1,
+                "Done",
+                {"status": "closed", "_ts": "111", "action": "leave"},
+                False,
+            ],
+        }
+    ]
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_update_tickets_rejects_unencodable_fields(
+    mock_post, mock_config
+):
+    """Test a None field fails only its update."""
+    mock_post.side_effect = [
+        _multicall_response(
+            [
+                [[1, 0, 0, {"_ts": "111"}]],
+                [[2, 0, 0, {"_ts": "222"}]],
+            ]
+        ),
+        _multicall_response([[[2, 0, 0, {}]]]),
+    ]
+
+    client = TracClient(mock_config)
+    result = client.update_tickets(
+        [(1, "", {"owner": None}), (2, "", {"owner": "bob"})]
+    )
+
+    assert isinstance(result[0], ValueError)
+    assert result[1] == [2, 0, 0, {}]
+    params, _ = xmlrpc.client.loads(mock_post.call_args[1]["data"])
+    assert [call["params"][0] for call in params[0]] == [2]
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_update_tickets_get_failure_fails_every_update(
+    mock_post, mock_config
+):
+    """Test a failed ticket.get request fails updates without sending them."""
+    error = requests.exceptions.ReadTimeout("read timed out")
+    mock_post.side_effect = error
+
+    client = TracClient(mock_config)
+    result = client.update_tickets([(1, "", None), (2, "", None)])
+
+    assert result == [error, error]
+    assert mock_post.call_count == 1
+
+
+@patch("trac_mcp_server.core.client.requests.Session.post")
+def test_delete_tickets_reports_per_ticket_faults(
+    mock_post, mock_config
+):
+    """Test delete_tickets returns True or the Fault for each ticket."""
+    mock_post.return_value = _multicall_response(
+        [[0], {"faultCode": 403, "faultString": "Permission denied"}]
+    )
+
+    client = TracClient(mock_config)
+    result = client.delete_tickets([10, 20])
+
+    assert result[0] is True
+    assert isinstance(result[1], xmlrpc.client.Fault)
+    assert mock_post.call_count == 1
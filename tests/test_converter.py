@@ -9,6 +9,7 @@ from trac_mcp_server.converters import (
     ConversionResult,
     convert_with_warnings,
     markdown_to_tracwiki,
+    markdown_to_tracwiki_batch,
     tracwiki_to_markdown,
 )
 from trac_mcp_server.converters.common import (
@@ -348,6 +349,11 @@ class TestTracWikiToMarkdownConverter(unittest.TestCase):
         result = tracwiki_to_markdown("=== Heading 3")
         self.assertEqual(result.text, "### Heading 3")
 
+    def test_heading_keeps_following_blank_line(self):
+        """The paragraph break after a heading is preserved."""
+        result = tracwiki_to_markdown("= Title =\n\nText")
+        self.assertEqual(result.text, "# Title\n\nText")
+
     def test_bold_text(self):
         """Test bold text conversion."""
         result = tracwiki_to_markdown("'''bold text'''")
@@ -363,6 +369,19 @@ class TestTracWikiToMarkdownConverter(unittest.TestCase):
         result = tracwiki_to_markdown("'''''bold italic'''''")
         self.assertEqual(result.text, "***bold italic***")
 
+    def test_repeated_conversion_results_are_independent(self):
+        """Cached conversions do not share mutable warnings."""
+        first = tracwiki_to_markdown("[[PageOutline]]")
+        first.warnings.append("caller note")
+        second = tracwiki_to_markdown("[[PageOutline]]")
+        self.assertEqual(second.text, first.text)
+        self.assertNotIn("caller note", second.warnings)
+
+    def test_unpaired_quotes_unchanged(self):
+        """Unpaired '' and ''' (e.g. empty string literals) are kept."""
+        result = tracwiki_to_markdown("a = ''\nb = '''")
+        self.assertEqual(result.text, "a = ''\nb = '''")
+
     def test_link_with_text(self):
         """Test link with text conversion."""
         result = tracwiki_to_markdown("[https://example.com link text]")
@@ -708,6 +727,18 @@ class TestTableConversion(unittest.TestCase):
         self.assertIn("||=A=||=B=||", result)
         self.assertIn("||1||2||", result)
 
+    def test_md_to_tw_batch_matches_single(self):
+        """Test batch conversion reuses a parser without leaking state."""
+        texts = [
+            "| Left | Right |\n| :--- | ---: |\n| L | R |",
+            "| A | B |\n| --- | --- |\n| 1 | 2 |",
+            "**bold**",
+        ]
+        self.assertEqual(
+            markdown_to_tracwiki_batch(texts),
+            [markdown_to_tracwiki(text) for text in texts],
+        )
+
     def test_md_to_tw_table_alignment(self):
         """Test Markdown alignment converts to TracWiki whitespace."""
         md = """| Left | Center | Right |
@@ -10,10 +10,10 @@ tests/test_mcp/tools/test_wiki.py -- this file only tests the server
 routing layer.
 """
 
-import asyncio
 from unittest.mock import MagicMock, patch
 
 import mcp.types as types
+import pytest
 
 from trac_mcp_server.mcp.server import (
     PING_SPEC,
@@ -41,6 +41,7 @@ def _clear_registry():
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestWikiToolRegistration:
     """Test wiki tools are registered in handle_list_tools."""
 
@@ -50,9 +51,9 @@ class TestWikiToolRegistration:
     def teardown_method(self):
         _clear_registry()
 
-    def test_wiki_tools_registered(self):
+    async def test_wiki_tools_registered(self):
         """All 4 wiki tools appear in handle_list_tools response."""
-        tools = asyncio.run(handle_list_tools())
+        tools = await handle_list_tools()
         tool_names = [t.name for t in tools]
 
         assert "wiki_get" in tool_names
@@ -60,9 +61,9 @@ class TestWikiToolRegistration:
         assert "wiki_create" in tool_names
         assert "wiki_update" in tool_names
 
-    def test_wiki_tool_schemas(self):
+    async def test_wiki_tool_schemas(self):
         """Wiki tools have expected inputSchema structure."""
-        tools = asyncio.run(handle_list_tools())
+        tools = await handle_list_tools()
         wiki_tools = [t for t in tools if t.name.startswith("wiki_")]
 
         for tool in wiki_tools:
@@ -71,18 +72,18 @@ class TestWikiToolRegistration:
             assert "properties" in tool.inputSchema
             assert "required" in tool.inputSchema
 
-    def test_wiki_get_schema_details(self):
+    async def test_wiki_get_schema_details(self):
         """wiki_get has correct schema."""
-        tools = asyncio.run(handle_list_tools())
+        tools = await handle_list_tools()
         get_tool = next(t for t in tools if t.name == "wiki_get")
 
         assert "page_name" in get_tool.inputSchema["properties"]
         assert "version" in get_tool.inputSchema["properties"]
         assert get_tool.inputSchema["required"] == ["page_name"]
 
-    def test_wiki_search_schema_details(self):
+    async def test_wiki_search_schema_details(self):
         """wiki_search has correct schema."""
-        tools = asyncio.run(handle_list_tools())
+        tools = await handle_list_tools()
         search_tool = next(t for t in tools if t.name == "wiki_search")
 
         assert "query" in search_tool.inputSchema["properties"]
@@ -91,9 +92,9 @@ class TestWikiToolRegistration:
         assert "cursor" in search_tool.inputSchema["properties"]
         assert search_tool.inputSchema["required"] == ["query"]
 
-    def test_wiki_create_schema_details(self):
+    async def test_wiki_create_schema_details(self):
         """wiki_create has correct schema."""
-        tools = asyncio.run(handle_list_tools())
+        tools = await handle_list_tools()
         create_tool = next(t for t in tools if t.name == "wiki_create")
 
         assert "page_name" in create_tool.inputSchema["properties"]
@@ -104,9 +105,9 @@ class TestWikiToolRegistration:
             "page_name",
         ]
 
-    def test_wiki_update_schema_details(self):
+    async def test_wiki_update_schema_details(self):
         """wiki_update has correct schema."""
-        tools = asyncio.run(handle_list_tools())
+        tools = await handle_list_tools()
         update_tool = next(t for t in tools if t.name == "wiki_update")
 
         assert "page_name" in update_tool.inputSchema["properties"]
@@ -125,6 +126,7 @@ class TestWikiToolRegistration:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestWikiToolRouting:
     """Test wiki tool calls route to the correct handler via ToolRegistry."""
 
@@ -136,7 +138,7 @@ class TestWikiToolRouting:
 
     @patch("trac_mcp_server.mcp.server.get_registry")
     @patch("trac_mcp_server.mcp.server.get_client")
-    def test_wiki_read_tools_route_to_registry(
+    async def test_wiki_read_tools_route_to_registry(
         self, mock_get_client, mock_get_registry
     ):
         """wiki_get routes through ToolRegistry.call_tool."""
@@ -154,8 +156,8 @@ class TestWikiToolRouting:
 
         mock_registry.call_tool = MagicMock(side_effect=fake_call_tool)
 
-        result = asyncio.run(
-            handle_call_tool("wiki_get", {"page_name": "Test"})
+        result = await handle_call_tool(
+            "wiki_get", {"page_name": "Test"}
         )
 
         mock_registry.call_tool.assert_called_once_with(
@@ -165,7 +167,7 @@ class TestWikiToolRouting:
 
     @patch("trac_mcp_server.mcp.server.get_registry")
     @patch("trac_mcp_server.mcp.server.get_client")
-    def test_wiki_write_tools_route_to_registry(
+    async def test_wiki_write_tools_route_to_registry(
         self, mock_get_client, mock_get_registry
     ):
         """wiki_create routes through ToolRegistry.call_tool."""
@@ -183,11 +185,9 @@ class TestWikiToolRouting:
 
         mock_registry.call_tool = MagicMock(side_effect=fake_call_tool)
 
-        result = asyncio.run(
-            handle_call_tool(
-                "wiki_create",
-                {"page_name": "New", "content": "# New"},
-            )
+        result = await handle_call_tool(
+            "wiki_create",
+            {"page_name": "New", "content": "# New"},
         )
 
         mock_registry.call_tool.assert_called_once_with(
@@ -198,11 +198,13 @@ class TestWikiToolRouting:
         assert not result.isError
 
     @patch("trac_mcp_server.mcp.server.get_client")
-    def test_unknown_wiki_tool_returns_error(self, mock_get_client):
+    async def test_unknown_wiki_tool_returns_error(
+        self, mock_get_client
+    ):
         """Unknown wiki_* tool returns error response."""
         mock_get_client.return_value = MagicMock()
 
-        result = asyncio.run(handle_call_tool("wiki_unknown", {}))
+        result = await handle_call_tool("wiki_unknown", {})
 
         assert isinstance(result, types.CallToolResult)
         assert result.isError
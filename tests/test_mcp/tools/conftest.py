@@ -0,0 +1,115 @@
+"""Shared fixtures for MCP tool handler tests."""
+
+from types import SimpleNamespace
+from unittest.mock import create_autospec
+
+import pytest
+
+from trac_mcp_server.config import Config
+from trac_mcp_server.core.client import TracClient
+from trac_mcp_server.mcp.tools.registry import ToolRegistry
+from trac_mcp_server.mcp.tools.system import SYSTEM_SPECS
+from trac_mcp_server.mcp.tools.wiki_file import WIKI_FILE_SPECS
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Config shared by tool tests that never mutate it."""
+    return Config(
+        trac_url="https://trac.example.com",
+        username="testuser",
+        password="testpass",
+        insecure=False,
+    )
+
+
+def stub_client() -> SimpleNamespace:
+    """Client stand-in for tests that only check method identity.
+
+    A plain function rather than a fixture so unittest-style test
+    classes can import it.
+    """
+    return SimpleNamespace(
+        create_ticket=object(),
+        update_ticket=object(),
+        delete_ticket=object(),
+        get_ticket=object(),
+    )
+
+
+@pytest.fixture(scope="module")
+def system_registry():
+    """ToolRegistry over SYSTEM_SPECS, built once per module."""
+    return ToolRegistry(SYSTEM_SPECS)
+
+
+# Read-only wiki_file inputs, keyed by file name (extension matters)
+_WIKI_CORPUS = {
+    "bold.md": "# Hello\n\nSome **bold** text.",
+    "bold.wiki": "= Title =\n\n'''bold''' text.",
+    "bold_italic.md": "Some **bold** and *italic* text.",
+    "code_block.md": "# Code Example\n\n```python\nprint('hello')\n```\n",
+    "content.tracwiki": "= Title =\n\nContent here.",
+    "content.wiki": "= Title =\n\nContent.",
+    "formatted.wiki": "= Title =\n\n'''bold''' and ''italic'' text.\n\n{{{code}}}",
+    "frontmatter.md": "---\ntitle: Hello\n---\n# Hello\nWorld",
+    "frontmatter_heading.md": "---\ntitle: Hello\n---\n# Hello",
+    "frontmatter_tags.md": "---\ntitle: My Page\ntags: [a, b]\n---\n# Hello\n\nWorld",
+    "heading.md": "# Hello",
+    "headings.md": "# Main Title\n\n## Section One\n\nParagraph text.",
+    "hello.md": "# Hello\nWorld",
+    "lists.md": "# List Test\n\n- Item one\n- Item two\n- Item three\n",
+    "markdown.txt": "# Heading\n\nSome **bold** text and `code`.",
+    "new_page.md": "# New Page\nContent here",
+    "plain.md": "hello",
+    "sections.md": "# Main Title\n\n## Section A\n\nContent A.\n\n## Section B\n\nContent B.",
+    "title.md": "# Title\n\nContent.",
+    "title.wiki": "= Title =\n\n'''bold'''",
+    "tracwiki.txt": "= Heading =\n\n'''bold''' and {{{code}}}",
+    "updated.md": "# Updated\nContent",
+}
+
+
+@pytest.fixture(scope="module")
+def wiki_file_registry():
+    """ToolRegistry over WIKI_FILE_SPECS, built once per module."""
+    return ToolRegistry(WIKI_FILE_SPECS)
+
+
+@pytest.fixture(scope="session")
+def _shared_trac_client(config):
+    """Autospecced TracClient built once per session; see trac_client.
+
+    create_autospec is slow, so one instance is shared.
+    """
+    client = create_autospec(TracClient, instance=True)
+    # config is set in __init__, so the spec does not provide it
+    client.config = config
+    return client
+
+
+@pytest.fixture
+def trac_client(_shared_trac_client):
+    """Shared TracClient mock, reset after each test.
+
+    Tests configure return values and side effects freely; they are
+    cleared on teardown so nothing leaks into the next test.
+    """
+    yield _shared_trac_client
+    _shared_trac_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def wiki_corpus(tmp_path_factory):
+    """Paths to _WIKI_CORPUS files, written once per session.
+
+    Handlers only read these, so tests share them instead of writing
+    their own copy under tmp_path.
+    """
+    base = tmp_path_factory.mktemp("wiki_corpus")
+    files = {}
+    for name, content in _WIKI_CORPUS.items():
+        path = base / name
+        path.write_text(content)
+        files[name] = path
+    return files
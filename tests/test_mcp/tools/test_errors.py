@@ -4,6 +4,7 @@ Covers:
 - build_error_response() structure and format
 - translate_xmlrpc_error() domain-specific error mapping
 - format_timestamp() for various input types
+- is_method_not_found() fault classification
 """
 
 import xmlrpc.client
@@ -14,6 +15,7 @@ import mcp.types as types
 from trac_mcp_server.mcp.tools.errors import (
     build_error_response,
     format_timestamp,
+    is_method_not_found,
     translate_xmlrpc_error,
 )
 
@@ -240,3 +242,34 @@ class TestFormatTimestamp:
         """None -> str(None)."""
         result = format_timestamp(None)
         assert result == "None"
+
+
+# ---------------------------------------------------------------------------
+# is_method_not_found tests
+# ---------------------------------------------------------------------------
+
+
+class TestIsMethodNotFound:
+    """Tests for is_method_not_found()."""
+
+    def test_fault_code(self):
+        """Fault code -32601 means the method is missing."""
+        fault = xmlrpc.client.Fault(-32601, "whatever")
+        assert is_method_not_found(fault)
+
+    def test_trac_message(self):
+        """Trac's 'RPC method ... not found' message is recognised."""
+        fault = xmlrpc.client.Fault(
+            1, 'RPC method "ticket.getActions" not found'
+        )
+        assert is_method_not_found(fault)
+
+    def test_no_such_method_message(self):
+        """A 'No such method' message is recognised."""
+        fault = xmlrpc.client.Fault(1, "No such method 'x.y'")
+        assert is_method_not_found(fault)
+
+    def test_other_not_found(self):
+        """A missing ticket is not a missing method."""
+        fault = xmlrpc.client.Fault(404, "Ticket 99 not found")
+        assert not is_method_not_found(fault)
@@ -20,6 +20,14 @@ from trac_mcp_server.mcp.tools.registry import (
     load_permissions_file,
 )
 
+_P_VIEW = frozenset({"TICKET_VIEW"})
+_P_CREATE = frozenset({"TICKET_CREATE"})
+_P_BATCH = frozenset({"TICKET_CREATE", "TICKET_BATCH_MODIFY"})
+_P_WV = frozenset({"WIKI_VIEW"})
+_P_WC = frozenset({"WIKI_CREATE"})
+_P_MV = frozenset({"MILESTONE_VIEW"})
+_P_EMPTY = frozenset()
+
 
 def _make_spec(
     name: str,
@@ -28,7 +36,7 @@ def _make_spec(
 ) -> ToolSpec:
     """Helper to create a ToolSpec for testing."""
     if permissions is None:
-        permissions = frozenset()
+        permissions = _P_EMPTY
     if handler is None:
 
         async def handler(client, args):
@@ -58,9 +66,9 @@ class TestToolSpec(unittest.TestCase):
 
     def test_creation(self):
         """ToolSpec can be created with required fields."""
-        spec = _make_spec("test_tool", frozenset({"TICKET_VIEW"}))
+        spec = _make_spec("test_tool", _P_VIEW)
         self.assertEqual(spec.tool.name, "test_tool")
-        self.assertEqual(spec.permissions, frozenset({"TICKET_VIEW"}))
+        self.assertEqual(spec.permissions, _P_VIEW)
         self.assertIsNotNone(spec.handler)
 
     def test_frozen(self):
@@ -71,8 +79,8 @@ class TestToolSpec(unittest.TestCase):
 
     def test_empty_permissions(self):
         """ToolSpec with empty frozenset means no permission required."""
-        spec = _make_spec("always_available", frozenset())
-        self.assertEqual(spec.permissions, frozenset())
+        spec = _make_spec("always_available", _P_EMPTY)
+        self.assertEqual(spec.permissions, _P_EMPTY)
         self.assertEqual(len(spec.permissions), 0)
 
 
@@ -81,18 +89,15 @@ class TestToolRegistry(unittest.TestCase):
 
     def setUp(self):
         self.specs = [
-            _make_spec("ping", frozenset()),
-            _make_spec("get_server_time", frozenset()),
-            _make_spec("ticket_search", frozenset({"TICKET_VIEW"})),
-            _make_spec("ticket_create", frozenset({"TICKET_CREATE"})),
-            _make_spec(
-                "ticket_batch_create",
-                frozenset({"TICKET_CREATE", "TICKET_BATCH_MODIFY"}),
-            ),
-            _make_spec("wiki_get", frozenset({"WIKI_VIEW"})),
-            _make_spec("wiki_create", frozenset({"WIKI_CREATE"})),
-            _make_spec("milestone_list", frozenset({"MILESTONE_VIEW"})),
-            _make_spec("detect_format", frozenset()),
+            _make_spec("ping", _P_EMPTY),
+            _make_spec("get_server_time", _P_EMPTY),
+            _make_spec("ticket_search", _P_VIEW),
+            _make_spec("ticket_create", _P_CREATE),
+            _make_spec("ticket_batch_create", _P_BATCH),
+            _make_spec("wiki_get", _P_WV),
+            _make_spec("wiki_create", _P_WC),
+            _make_spec("milestone_list", _P_MV),
+            _make_spec("detect_format", _P_EMPTY),
         ]
 
     def test_no_filter_all_tools_registered(self):
@@ -102,9 +107,7 @@ class TestToolRegistry(unittest.TestCase):
 
     def test_filter_by_permissions(self):
         """Only tools with matching or empty permissions are included."""
-        registry = ToolRegistry(
-            self.specs, frozenset({"TICKET_VIEW", "WIKI_VIEW"})
-        )
+        registry = ToolRegistry(self.specs, _P_VIEW | _P_WV)
         names = [t.name for t in registry.list_tools()]
         # Permission-free tools always included
         self.assertIn("ping", names)
@@ -122,7 +125,7 @@ class TestToolRegistry(unittest.TestCase):
 
     def test_empty_permissions_always_included(self):
         """Specs with empty permissions pass any filter."""
-        registry = ToolRegistry(self.specs, frozenset({"TICKET_VIEW"}))
+        registry = ToolRegistry(self.specs, _P_VIEW)
         names = [t.name for t in registry.list_tools()]
         self.assertIn("ping", names)
         self.assertIn("get_server_time", names)
@@ -131,18 +134,13 @@ class TestToolRegistry(unittest.TestCase):
     def test_subset_check(self):
         """Multi-permission spec included only when ALL permissions are in allowed set."""
         # Only TICKET_CREATE granted, but TICKET_BATCH_MODIFY also needed
-        registry = ToolRegistry(
-            self.specs, frozenset({"TICKET_CREATE"})
-        )
+        registry = ToolRegistry(self.specs, _P_CREATE)
         names = [t.name for t in registry.list_tools()]
         self.assertNotIn("ticket_batch_create", names)
         self.assertIn("ticket_create", names)
 
         # Both granted
-        registry2 = ToolRegistry(
-            self.specs,
-            frozenset({"TICKET_CREATE", "TICKET_BATCH_MODIFY"}),
-        )
+        registry2 = ToolRegistry(self.specs, _P_BATCH)
         names2 = [t.name for t in registry2.list_tools()]
         self.assertIn("ticket_batch_create", names2)
 
@@ -166,7 +164,7 @@ class TestToolRegistry(unittest.TestCase):
                 ]
             )
 
-        spec = _make_spec("test_dispatch", frozenset(), mock_handler)
+        spec = _make_spec("test_dispatch", _P_EMPTY, mock_handler)
         registry = ToolRegistry([spec])
         mock_client = MagicMock()
 
@@ -191,7 +189,7 @@ class TestToolRegistry(unittest.TestCase):
                 content=[types.TextContent(type="text", text="ok")]
             )
 
-        spec = _make_spec("test_none_args", frozenset(), mock_handler)
+        spec = _make_spec("test_none_args", _P_EMPTY, mock_handler)
         registry = ToolRegistry([spec])
 
         asyncio.run(
@@ -211,7 +209,7 @@ class TestToolRegistry(unittest.TestCase):
 
     def test_call_tool_filtered_out_raises(self):
         """Tool filtered by permissions raises ValueError when called."""
-        registry = ToolRegistry(self.specs, frozenset({"TICKET_VIEW"}))
+        registry = ToolRegistry(self.specs, _P_VIEW)
         # ticket_create requires TICKET_CREATE, not granted
         with self.assertRaises(ValueError) as ctx:
             asyncio.run(
@@ -307,7 +305,7 @@ class TestLoadPermissionsFile(unittest.TestCase):
 
         try:
             result = load_permissions_file(path)
-            self.assertEqual(result, frozenset({"TICKET_VIEW"}))
+            self.assertEqual(result, _P_VIEW)
         finally:
             Path(path).unlink()
 
@@ -1,17 +1,20 @@
 """Tests for ticket tool handlers."""
 
 import asyncio
+import re
 import unittest
 import xmlrpc.client
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import mcp.types as types
+import pytest
 
 from trac_mcp_server.config import Config
 from trac_mcp_server.converters.common import ConversionResult
-from trac_mcp_server.core.client import TracClient
 from trac_mcp_server.mcp.tools import TICKET_TOOLS
+from trac_mcp_server.mcp.tools import ticket_read as _tr
+from trac_mcp_server.mcp.tools import ticket_write as _tw
 from trac_mcp_server.mcp.tools.registry import ToolRegistry
 from trac_mcp_server.mcp.tools.ticket_read import (
     TICKET_READ_SPECS,
@@ -23,9 +26,24 @@ from trac_mcp_server.mcp.tools.ticket_read import (
 )
 from trac_mcp_server.mcp.tools.ticket_write import (
     TICKET_WRITE_SPECS,
-    _handle_create,
     _handle_delete,
-    _handle_update,
+)
+
+from .conftest import stub_client
+
+_TOOLS_BY_NAME = {t.name: t for t in TICKET_TOOLS}
+
+# ticket_delete permission error: error kind plus the deleter guidance
+_PERM_DENIED_DELETE_RE = re.compile(
+    r"Error \(permission_denied\).*TICKET_ADMIN permission"
+    r".*tracopt\.ticket\.deleter",
+    re.S,
+)
+
+# XML-RPC faults raised by the mocked write calls
+_FAULT_NOT_FOUND = xmlrpc.client.Fault(404, "Ticket 99999 not found")
+_FAULT_PERM_DELETE = xmlrpc.client.Fault(
+    403, "Permission denied: TICKET_ADMIN required"
 )
 
 
@@ -34,9 +52,7 @@ class TestTicketDeleteSchema(unittest.TestCase):
 
     def test_ticket_delete_schema(self):
         """Test ticket_delete tool has correct schema."""
-        tool = next(
-            t for t in TICKET_TOOLS if t.name == "ticket_delete"
-        )
+        tool = _TOOLS_BY_NAME["ticket_delete"]
         self.assertEqual(tool.name, "ticket_delete")
         description = tool.description or ""
         self.assertIn("delete", description.lower())
@@ -52,673 +68,93 @@ class TestTicketDeleteSchema(unittest.TestCase):
         )
 
 
-class TestHandleDelete(unittest.TestCase):
+@patch.object(_tw, "run_sync")
+class TestHandleDelete(unittest.IsolatedAsyncioTestCase):
     """Tests for _handle_delete handler."""
 
+    _CONFIG = Config(
+        trac_url="http://test", username="test", password="test"
+    )
+
     def setUp(self):
-        self.mock_client = MagicMock()
+        self.mock_client = stub_client()
 
-    def test_handle_delete_success(self):
+    async def test_handle_delete_success(self, mock_run_sync):
         """Test _handle_delete deletes ticket successfully."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            # First call: get_ticket (existence check), Second call: delete_ticket
-            mock_run_sync.return_value = True
-
-            result = asyncio.run(
-                _handle_delete(self.mock_client, {"ticket_id": 42})
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Deleted ticket #42", result.content[0].text)
-
-            # Verify both get_ticket (existence check) and delete_ticket were called
-            self.assertEqual(mock_run_sync.call_count, 2)
-            # First call: existence check with get_ticket
-            first_call_args = mock_run_sync.call_args_list[0][0]
-            self.assertEqual(
-                first_call_args[0], self.mock_client.get_ticket
-            )
-            self.assertEqual(first_call_args[1], 42)
-            # Second call: delete_ticket
-            second_call_args = mock_run_sync.call_args_list[1][0]
-            self.assertEqual(
-                second_call_args[0], self.mock_client.delete_ticket
-            )
-            self.assertEqual(second_call_args[1], 42)
+        # First call: get_ticket (existence check), Second call: delete_ticket
+        mock_run_sync.return_value = True
 
-    def test_handle_delete_missing_ticket_id(self):
-        """Test _handle_delete returns error when ticket_id is missing."""
-        result = asyncio.run(_handle_delete(self.mock_client, {}))
+        result = await _handle_delete(
+            self.mock_client, {"ticket_id": 42}
+        )
 
         self.assertIsInstance(result, types.CallToolResult)
-        self.assertTrue(result.isError)
         self.assertEqual(len(result.content), 1)
-        self.assertIn(
-            "Error (validation_error)", result.content[0].text
-        )
-        self.assertIn("ticket_id is required", result.content[0].text)
+        self.assertIn("Deleted ticket #42", result.content[0].text)
 
-    def test_handle_delete_ticket_not_found(self):
-        """Test _handle_delete handles ticket not found via registry error translation."""
-        config = Config(
-            trac_url="http://test", username="test", password="test"
+        # Verify both get_ticket (existence check) and delete_ticket were called
+        self.assertEqual(mock_run_sync.call_count, 2)
+        # First call: existence check with get_ticket
+        first_call_args = mock_run_sync.call_args_list[0][0]
+        self.assertEqual(
+            first_call_args[0], self.mock_client.get_ticket
         )
-        mock_client = MagicMock()
-        mock_client.config = config
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                404, "Ticket 99999 not found"
-            )
-
-            registry = ToolRegistry(TICKET_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "ticket_delete", {"ticket_id": 99999}, mock_client
-                )
-            )
-
-            assert isinstance(result, types.CallToolResult)
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Error (not_found)", result.content[0].text)
-
-    def test_handle_delete_permission_denied(self):
-        """Test _handle_delete handles permission denied with specific error message."""
-        config = Config(
-            trac_url="http://test", username="test", password="test"
+        self.assertEqual(first_call_args[1], 42)
+        # Second call: delete_ticket
+        second_call_args = mock_run_sync.call_args_list[1][0]
+        self.assertEqual(
+            second_call_args[0], self.mock_client.delete_ticket
         )
-        mock_client = MagicMock()
-        mock_client.config = config
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            # First call (get_ticket) succeeds, second call (delete_ticket) raises permission error
-            mock_run_sync.side_effect = [
-                True,  # get_ticket succeeds
-                xmlrpc.client.Fault(
-                    403, "Permission denied: TICKET_ADMIN required"
-                ),  # delete_ticket fails
-            ]
-
-            registry = ToolRegistry(TICKET_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "ticket_delete", {"ticket_id": 42}, mock_client
-                )
-            )
-
-            assert isinstance(result, types.CallToolResult)
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn(
-                "Error (permission_denied)", result.content[0].text
-            )
-            self.assertIn(
-                "TICKET_ADMIN permission", result.content[0].text
-            )
-            self.assertIn(
-                "tracopt.ticket.deleter", result.content[0].text
-            )
-
-
-# ---------------------------------------------------------------------------
-# Ticket Create handler tests
-# ---------------------------------------------------------------------------
-
-
-class TestHandleTicketCreate(unittest.TestCase):
-    """Tests for _handle_create handler."""
-
-    def setUp(self):
-        self.mock_client = MagicMock()
-
-    def test_create_success(self):
-        """Create ticket with summary and markdown description."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = 42
-            mock_convert.return_value = (
-                "== Description ==\n\nWith '''markdown'''"
-            )
-
-            result = asyncio.run(
-                _handle_create(
-                    self.mock_client,
-                    {
-                        "summary": "Test ticket",
-                        "description": "## Description\n\nWith **markdown**",
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Created ticket #42", result.content[0].text)
-            self.assertIn("Test ticket", result.content[0].text)
-
-            # Verify markdown_to_tracwiki was called on description
-            mock_convert.assert_called_once_with(
-                "## Description\n\nWith **markdown**"
-            )
+        self.assertEqual(second_call_args[1], 42)
 
-            # Verify run_sync called with correct args
-            mock_run_sync.assert_called_once()
-            call_args = mock_run_sync.call_args[0]
-            self.assertEqual(
-                call_args[0], self.mock_client.create_ticket
-            )
-            self.assertEqual(call_args[1], "Test ticket")  # summary
-            self.assertEqual(
-                call_args[2], "== Description ==\n\nWith '''markdown'''"
-            )  # converted desc
-            self.assertEqual(
-                call_args[3], "defect"
-            )  # default ticket_type
-
-    def test_create_minimal(self):
-        """Create ticket with summary and minimal description uses default type."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = 1
-            mock_convert.return_value = "Simple description"
-
-            result = asyncio.run(
-                _handle_create(
-                    self.mock_client,
-                    {
-                        "summary": "Minimal ticket",
-                        "description": "Simple description",
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Created ticket #1", result.content[0].text)
-
-            # Verify default ticket_type is "defect"
-            call_args = mock_run_sync.call_args[0]
-            self.assertEqual(call_args[3], "defect")
-            # Verify empty attributes dict (no optional fields)
-            self.assertEqual(call_args[4], {})
-
-    def test_create_with_all_fields(self):
-        """Create ticket with all optional fields passed through."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = 99
-            mock_convert.return_value = "Converted description"
-
-            result = asyncio.run(
-                _handle_create(
-                    self.mock_client,
-                    {
-                        "summary": "Full ticket",
-                        "description": "Full description",
-                        "ticket_type": "enhancement",
-                        "priority": "major",
-                        "component": "core",
-                        "milestone": "v1.0",
-                        "owner": "alice",
-                        "cc": "bob@test.com",
-                        "keywords": "test",
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Created ticket #99", result.content[0].text)
-
-            # Verify ticket_type override
-            call_args = mock_run_sync.call_args[0]
-            self.assertEqual(call_args[3], "enhancement")
-
-            # Verify all optional attributes passed
-            attributes = call_args[4]
-            self.assertEqual(attributes["priority"], "major")
-            self.assertEqual(attributes["component"], "core")
-            self.assertEqual(attributes["milestone"], "v1.0")
-            self.assertEqual(attributes["owner"], "alice")
-            self.assertEqual(attributes["cc"], "bob@test.com")
-            self.assertEqual(attributes["keywords"], "test")
-
-    def test_create_missing_summary(self):
-        """Missing summary returns validation_error."""
-        result = asyncio.run(
-            _handle_create(
-                self.mock_client,
-                {
-                    "description": "No summary provided",
-                },
-            )
-        )
+    async def test_handle_delete_missing_ticket_id(self, mock_run_sync):
+        """Test _handle_delete returns error when ticket_id is missing."""
+        result = await _handle_delete(self.mock_client, {})
 
         self.assertIsInstance(result, types.CallToolResult)
         self.assertTrue(result.isError)
         self.assertEqual(len(result.content), 1)
-        self.assertIn(
-            "Error (validation_error)", result.content[0].text
-        )
-        self.assertIn("summary is required", result.content[0].text)
-
-    def test_create_empty_summary(self):
-        """Empty summary returns validation_error."""
-        result = asyncio.run(
-            _handle_create(
-                self.mock_client,
-                {
-                    "summary": "",
-                    "description": "Has description",
-                },
-            )
-        )
+        text = result.content[0].text
+        self.assertIn("Error (validation_error)", text)
+        self.assertIn("ticket_id is required", text)
 
-        self.assertIsInstance(result, types.CallToolResult)
-        self.assertTrue(result.isError)
-        self.assertEqual(len(result.content), 1)
-        self.assertIn(
-            "Error (validation_error)", result.content[0].text
-        )
-        self.assertIn("summary is required", result.content[0].text)
-
-    def test_create_missing_description(self):
-        """Missing description returns validation_error."""
-        result = asyncio.run(
-            _handle_create(
-                self.mock_client,
-                {
-                    "summary": "Has summary",
-                },
-            )
-        )
+    async def test_handle_delete_ticket_not_found(self, mock_run_sync):
+        """Test _handle_delete handles ticket not found via registry error translation."""
+        self.mock_client.config = self._CONFIG
 
-        self.assertIsInstance(result, types.CallToolResult)
-        self.assertTrue(result.isError)
-        self.assertEqual(len(result.content), 1)
-        self.assertIn(
-            "Error (validation_error)", result.content[0].text
-        )
-        self.assertIn("description is required", result.content[0].text)
-
-    def test_create_empty_description(self):
-        """Empty description returns validation_error."""
-        result = asyncio.run(
-            _handle_create(
-                self.mock_client,
-                {
-                    "summary": "Has summary",
-                    "description": "",
-                },
-            )
+        mock_run_sync.side_effect = _FAULT_NOT_FOUND
+
+        registry = ToolRegistry(TICKET_WRITE_SPECS)
+        result = await registry.call_tool(
+            "ticket_delete",
+            {"ticket_id": 99999},
+            self.mock_client,
         )
 
-        self.assertIsInstance(result, types.CallToolResult)
+        assert isinstance(result, types.CallToolResult)
         self.assertTrue(result.isError)
         self.assertEqual(len(result.content), 1)
-        self.assertIn(
-            "Error (validation_error)", result.content[0].text
-        )
-        self.assertIn("description is required", result.content[0].text)
-
-    def test_create_xmlrpc_fault(self):
-        """XML-RPC fault during create produces structured error via dispatcher."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_convert.return_value = "Converted"
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                500, "Internal server error"
-            )
-
-            registry = ToolRegistry(TICKET_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "ticket_create",
-                    {
-                        "summary": "Test",
-                        "description": "Test desc",
-                    },
-                    self.mock_client,
-                )
-            )
+        self.assertIn("Error (not_found)", result.content[0].text)
 
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn(
-                "Error (server_error)", result.content[0].text
-            )
-
-    def test_create_permission_denied(self):
-        """Permission denied fault returns permission_denied error."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_convert.return_value = "Converted"
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                403, "TICKET_CREATE permission denied"
-            )
-
-            registry = ToolRegistry(TICKET_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "ticket_create",
-                    {
-                        "summary": "Test",
-                        "description": "Test desc",
-                    },
-                    self.mock_client,
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn(
-                "Error (permission_denied)", result.content[0].text
-            )
-
-
-# ---------------------------------------------------------------------------
-# Ticket Update handler tests
-# ---------------------------------------------------------------------------
-
-
-class TestHandleTicketUpdate(unittest.TestCase):
-    """Tests for _handle_update handler."""
-
-    def setUp(self):
-        self.mock_client = MagicMock()
-
-    def test_update_with_comment(self):
-        """Update ticket with markdown comment converts and includes it."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = True
-            mock_convert.return_value = (
-                "=== Update ===\n\nWith '''markdown'''"
-            )
-
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "ticket_id": 42,
-                        "comment": "### Update\n\nWith **markdown**",
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Updated ticket #42", result.content[0].text)
-            self.assertIn("added comment", result.content[0].text)
-
-            # Verify markdown_to_tracwiki was called on comment
-            mock_convert.assert_called_once_with(
-                "### Update\n\nWith **markdown**"
-            )
-
-            # Verify run_sync called with converted comment
-            call_args = mock_run_sync.call_args[0]
-            self.assertEqual(
-                call_args[0], self.mock_client.update_ticket
-            )
-            self.assertEqual(call_args[1], 42)
-            self.assertEqual(
-                call_args[2], "=== Update ===\n\nWith '''markdown'''"
-            )
-            self.assertEqual(call_args[3], {})  # no attribute changes
-
-    def test_update_fields(self):
-        """Update ticket fields without comment."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = True
-
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "ticket_id": 42,
-                        "priority": "major",
-                        "keywords": "updated",
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Updated ticket #42", result.content[0].text)
-            self.assertIn("updated 2 field(s)", result.content[0].text)
-
-            # Verify attributes passed to client
-            call_args = mock_run_sync.call_args[0]
-            self.assertEqual(call_args[1], 42)
-            self.assertEqual(call_args[2], "")  # empty comment
-            self.assertEqual(
-                call_args[3],
-                {"priority": "major", "keywords": "updated"},
-            )
-
-    def test_update_comment_and_fields(self):
-        """Update ticket with both comment and field changes."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_write.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = True
-            mock_convert.return_value = "Converted comment"
-
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "ticket_id": 10,
-                        "comment": "Adding a note",
-                        "status": "assigned",
-                        "owner": "alice",
-                        "milestone": "v2.0",
-                    },
-                )
-            )
+    async def test_handle_delete_permission_denied(self, mock_run_sync):
+        """Test _handle_delete handles permission denied with specific error message."""
+        self.mock_client.config = self._CONFIG
 
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Updated ticket #10", result.content[0].text)
-            self.assertIn("added comment", result.content[0].text)
-            self.assertIn("updated 3 field(s)", result.content[0].text)
-
-            # Verify both comment and attributes passed
-            call_args = mock_run_sync.call_args[0]
-            self.assertEqual(call_args[2], "Converted comment")
-            self.assertEqual(
-                call_args[3],
-                {
-                    "status": "assigned",
-                    "owner": "alice",
-                    "milestone": "v2.0",
-                },
-            )
+        # First call (get_ticket) succeeds, second call (delete_ticket) raises permission error
+        mock_run_sync.side_effect = [
+            True,  # get_ticket succeeds
+            _FAULT_PERM_DELETE,  # delete_ticket fails
+        ]
 
-    def test_update_missing_ticket_id(self):
-        """Missing ticket_id returns validation_error."""
-        result = asyncio.run(
-            _handle_update(
-                self.mock_client,
-                {
-                    "comment": "orphan comment",
-                },
-            )
+        registry = ToolRegistry(TICKET_WRITE_SPECS)
+        result = await registry.call_tool(
+            "ticket_delete", {"ticket_id": 42}, self.mock_client
         )
 
-        self.assertIsInstance(result, types.CallToolResult)
+        assert isinstance(result, types.CallToolResult)
         self.assertTrue(result.isError)
         self.assertEqual(len(result.content), 1)
-        self.assertIn(
-            "Error (validation_error)", result.content[0].text
-        )
-        self.assertIn("ticket_id is required", result.content[0].text)
-
-    def test_update_no_changes(self):
-        """Update with ticket_id only but no comment or fields returns no-changes."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = True
-
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "ticket_id": 42,
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Updated ticket #42", result.content[0].text)
-            self.assertIn("no changes", result.content[0].text)
-
-    def test_update_not_found(self):
-        """Ticket not found returns not_found error via dispatcher."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                404, "Ticket 99999 not found"
-            )
-
-            registry = ToolRegistry(TICKET_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "ticket_update",
-                    {
-                        "ticket_id": 99999,
-                    },
-                    self.mock_client,
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Error (not_found)", result.content[0].text)
-
-    def test_update_permission_denied(self):
-        """Permission denied fault returns permission_denied error."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                403, "TICKET_MODIFY permission denied"
-            )
-
-            registry = ToolRegistry(TICKET_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "ticket_update",
-                    {
-                        "ticket_id": 42,
-                    },
-                    self.mock_client,
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn(
-                "Error (permission_denied)", result.content[0].text
-            )
-
-    def test_update_all_attribute_fields(self):
-        """All supported update attributes are passed through."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_write.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = True
-
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "ticket_id": 7,
-                        "status": "closed",
-                        "priority": "critical",
-                        "component": "auth",
-                        "milestone": "v3.0",
-                        "owner": "bob",
-                        "resolution": "fixed",
-                        "cc": "team@test.com",
-                        "keywords": "release",
-                    },
-                )
-            )
-
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            self.assertIn("Updated ticket #7", result.content[0].text)
-            self.assertIn("updated 8 field(s)", result.content[0].text)
-
-            call_args = mock_run_sync.call_args[0]
-            attrs = call_args[3]
-            self.assertEqual(attrs["status"], "closed")
-            self.assertEqual(attrs["priority"], "critical")
-            self.assertEqual(attrs["component"], "auth")
-            self.assertEqual(attrs["milestone"], "v3.0")
-            self.assertEqual(attrs["owner"], "bob")
-            self.assertEqual(attrs["resolution"], "fixed")
-            self.assertEqual(attrs["cc"], "team@test.com")
-            self.assertEqual(attrs["keywords"], "release")
+        self.assertRegex(result.content[0].text, _PERM_DENIED_DELETE_RE)
 
 
 # ---------------------------------------------------------------------------
@@ -726,11 +162,11 @@ class TestHandleTicketUpdate(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
-class TestHandleTicketWriteTool(unittest.TestCase):
+class TestHandleTicketWriteTool(unittest.IsolatedAsyncioTestCase):
     """Tests for ToolRegistry dispatch of ticket write tools."""
 
     def setUp(self):
-        self.mock_client = MagicMock()
+        self.mock_client = stub_client()
         self.registry = ToolRegistry(TICKET_WRITE_SPECS)
 
     def _patch_handler(self, tool_name, mock_handler):
@@ -748,143 +184,83 @@ class TestHandleTicketWriteTool(unittest.TestCase):
             handler=mock_handler,
         )
 
-    def test_routes_to_create(self):
-        """Registry routes ticket_create to _handle_create."""
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[
-                types.TextContent(
-                    type="text", text="Created ticket #1: Test"
-                )
-            ]
-        )
-        self._patch_handler("ticket_create", mock_handler)
-
-        result = asyncio.run(
-            self.registry.call_tool(
+    async def test_routes_all(self):
+        """Registry routes each write tool to its handler."""
+        routes = [
+            (
                 "ticket_create",
-                {
-                    "summary": "Test",
-                    "description": "Desc",
-                },
-                self.mock_client,
-            )
-        )
-
-        mock_handler.assert_awaited_once_with(
-            self.mock_client,
-            {
-                "summary": "Test",
-                "description": "Desc",
-            },
-        )
-        self.assertEqual(
-            result.content[0].text, "Created ticket #1: Test"
-        )
-
-    def test_routes_to_update(self):
-        """Registry routes ticket_update to _handle_update."""
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[
-                types.TextContent(
-                    type="text", text="Updated ticket #42"
+                {"summary": "Test", "description": "Desc"},
+                "Created ticket #1: Test",
+            ),
+            ("ticket_update", {"ticket_id": 42}, "Updated ticket #42"),
+            ("ticket_delete", {"ticket_id": 42}, "Deleted ticket #42."),
+        ]
+        handlers = {}
+        for tool_name, _, text in routes:
+            handlers[tool_name] = AsyncMock(
+                return_value=types.CallToolResult(
+                    content=[types.TextContent(type="text", text=text)]
                 )
-            ]
-        )
-        self._patch_handler("ticket_update", mock_handler)
-
-        result = asyncio.run(
-            self.registry.call_tool(
-                "ticket_update",
-                {
-                    "ticket_id": 42,
-                },
-                self.mock_client,
             )
-        )
+            self._patch_handler(tool_name, handlers[tool_name])
 
-        mock_handler.assert_awaited_once_with(
-            self.mock_client, {"ticket_id": 42}
-        )
-        self.assertEqual(result.content[0].text, "Updated ticket #42")
-
-    def test_routes_to_delete(self):
-        """Registry routes ticket_delete to _handle_delete."""
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[
-                types.TextContent(
-                    type="text", text="Deleted ticket #42."
+        for tool_name, args, text in routes:
+            with self.subTest(tool=tool_name):
+                result = await self.registry.call_tool(
+                    tool_name, args, self.mock_client
                 )
-            ]
-        )
-        self._patch_handler("ticket_delete", mock_handler)
-
-        result = asyncio.run(
-            self.registry.call_tool(
-                "ticket_delete",
-                {
-                    "ticket_id": 42,
-                },
-                self.mock_client,
-            )
-        )
 
-        mock_handler.assert_awaited_once_with(
-            self.mock_client, {"ticket_id": 42}
-        )
-        self.assertEqual(result.content[0].text, "Deleted ticket #42.")
+                handlers[tool_name].assert_awaited_once_with(
+                    self.mock_client, args
+                )
+                self.assertEqual(result.content[0].text, text)
 
-    def test_unknown_tool(self):
+    async def test_unknown_tool(self):
         """Unknown tool name raises ValueError from registry."""
         with self.assertRaises(ValueError) as ctx:
-            asyncio.run(
-                self.registry.call_tool(
-                    "ticket_unknown", {}, self.mock_client
-                )
+            await self.registry.call_tool(
+                "ticket_unknown", {}, self.mock_client
             )
 
         self.assertIn("Unknown tool", str(ctx.exception))
 
-    def test_none_arguments_defaults_to_empty_dict(self):
+    async def test_none_arguments_defaults_to_empty_dict(self):
         """Passing None arguments is handled gracefully (converted to empty dict)."""
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[types.TextContent(type="text", text="error")]
+        mock_handler = AsyncMock(
+            return_value=types.CallToolResult(
+                content=[types.TextContent(type="text", text="error")]
+            )
         )
         self._patch_handler("ticket_create", mock_handler)
 
-        asyncio.run(
-            self.registry.call_tool(
-                "ticket_create", None, self.mock_client
-            )
+        await self.registry.call_tool(
+            "ticket_create", None, self.mock_client
         )
 
         # The registry converts None to {} before passing
         mock_handler.assert_awaited_once_with(self.mock_client, {})
 
-    def test_generic_exception_returns_server_error(self):
+    async def test_generic_exception_returns_server_error(self):
         """Unexpected exception returns server_error."""
-        mock_handler = AsyncMock()
-        mock_handler.side_effect = RuntimeError("connection reset")
+        mock_handler = AsyncMock(
+            side_effect=RuntimeError("connection reset")
+        )
         self._patch_handler("ticket_update", mock_handler)
 
-        result = asyncio.run(
-            self.registry.call_tool(
-                "ticket_update",
-                {
-                    "ticket_id": 1,
-                },
-                self.mock_client,
-            )
+        result = await self.registry.call_tool(
+            "ticket_update",
+            {
+                "ticket_id": 1,
+            },
+            self.mock_client,
         )
 
         self.assertIsInstance(result, types.CallToolResult)
         self.assertTrue(result.isError)
         self.assertEqual(len(result.content), 1)
-        self.assertIn("Error (server_error)", result.content[0].text)
-        self.assertIn("connection reset", result.content[0].text)
+        text = result.content[0].text
+        self.assertIn("Error (server_error)", text)
+        self.assertIn("connection reset", text)
 
 
 # ---------------------------------------------------------------------------
@@ -892,443 +268,329 @@ class TestHandleTicketWriteTool(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
-class TestHandleTicketSearch:
-    """Tests for _handle_search handler."""
+def _serve_tickets(tickets):
+    """Build a run_sync_limited side effect answering get_ticket calls."""
+    rows = {t["id"]: [t["id"], None, None, t] for t in tickets}
+    return lambda _method, ticket_id: rows[ticket_id]
 
-    def _run(self, coro):
-        return asyncio.run(coro)
 
-    def test_search_default_query(self):
-        """Search with no args uses default query and returns ticket summaries."""
-        client = MagicMock(spec=TracClient)
+# Timestamps and conversions returned by the mocked get/changelog calls
+_CREATED = datetime(2026, 1, 10, 9, 0, 0)
+_MODIFIED = datetime(2026, 1, 15, 14, 30, 0)
+_CHANGELOG_TS = datetime(2026, 1, 20, 10, 0, 0)
+_DESCRIPTION_MD = ConversionResult(
+    text="# Problem\nLogin fails",
+    source_format="tracwiki",
+    target_format="markdown",
+    converted=True,
+)
+_COMMENT_MD = ConversionResult(
+    text="Fixed the bug",
+    source_format="tracwiki",
+    target_format="markdown",
+    converted=True,
+)
 
-        mock_data = [
-            {
-                "id": 1,
-                "summary": "Bug A",
-                "status": "new",
-                "owner": "alice",
-            },
-            {
-                "id": 2,
-                "summary": "Bug B",
-                "status": "assigned",
-                "owner": "bob",
-            },
-            {
-                "id": 3,
-                "summary": "Bug C",
-                "status": "new",
-                "owner": "charlie",
-            },
-        ]
+# get_ticket attribute rows served to the search detail fetches
+_SEARCH_DEFAULT_TICKETS = (
+    {"id": 1, "summary": "Bug A", "status": "new", "owner": "alice"},
+    {"id": 2, "summary": "Bug B", "status": "assigned", "owner": "bob"},
+    {"id": 3, "summary": "Bug C", "status": "new", "owner": "charlie"},
+)
+_SEARCH_PAGED_TICKETS = tuple(
+    {"id": n, "summary": f"T{n}", "status": "closed", "owner": "x"}
+    for n in (10, 20, 30, 40, 50)
+)
+_SEARCH_DETAIL_TICKETS = (
+    {
+        "id": 7,
+        "summary": "Feature request",
+        "status": "new",
+        "owner": "dev1",
+    },
+    {
+        "id": 8,
+        "summary": "Enhancement",
+        "status": "accepted",
+        "owner": "dev2",
+    },
+)
 
-        def _close_coros_and_return(coros):
-            for coro in coros:
-                coro.close()
-            return mock_data
-
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.gather_limited",
-                side_effect=_close_coros_and_return,
-            ) as _mock_gather,
-        ):
-            mock_run_sync.return_value = [1, 2, 3]
-
-            result = self._run(_handle_search(client, {}))
-
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "Found 3 tickets" in text
-            assert "#1" in text
-            assert "#2" in text
-            assert "#3" in text
-            # Default query
-            mock_run_sync.assert_called_once()
-            call_args = mock_run_sync.call_args[0]
-            assert call_args[0] == client.search_tickets
-            assert call_args[1] == "status!=closed"
-
-    def test_search_custom_query_with_max_results(self):
-        """Custom query and max_results are forwarded correctly."""
-        client = MagicMock(spec=TracClient)
+# Expected read handler output, matched in order with one search each
+_SEARCH_DEFAULT_RE = re.compile(r"Found 3 tickets.*#1.*#2.*#3", re.S)
+_SEARCH_DETAILS_RE = re.compile(
+    r"Feature request \(status: new, owner: dev1\).*Enhancement", re.S
+)
+# "# Problem" is the Markdown-converted description
+_GET_SUCCESS_RE = re.compile(
+    r"Ticket #42: Fix login bug.*new.*alice.*# Problem", re.S
+)
+_CHANGELOG_SUCCESS_RE = re.compile(
+    r"Changelog for ticket #5.*alice.*status.*new.*assigned"
+    r".*bob.*comment.*Fixed the bug",
+    re.S,
+)
+_ACTIONS_SUCCESS_RE = re.compile(
+    r"Available actions for ticket #10.*leave.*accept.*resolve", re.S
+)
 
-        mock_data = [
-            {
-                "id": 10,
-                "summary": "T10",
-                "status": "closed",
-                "owner": "x",
-            },
-            {
-                "id": 20,
-                "summary": "T20",
-                "status": "closed",
-                "owner": "x",
-            },
-            {
-                "id": 30,
-                "summary": "T30",
-                "status": "closed",
-                "owner": "x",
-            },
-            {
-                "id": 40,
-                "summary": "T40",
-                "status": "closed",
-                "owner": "x",
-            },
-            {
-                "id": 50,
-                "summary": "T50",
-                "status": "closed",
-                "owner": "x",
-            },
-        ]
+# Canned handler results for the dispatcher routing tests.
+_SEARCH_RESULT = types.CallToolResult(
+    content=[types.TextContent(type="text", text="search result")]
+)
+_GET_RESULT = types.CallToolResult(
+    content=[types.TextContent(type="text", text="get result")]
+)
+_CHANGELOG_RESULT = types.CallToolResult(
+    content=[types.TextContent(type="text", text="changelog")]
+)
+_FIELDS_RESULT = types.CallToolResult(
+    content=[types.TextContent(type="text", text="fields")]
+)
+_ACTIONS_RESULT = types.CallToolResult(
+    content=[types.TextContent(type="text", text="actions")]
+)
 
-        def _close_coros_and_return(coros):
-            for coro in coros:
-                coro.close()
-            return mock_data
-
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.gather_limited",
-                side_effect=_close_coros_and_return,
-            ) as _mock_gather,
-        ):
-            mock_run_sync.return_value = [10, 20, 30, 40, 50, 60]
 
-            result = self._run(
-                _handle_search(
-                    client, {"query": "status=closed", "max_results": 5}
-                )
-            )
+@pytest.fixture
+def mock_run_sync(monkeypatch):
+    """Replace ticket_read.run_sync with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(_tr, "run_sync", mock)
+    return mock
 
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "Found 6 tickets" in text
-            assert "showing 5" in text
-            # Verify query passed correctly
-            call_args = mock_run_sync.call_args[0]
-            assert call_args[1] == "status=closed"
-            # Verify structured content
-            assert result.structuredContent["total"] == 6
-            assert result.structuredContent["showing"] == 5
-
-    def test_search_empty_results(self):
-        """Empty search returns no-tickets message."""
-        client = MagicMock(spec=TracClient)
 
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = []
+@pytest.fixture
+def mock_run_sync_limited(monkeypatch):
+    """Replace ticket_read.run_sync_limited with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(_tr, "run_sync_limited", mock)
+    return mock
 
-            result = self._run(_handle_search(client, {}))
 
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "No tickets found" in text
-            assert result.structuredContent["tickets"] == []
-            assert result.structuredContent["total"] == 0
+@pytest.fixture
+def mock_convert(monkeypatch):
+    """Replace ticket_read.tracwiki_to_markdown with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(_tr, "tracwiki_to_markdown", mock)
+    return mock
 
-    def test_search_with_ticket_details(self):
-        """Search fetches details for each ticket via gather_limited."""
-        client = MagicMock(spec=TracClient)
 
-        mock_data = [
-            {
-                "id": 7,
-                "summary": "Feature request",
-                "status": "new",
-                "owner": "dev1",
-            },
-            {
-                "id": 8,
-                "summary": "Enhancement",
-                "status": "accepted",
-                "owner": "dev2",
-            },
-        ]
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleTicketSearch:
+    """Tests for _handle_search handler."""
 
-        def _close_coros_and_return(coros):
-            for coro in coros:
-                coro.close()
-            return mock_data
-
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.gather_limited",
-                side_effect=_close_coros_and_return,
-            ) as mock_gather,
-        ):
-            mock_run_sync.return_value = [7, 8]
-
-            result = self._run(_handle_search(client, {}))
-
-            text = result.content[0].text
-            assert "Feature request" in text
-            assert "Enhancement" in text
-            assert "status: new" in text
-            assert "owner: dev1" in text
-            # Verify gather_limited was called
-            mock_gather.assert_called_once()
-
-    def test_search_xmlrpc_fault(self):
-        """XML-RPC fault during search produces structured error."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                500, "Internal server error"
-            )
+    async def test_search_default_query(
+        self, trac_client, mock_run_sync, mock_run_sync_limited
+    ):
+        """Search with no args uses default query and returns ticket summaries."""
+        mock_run_sync_limited.side_effect = _serve_tickets(
+            _SEARCH_DEFAULT_TICKETS
+        )
+        mock_run_sync.return_value = [1, 2, 3]
 
-            # Call through registry so the fault is caught and translated
-            registry = ToolRegistry(TICKET_READ_SPECS)
-            result = self._run(
-                registry.call_tool("ticket_search", {}, client)
-            )
+        result = await _handle_search(trac_client, {})
+
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert _SEARCH_DEFAULT_RE.search(text)
+        # Default query
+        mock_run_sync.assert_called_once()
+        call_args = mock_run_sync.call_args[0]
+        assert call_args[0] == trac_client.search_tickets
+        assert call_args[1] == "status!=closed"
+
+    async def test_search_custom_query_with_max_results(
+        self, trac_client, mock_run_sync, mock_run_sync_limited
+    ):
+        """Custom query and max_results are forwarded correctly."""
+        mock_run_sync_limited.side_effect = _serve_tickets(
+            _SEARCH_PAGED_TICKETS
+        )
+        mock_run_sync.return_value = [10, 20, 30, 40, 50, 60]
+
+        result = await _handle_search(
+            trac_client, {"query": "status=closed", "max_results": 5}
+        )
+
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "Found 6 tickets" in text
+        assert "showing 5" in text
+        # Verify query passed correctly
+        call_args = mock_run_sync.call_args[0]
+        assert call_args[1] == "status=closed"
+        # Verify structured content
+        assert result.structuredContent["total"] == 6
+        assert result.structuredContent["showing"] == 5
+
+    async def test_search_empty_results(
+        self, trac_client, mock_run_sync
+    ):
+        """Empty search returns no-tickets message."""
+        mock_run_sync.return_value = []
+
+        result = await _handle_search(trac_client, {})
 
-            assert isinstance(result, types.CallToolResult)
-            assert result.isError is True
-            assert "Error" in result.content[0].text
-            assert "server_error" in result.content[0].text
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "No tickets found" in text
+        assert result.structuredContent["tickets"] == []
+        assert result.structuredContent["total"] == 0
+
+    async def test_search_with_ticket_details(
+        self, trac_client, mock_run_sync, mock_run_sync_limited
+    ):
+        """Search fetches details for each ticket via run_sync_limited."""
+        mock_run_sync_limited.side_effect = _serve_tickets(
+            _SEARCH_DETAIL_TICKETS
+        )
+        mock_run_sync.return_value = [7, 8]
+
+        result = await _handle_search(trac_client, {})
+
+        text = result.content[0].text
+        assert _SEARCH_DETAILS_RE.search(text)
+        # One detail fetch per ticket
+        assert [
+            c.args for c in mock_run_sync_limited.await_args_list
+        ] == [
+            (trac_client.get_ticket, 7),
+            (trac_client.get_ticket, 8),
+        ]
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestHandleTicketGet:
     """Tests for _handle_get handler."""
 
-    def _run(self, coro):
-        return asyncio.run(coro)
-
-    def test_get_success(self):
+    async def test_get_success(
+        self, trac_client, mock_run_sync, mock_convert
+    ):
         """Get ticket returns full details with Markdown-converted description."""
-        client = MagicMock(spec=TracClient)
-        created = datetime(2026, 1, 10, 9, 0, 0)
-        modified = datetime(2026, 1, 15, 14, 30, 0)
-
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.tracwiki_to_markdown"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = [
-                42,
-                created,
-                modified,
-                {
-                    "summary": "Fix login bug",
-                    "description": "= Problem =\nLogin fails",
-                    "status": "new",
-                    "owner": "alice",
-                    "type": "defect",
-                    "priority": "high",
-                    "component": "auth",
-                    "milestone": "v2.0",
-                },
-            ]
-            mock_convert.return_value = ConversionResult(
-                text="# Problem\nLogin fails",
-                source_format="tracwiki",
-                target_format="markdown",
-                converted=True,
-            )
+        mock_run_sync.return_value = [
+            42,
+            _CREATED,
+            _MODIFIED,
+            {
+                "summary": "Fix login bug",
+                "description": "= Problem =\nLogin fails",
+                "status": "new",
+                "owner": "alice",
+                "type": "defect",
+                "priority": "high",
+                "component": "auth",
+                "milestone": "v2.0",
+            },
+        ]
+        mock_convert.return_value = _DESCRIPTION_MD
 
-            result = self._run(_handle_get(client, {"ticket_id": 42}))
-
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "Ticket #42" in text
-            assert "Fix login bug" in text
-            assert "# Problem" in text  # converted description
-            assert "new" in text
-            assert "alice" in text
-            # Structured content
-            assert result.structuredContent["id"] == 42
-            assert (
-                result.structuredContent["summary"] == "Fix login bug"
-            )
+        result = await _handle_get(trac_client, {"ticket_id": 42})
 
-    def test_get_raw_mode(self):
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert _GET_SUCCESS_RE.search(text)
+        # Structured content
+        assert result.structuredContent["id"] == 42
+        assert result.structuredContent["summary"] == "Fix login bug"
+
+    async def test_get_raw_mode(self, trac_client, mock_run_sync):
         """Raw mode returns TracWiki description without conversion."""
-        client = MagicMock(spec=TracClient)
-        created = datetime(2026, 1, 10, 9, 0, 0)
-        modified = datetime(2026, 1, 15, 14, 30, 0)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                1,
-                created,
-                modified,
-                {
-                    "summary": "Raw test",
-                    "description": "= TracWiki heading =",
-                    "status": "new",
-                    "owner": "bob",
-                    "type": "task",
-                    "priority": "normal",
-                    "component": "core",
-                    "milestone": "",
-                },
-            ]
-
-            result = self._run(
-                _handle_get(client, {"ticket_id": 1, "raw": True})
-            )
+        mock_run_sync.return_value = [
+            1,
+            _CREATED,
+            _MODIFIED,
+            {
+                "summary": "Raw test",
+                "description": "= TracWiki heading =",
+                "status": "new",
+                "owner": "bob",
+                "type": "task",
+                "priority": "normal",
+                "component": "core",
+                "milestone": "",
+            },
+        ]
 
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "(TracWiki)" in text
-            assert "= TracWiki heading =" in text
+        result = await _handle_get(
+            trac_client, {"ticket_id": 1, "raw": True}
+        )
 
-    def test_get_missing_ticket_id(self):
-        """Missing ticket_id returns validation error."""
-        client = MagicMock(spec=TracClient)
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "(TracWiki)" in text
+        assert "= TracWiki heading =" in text
 
-        result = self._run(_handle_get(client, {}))
+    async def test_get_missing_ticket_id(self, trac_client):
+        """Missing ticket_id returns validation error."""
+        result = await _handle_get(trac_client, {})
 
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
         assert "Error (validation_error)" in result.content[0].text
         assert "ticket_id is required" in result.content[0].text
 
-    def test_get_not_found(self):
-        """Ticket not found returns structured error via dispatcher."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                404, "Ticket 99999 not found"
-            )
-
-            registry = ToolRegistry(TICKET_READ_SPECS)
-            result = self._run(
-                registry.call_tool(
-                    "ticket_get", {"ticket_id": 99999}, client
-                )
-            )
-
-            assert isinstance(result, types.CallToolResult)
-            assert result.isError is True
-            assert "Error (not_found)" in result.content[0].text
-
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestHandleTicketChangelog:
     """Tests for _handle_changelog handler."""
 
-    def _run(self, coro):
-        return asyncio.run(coro)
-
-    def test_changelog_success(self):
+    async def test_changelog_success(
+        self, trac_client, mock_run_sync, mock_convert
+    ):
         """Changelog returns formatted change entries."""
-        client = MagicMock(spec=TracClient)
-        ts = datetime(2026, 1, 20, 10, 0, 0)
-
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.tracwiki_to_markdown"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = [
-                [ts, "alice", "status", "new", "assigned", 1],
-                [ts, "bob", "comment", "", "Fixed the bug", 1],
-            ]
-            mock_convert.return_value = ConversionResult(
-                text="Fixed the bug",
-                source_format="tracwiki",
-                target_format="markdown",
-                converted=True,
-            )
+        mock_run_sync.return_value = [
+            [_CHANGELOG_TS, "alice", "status", "new", "assigned", 1],
+            [_CHANGELOG_TS, "bob", "comment", "", "Fixed the bug", 1],
+        ]
+        mock_convert.return_value = _COMMENT_MD
 
-            result = self._run(
-                _handle_changelog(client, {"ticket_id": 5})
-            )
+        result = await _handle_changelog(trac_client, {"ticket_id": 5})
 
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "Changelog for ticket #5" in text
-            assert "alice" in text
-            assert "status" in text
-            assert "new" in text
-            assert "assigned" in text
-            assert "bob" in text
-            assert "comment" in text
-            assert "Fixed the bug" in text
-
-    def test_changelog_raw_mode(self):
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert _CHANGELOG_SUCCESS_RE.search(text)
+
+    async def test_changelog_raw_mode(
+        self, trac_client, mock_run_sync, mock_convert
+    ):
         """Raw mode skips Markdown conversion for comment content."""
-        client = MagicMock(spec=TracClient)
-        ts = datetime(2026, 1, 20, 10, 0, 0)
-
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_read.tracwiki_to_markdown"
-            ) as mock_convert,
-        ):
-            mock_run_sync.return_value = [
-                [ts, "alice", "comment", "", "= Wiki heading =", 1],
-            ]
+        mock_run_sync.return_value = [
+            [
+                _CHANGELOG_TS,
+                "alice",
+                "comment",
+                "",
+                "= Wiki heading =",
+                1,
+            ],
+        ]
 
-            result = self._run(
-                _handle_changelog(client, {"ticket_id": 5, "raw": True})
-            )
+        result = await _handle_changelog(
+            trac_client, {"ticket_id": 5, "raw": True}
+        )
 
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "(TracWiki format)" in text
-            assert "= Wiki heading =" in text
-            # tracwiki_to_markdown should NOT have been called
-            mock_convert.assert_not_called()
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "(TracWiki format)" in text
+        assert "= Wiki heading =" in text
+        # tracwiki_to_markdown should NOT have been called
+        mock_convert.assert_not_called()
 
-    def test_changelog_empty(self):
+    async def test_changelog_empty(self, trac_client, mock_run_sync):
         """Empty changelog returns appropriate message."""
-        client = MagicMock(spec=TracClient)
+        mock_run_sync.return_value = []
 
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = []
+        result = await _handle_changelog(trac_client, {"ticket_id": 99})
 
-            result = self._run(
-                _handle_changelog(client, {"ticket_id": 99})
-            )
-
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "No changelog" in text
-            assert "#99" in text
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "No changelog" in text
+        assert "#99" in text
 
-    def test_changelog_missing_ticket_id(self):
+    async def test_changelog_missing_ticket_id(self, trac_client):
         """Missing ticket_id returns validation error."""
-        client = MagicMock(spec=TracClient)
-
-        result = self._run(_handle_changelog(client, {}))
+        result = await _handle_changelog(trac_client, {})
 
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
@@ -1336,131 +598,107 @@ class TestHandleTicketChangelog:
         assert "ticket_id is required" in result.content[0].text
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestHandleTicketFields:
     """Tests for _handle_fields handler."""
 
-    def _run(self, coro):
-        return asyncio.run(coro)
-
-    def test_fields_success(self):
+    async def test_fields_success(self, trac_client, mock_run_sync):
         """Fields returns structured field definitions."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                {
-                    "name": "summary",
-                    "type": "text",
-                    "label": "Summary",
-                    "custom": False,
-                },
-                {
-                    "name": "status",
-                    "type": "select",
-                    "label": "Status",
-                    "options": ["new", "assigned", "closed"],
-                    "custom": False,
-                },
-            ]
-
-            result = self._run(_handle_fields(client, {}))
-
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "Ticket Fields (2 total)" in text
-            assert "summary" in text
-            assert "Standard Fields" in text
-            # Structured content
-            fields = result.structuredContent["fields"]
-            assert len(fields) == 2
-            assert fields[0]["name"] == "summary"
-
-    def test_fields_includes_custom(self):
+        mock_run_sync.return_value = [
+            {
+                "name": "summary",
+                "type": "text",
+                "label": "Summary",
+                "custom": False,
+            },
+            {
+                "name": "status",
+                "type": "select",
+                "label": "Status",
+                "options": ["new", "assigned", "closed"],
+                "custom": False,
+            },
+        ]
+
+        result = await _handle_fields(trac_client, {})
+
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "Ticket Fields (2 total)" in text
+        assert "summary" in text
+        assert "Standard Fields" in text
+        # Structured content
+        fields = result.structuredContent["fields"]
+        assert len(fields) == 2
+        assert fields[0]["name"] == "summary"
+
+    async def test_fields_includes_custom(
+        self, trac_client, mock_run_sync
+    ):
         """Custom fields appear in Custom Fields section."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                {
-                    "name": "summary",
-                    "type": "text",
-                    "label": "Summary",
-                    "custom": False,
-                },
-                {
-                    "name": "department",
-                    "type": "select",
-                    "label": "Department",
-                    "options": ["eng", "sales"],
-                    "custom": True,
-                },
-            ]
-
-            result = self._run(_handle_fields(client, {}))
-
-            text = result.content[0].text
-            assert "Custom Fields" in text
-            assert "department" in text
-            assert "eng, sales" in text
-            # Structured content
-            fields = result.structuredContent["fields"]
-            custom = [f for f in fields if f["custom"]]
-            assert len(custom) == 1
-            assert custom[0]["name"] == "department"
+        mock_run_sync.return_value = [
+            {
+                "name": "summary",
+                "type": "text",
+                "label": "Summary",
+                "custom": False,
+            },
+            {
+                "name": "department",
+                "type": "select",
+                "label": "Department",
+                "options": ["eng", "sales"],
+                "custom": True,
+            },
+        ]
+
+        result = await _handle_fields(trac_client, {})
 
+        text = result.content[0].text
+        assert "Custom Fields" in text
+        assert "department" in text
+        assert "eng, sales" in text
+        # Structured content
+        fields = result.structuredContent["fields"]
+        custom = [f for f in fields if f["custom"]]
+        assert len(custom) == 1
+        assert custom[0]["name"] == "department"
 
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestHandleTicketActions:
     """Tests for _handle_actions handler."""
 
-    def _run(self, coro):
-        return asyncio.run(coro)
-
-    def test_actions_success(self):
+    async def test_actions_success(self, trac_client, mock_run_sync):
         """Actions returns formatted list of workflow actions."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                ["leave", "leave as new", {}, []],
-                ["accept", "accept ticket", {}, []],
-                [
-                    "resolve",
-                    "resolve ticket",
-                    {},
-                    ["action_resolve_resolve_resolution"],
-                ],
-            ]
-
-            result = self._run(
-                _handle_actions(client, {"ticket_id": 10})
-            )
+        mock_run_sync.return_value = [
+            ["leave", "leave as new", {}, []],
+            ["accept", "accept ticket", {}, []],
+            [
+                "resolve",
+                "resolve ticket",
+                {},
+                ["action_resolve_resolve_resolution"],
+            ],
+        ]
 
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "Available actions for ticket #10" in text
-            assert "leave" in text
-            assert "accept" in text
-            assert "resolve" in text
-            # Structured content
-            actions = result.structuredContent["actions"]
-            assert len(actions) == 3
-            assert actions[0]["name"] == "leave"
-
-    def test_actions_missing_ticket_id(self):
-        """Missing ticket_id raises ValueError caught by dispatcher."""
-        client = MagicMock(spec=TracClient)
+        result = await _handle_actions(trac_client, {"ticket_id": 10})
 
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert _ACTIONS_SUCCESS_RE.search(text)
+        # Structured content
+        actions = result.structuredContent["actions"]
+        assert len(actions) == 3
+        assert actions[0]["name"] == "leave"
+
+    async def test_actions_missing_ticket_id(self, trac_client):
+        """Missing ticket_id raises ValueError caught by dispatcher."""
         # _handle_actions raises ValueError when ticket_id missing,
         # registry catches it and returns validation_error
         registry = ToolRegistry(TICKET_READ_SPECS)
-        result = self._run(
-            registry.call_tool("ticket_actions", {}, client)
+        result = await registry.call_tool(
+            "ticket_actions", {}, trac_client
         )
 
         assert isinstance(result, types.CallToolResult)
@@ -1468,222 +706,111 @@ class TestHandleTicketActions:
         assert "Error (validation_error)" in result.content[0].text
         assert "ticket_id is required" in result.content[0].text
 
-    def test_actions_empty(self):
+    async def test_actions_empty(self, trac_client, mock_run_sync):
         """Empty actions list returns appropriate message."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = []
+        mock_run_sync.return_value = []
 
-            result = self._run(
-                _handle_actions(client, {"ticket_id": 5})
-            )
-
-            assert isinstance(result, types.CallToolResult)
-            text = result.content[0].text
-            assert "No available actions" in text
-            assert result.structuredContent["actions"] == []
-
-    def test_actions_method_not_available(self):
-        """getActions not available returns helpful error."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                1, "No such method 'ticket.getActions'"
-            )
-
-            result = self._run(
-                _handle_actions(client, {"ticket_id": 5})
-            )
+        result = await _handle_actions(trac_client, {"ticket_id": 5})
 
-            assert isinstance(result, types.CallToolResult)
-            assert result.isError is True
-            assert "method_not_available" in result.content[0].text
+        assert isinstance(result, types.CallToolResult)
+        text = result.content[0].text
+        assert "No available actions" in text
+        assert result.structuredContent["actions"] == []
 
-    def test_actions_with_hints_and_input_fields(self):
+    async def test_actions_with_hints_and_input_fields(
+        self, trac_client, mock_run_sync
+    ):
         """Actions with list hints and input fields are formatted correctly."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                [
-                    "resolve",
-                    "resolve ticket",
-                    ["set to closed"],
-                    ["resolution"],
-                ],
-            ]
-
-            result = self._run(
-                _handle_actions(client, {"ticket_id": 10})
-            )
+        mock_run_sync.return_value = [
+            [
+                "resolve",
+                "resolve ticket",
+                ["set to closed"],
+                ["resolution"],
+            ],
+        ]
+
+        result = await _handle_actions(trac_client, {"ticket_id": 10})
 
-            text = result.content[0].text
-            assert "resolve" in text
-            assert "set to closed" in text
-            assert "requires: resolution" in text
+        text = result.content[0].text
+        assert "resolve" in text
+        assert "set to closed" in text
+        assert "requires: resolution" in text
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestHandleTicketReadTool:
     """Tests for ToolRegistry dispatch of ticket read tools."""
 
-    def _run(self, coro):
-        return asyncio.run(coro)
-
     def _registry(self):
         return ToolRegistry(TICKET_READ_SPECS)
 
-    def _registry_with_mock(self, tool_name, mock_handler):
-        """Create a registry with a mock handler for the given tool."""
+    def _registry_with_mocks(self, handlers):
+        """Create a registry with mock handlers keyed by tool name."""
         from trac_mcp_server.mcp.tools.registry import ToolSpec
 
         registry = self._registry()
-        orig = registry._specs[tool_name]
-        registry._specs[tool_name] = ToolSpec(
-            tool=orig.tool,
-            permissions=orig.permissions,
-            handler=mock_handler,
-        )
-        return registry
-
-    def test_routes_to_search(self):
-        """Registry routes ticket_search to _handle_search."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[
-                types.TextContent(type="text", text="search result")
-            ],
-        )
-        registry = self._registry_with_mock(
-            "ticket_search", mock_handler
-        )
-
-        result = self._run(
-            registry.call_tool(
-                "ticket_search", {"query": "status=new"}, client
+        for tool_name, mock_handler in handlers.items():
+            orig = registry._specs[tool_name]
+            registry._specs[tool_name] = ToolSpec(
+                tool=orig.tool,
+                permissions=orig.permissions,
+                handler=mock_handler,
             )
-        )
-
-        mock_handler.assert_awaited_once_with(
-            client, {"query": "status=new"}
-        )
-        assert result.content[0].text == "search result"
-
-    def test_routes_to_get(self):
-        """Registry routes ticket_get to _handle_get."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[types.TextContent(type="text", text="get result")],
-        )
-        registry = self._registry_with_mock("ticket_get", mock_handler)
-
-        self._run(
-            registry.call_tool("ticket_get", {"ticket_id": 1}, client)
-        )
-
-        mock_handler.assert_awaited_once_with(client, {"ticket_id": 1})
+        return registry
 
-    def test_routes_to_changelog(self):
-        """Registry routes ticket_changelog to _handle_changelog."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[types.TextContent(type="text", text="changelog")]
-        )
-        registry = self._registry_with_mock(
-            "ticket_changelog", mock_handler
-        )
+    def _registry_with_mock(self, tool_name, mock_handler):
+        """Create a registry with a mock handler for the given tool."""
+        return self._registry_with_mocks({tool_name: mock_handler})
+
+    async def test_routes_all(self, trac_client):
+        """Registry routes each ticket read tool to its handler."""
+        routes = [
+            ("ticket_search", {"query": "status=new"}, _SEARCH_RESULT),
+            ("ticket_get", {"ticket_id": 1}, _GET_RESULT),
+            ("ticket_changelog", {"ticket_id": 1}, _CHANGELOG_RESULT),
+            ("ticket_fields", {}, _FIELDS_RESULT),
+            ("ticket_actions", {"ticket_id": 1}, _ACTIONS_RESULT),
+        ]
+        handlers = {
+            tool_name: AsyncMock(return_value=canned)
+            for tool_name, _, canned in routes
+        }
+        registry = self._registry_with_mocks(handlers)
 
-        self._run(
-            registry.call_tool(
-                "ticket_changelog", {"ticket_id": 1}, client
+        results = await asyncio.gather(
+            *(
+                registry.call_tool(tool_name, args, trac_client)
+                for tool_name, args, _ in routes
             )
         )
 
-        mock_handler.assert_awaited_once_with(client, {"ticket_id": 1})
-
-    def test_routes_to_fields(self):
-        """Registry routes ticket_fields to _handle_fields."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[types.TextContent(type="text", text="fields")],
-        )
-        registry = self._registry_with_mock(
-            "ticket_fields", mock_handler
-        )
-
-        self._run(registry.call_tool("ticket_fields", {}, client))
-
-        mock_handler.assert_awaited_once_with(client, {})
-
-    def test_routes_to_actions(self):
-        """Registry routes ticket_actions to _handle_actions."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.return_value = types.CallToolResult(
-            content=[types.TextContent(type="text", text="actions")],
-        )
-        registry = self._registry_with_mock(
-            "ticket_actions", mock_handler
-        )
-
-        self._run(
-            registry.call_tool(
-                "ticket_actions", {"ticket_id": 1}, client
+        for (tool_name, args, canned), result in zip(
+            routes, results, strict=True
+        ):
+            handlers[tool_name].assert_awaited_once_with(
+                trac_client, args
             )
-        )
+            assert result is canned
 
-        mock_handler.assert_awaited_once_with(client, {"ticket_id": 1})
-
-    def test_unknown_tool_raises(self):
+    async def test_unknown_tool_raises(self, trac_client):
         """Unknown tool name raises ValueError from registry."""
-        client = MagicMock(spec=TracClient)
-
-        import pytest
-
         with pytest.raises(ValueError, match="Unknown tool"):
-            self._run(
-                self._registry().call_tool("ticket_unknown", {}, client)
+            await self._registry().call_tool(
+                "ticket_unknown", {}, trac_client
             )
 
-    def test_xmlrpc_fault_translated(self):
-        """XML-RPC fault from handler is translated to structured error."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.side_effect = xmlrpc.client.Fault(
-            403, "Permission denied"
-        )
-        registry = self._registry_with_mock("ticket_get", mock_handler)
-
-        result = self._run(
-            registry.call_tool("ticket_get", {"ticket_id": 1}, client)
-        )
-
-        assert isinstance(result, types.CallToolResult)
-        assert result.isError is True
-        assert "Error (permission_denied)" in result.content[0].text
-
-    def test_generic_exception_translated(self):
+    async def test_generic_exception_translated(self, trac_client):
         """Unexpected exception is caught and returned as server_error."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.side_effect = RuntimeError("connection reset")
+        mock_handler = AsyncMock(
+            side_effect=RuntimeError("connection reset")
+        )
         registry = self._registry_with_mock(
             "ticket_search", mock_handler
         )
 
-        result = self._run(
-            registry.call_tool("ticket_search", {}, client)
+        result = await registry.call_tool(
+            "ticket_search", {}, trac_client
         )
 
         assert isinstance(result, types.CallToolResult)
@@ -1691,38 +818,69 @@ class TestHandleTicketReadTool:
         assert "Error (server_error)" in result.content[0].text
         assert "connection reset" in result.content[0].text
 
-    def test_get_invalid_ticket_data_format(self):
+    async def test_get_invalid_ticket_data_format(
+        self, trac_client, mock_run_sync
+    ):
         """Invalid ticket data format from server returns error."""
-        client = MagicMock(spec=TracClient)
-
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_read.run_sync"
-        ) as mock_run_sync:
-            # Return invalid format (not a list with 4 elements)
-            mock_run_sync.return_value = "unexpected"
-
-            result = self._run(_handle_get(client, {"ticket_id": 1}))
-
-            assert isinstance(result, types.CallToolResult)
-            assert result.isError is True
-            assert "Error (server_error)" in result.content[0].text
-            assert (
-                "Invalid ticket data format" in result.content[0].text
-            )
+        # Return invalid format (not a list with 4 elements)
+        mock_run_sync.return_value = "unexpected"
 
-    def test_xmlrpc_version_conflict_translated(self):
-        """Version conflict fault is translated to version_conflict error."""
-        client = MagicMock(spec=TracClient)
-        mock_handler = AsyncMock()
-        mock_handler.side_effect = xmlrpc.client.Fault(
-            409, "Version conflict - not modified"
-        )
-        registry = self._registry_with_mock("ticket_get", mock_handler)
+        result = await _handle_get(trac_client, {"ticket_id": 1})
 
-        result = self._run(
-            registry.call_tool("ticket_get", {"ticket_id": 1}, client)
+        assert isinstance(result, types.CallToolResult)
+        assert result.isError is True
+        assert "Error (server_error)" in result.content[0].text
+        assert "Invalid ticket data format" in result.content[0].text
+
+    @pytest.mark.parametrize(
+        "tool_name, args, fault, kind",
+        [
+            (
+                "ticket_search",
+                {},
+                xmlrpc.client.Fault(500, "Internal server error"),
+                "server_error",
+            ),
+            (
+                "ticket_get",
+                {"ticket_id": 99999},
+                _FAULT_NOT_FOUND,
+                "not_found",
+            ),
+            (
+                "ticket_get",
+                {"ticket_id": 1},
+                xmlrpc.client.Fault(403, "Permission denied"),
+                "permission_denied",
+            ),
+            (
+                "ticket_get",
+                {"ticket_id": 1},
+                xmlrpc.client.Fault(
+                    409, "Version conflict - not modified"
+                ),
+                "version_conflict",
+            ),
+            (
+                "ticket_actions",
+                {"ticket_id": 5},
+                xmlrpc.client.Fault(
+                    1, "No such method 'ticket.getActions'"
+                ),
+                "method_not_available",
+            ),
+        ],
+    )
+    async def test_fault_translated(
+        self, trac_client, mock_run_sync, tool_name, args, fault, kind
+    ):
+        """XML-RPC faults are translated to structured errors by kind."""
+        mock_run_sync.side_effect = fault
+
+        result = await self._registry().call_tool(
+            tool_name, args, trac_client
         )
 
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
-        assert "Error (version_conflict)" in result.content[0].text
+        assert f"Error ({kind})" in result.content[0].text
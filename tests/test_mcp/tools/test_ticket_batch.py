@@ -1,14 +1,18 @@
 """Tests for batch ticket tool handlers."""
 
-import asyncio
-import unittest
 import xmlrpc.client
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import mcp.types as types
+import pytest
+import requests
+import urllib3
 
+from trac_mcp_server.core.client import TracClient
+from trac_mcp_server.mcp.tools import ticket_batch as _tb
 from trac_mcp_server.mcp.tools.registry import ToolRegistry, ToolSpec
 from trac_mcp_server.mcp.tools.ticket_batch import (
+    _TOOLS_BY_NAME,
     TICKET_BATCH_SPECS,
     TICKET_BATCH_TOOLS,
     _handle_batch_create,
@@ -17,665 +21,777 @@ from trac_mcp_server.mcp.tools.ticket_batch import (
 )
 
 
-class TestTicketBatchToolSchemas(unittest.TestCase):
+@pytest.fixture
+def client(trac_client, mock_config, monkeypatch):
+    """Shared TracClient mock accepting batches of up to 500 items.
+
+    Uses a per-test config, since some tests shrink max_batch_size.
+    """
+    monkeypatch.setattr(trac_client, "config", mock_config)
+    return trac_client
+
+
+@pytest.fixture
+def mock_rsl(monkeypatch):
+    """Replace ticket_batch.run_sync_limited with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(_tb, "run_sync_limited", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_convert(monkeypatch):
+    """Replace ticket_batch.markdown_to_tracwiki_batch with a MagicMock."""
+    mock = MagicMock(side_effect=lambda xs: [f"wiki:{x}" for x in xs])
+    monkeypatch.setattr(_tb, "markdown_to_tracwiki_batch", mock)
+    return mock
+
+
+def _http_error(status):
+    """Build the HTTPError raise_for_status() raises for status."""
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(
+        f"{status} Error", response=response
+    )
+
+
+class TestTicketBatchToolSchemas:
     """Tests for batch tool schema definitions."""
 
     def test_batch_tools_count(self):
         """There are exactly 3 batch tools."""
-        self.assertEqual(len(TICKET_BATCH_TOOLS), 3)
+        assert len(TICKET_BATCH_TOOLS) == 3
+
+    def test_batch_tools_by_name(self):
+        """_TOOLS_BY_NAME indexes every batch tool by name."""
+        assert list(_TOOLS_BY_NAME.values()) == TICKET_BATCH_TOOLS
 
     def test_batch_create_schema(self):
         """ticket_batch_create schema has required tickets array."""
-        tool = next(
-            t
-            for t in TICKET_BATCH_TOOLS
-            if t.name == "ticket_batch_create"
-        )
-        self.assertEqual(tool.name, "ticket_batch_create")
+        tool = _TOOLS_BY_NAME["ticket_batch_create"]
+        assert tool.name == "ticket_batch_create"
         schema = tool.inputSchema
-        self.assertEqual(schema["required"], ["tickets"])
+        assert schema["required"] == ["tickets"]
         tickets_prop = schema["properties"]["tickets"]
-        self.assertEqual(tickets_prop["type"], "array")
+        assert tickets_prop["type"] == "array"
         item_schema = tickets_prop["items"]
-        self.assertEqual(item_schema["type"], "object")
-        self.assertIn("summary", item_schema["required"])
-        self.assertIn("description", item_schema["required"])
+        assert item_schema["type"] == "object"
+        assert "summary" in item_schema["required"]
+        assert "description" in item_schema["required"]
 
     def test_batch_delete_schema(self):
         """ticket_batch_delete schema has required ticket_ids array of integers."""
-        tool = next(
-            t
-            for t in TICKET_BATCH_TOOLS
-            if t.name == "ticket_batch_delete"
-        )
-        self.assertEqual(tool.name, "ticket_batch_delete")
+        tool = _TOOLS_BY_NAME["ticket_batch_delete"]
+        assert tool.name == "ticket_batch_delete"
         schema = tool.inputSchema
-        self.assertEqual(schema["required"], ["ticket_ids"])
+        assert schema["required"] == ["ticket_ids"]
         ids_prop = schema["properties"]["ticket_ids"]
-        self.assertEqual(ids_prop["type"], "array")
-        self.assertEqual(ids_prop["items"]["type"], "integer")
+        assert ids_prop["type"] == "array"
+        assert ids_prop["items"]["type"] == "integer"
 
     def test_batch_update_schema(self):
         """ticket_batch_update schema has required updates array."""
-        tool = next(
-            t
-            for t in TICKET_BATCH_TOOLS
-            if t.name == "ticket_batch_update"
-        )
-        self.assertEqual(tool.name, "ticket_batch_update")
+        tool = _TOOLS_BY_NAME["ticket_batch_update"]
+        assert tool.name == "ticket_batch_update"
         schema = tool.inputSchema
-        self.assertEqual(schema["required"], ["updates"])
+        assert schema["required"] == ["updates"]
         updates_prop = schema["properties"]["updates"]
-        self.assertEqual(updates_prop["type"], "array")
+        assert updates_prop["type"] == "array"
         item_schema = updates_prop["items"]
-        self.assertEqual(item_schema["type"], "object")
-        self.assertIn("ticket_id", item_schema["required"])
+        assert item_schema["type"] == "object"
+        assert "ticket_id" in item_schema["required"]
 
 
-class TestHandleBatchCreate(unittest.TestCase):
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleBatchCreate:
     """Tests for _handle_batch_create handler."""
 
-    def setUp(self):
-        self.mock_client = MagicMock()
-        self.mock_client.config.max_batch_size = 500
-
-    def test_batch_create_success(self):
+    async def test_batch_create_success(
+        self, client, mock_rsl, mock_convert
+    ):
         """Batch create with 3 tickets returns all succeeded."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-            ) as mock_rsl,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_rsl.side_effect = [1, 2, 3]
-            mock_convert.side_effect = lambda x: f"converted:{x}"
-
-            result = asyncio.run(
-                _handle_batch_create(
-                    self.mock_client,
-                    {
-                        "tickets": [
-                            {
-                                "summary": "Ticket A",
-                                "description": "Desc A",
-                            },
-                            {
-                                "summary": "Ticket B",
-                                "description": "Desc B",
-                            },
-                            {
-                                "summary": "Ticket C",
-                                "description": "Desc C",
-                            },
-                        ]
-                    },
-                )
-            )
+        mock_rsl.return_value = [1, 2, 3]
+
+        result = await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"summary": "Ticket A", "description": "Desc A"},
+                    {"summary": "Ticket B", "description": "Desc B"},
+                    {"summary": "Ticket C", "description": "Desc C"},
+                ]
+            },
+        )
 
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertIn("3/3 succeeded", result.content[0].text)
-            self.assertIn("0 failed", result.content[0].text)
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 3)
-            self.assertEqual(sc["failed_count"], 0)
-            self.assertEqual(len(sc["created"]), 3)
-            self.assertEqual(sc["created"][0]["id"], 1)
-            self.assertEqual(sc["created"][1]["id"], 2)
-            self.assertEqual(sc["created"][2]["id"], 3)
-
-    def test_batch_create_partial_failure(self):
+        assert isinstance(result, types.CallToolResult)
+        assert "3/3 succeeded" in result.content[0].text
+        assert "0 failed" in result.content[0].text
+        sc = result.structuredContent
+        assert sc["succeeded"] == 3
+        assert sc["failed_count"] == 0
+        assert [c["id"] for c in sc["created"]] == [1, 2, 3]
+
+    async def test_batch_create_partial_failure(
+        self, client, mock_rsl, mock_convert
+    ):
         """Batch create with one xmlrpc fault reports partial failure."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-            ) as mock_rsl,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_rsl.side_effect = [
-                1,
-                xmlrpc.client.Fault(500, "Server error"),
-            ]
-            mock_convert.side_effect = lambda x: f"converted:{x}"
-
-            result = asyncio.run(
-                _handle_batch_create(
-                    self.mock_client,
-                    {
-                        "tickets": [
-                            {
-                                "summary": "Ticket A",
-                                "description": "Desc A",
-                            },
-                            {
-                                "summary": "Ticket B",
-                                "description": "Desc B",
-                            },
-                        ]
-                    },
-                )
-            )
+        mock_rsl.return_value = [
+            1,
+            xmlrpc.client.Fault(500, "Server error"),
+        ]
+
+        result = await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"summary": "Ticket A", "description": "Desc A"},
+                    {"summary": "Ticket B", "description": "Desc B"},
+                ]
+            },
+        )
 
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertIn("1/2 succeeded", result.content[0].text)
-            self.assertIn("1 failed", result.content[0].text)
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 1)
-            self.assertEqual(sc["failed_count"], 1)
-            self.assertEqual(len(sc["created"]), 1)
-            self.assertEqual(len(sc["failed"]), 1)
+        assert isinstance(result, types.CallToolResult)
+        assert "1/2 succeeded" in result.content[0].text
+        assert "1 failed" in result.content[0].text
+        sc = result.structuredContent
+        assert sc["succeeded"] == 1
+        assert sc["failed_count"] == 1
+        assert len(sc["created"]) == 1
+        assert len(sc["failed"]) == 1
 
-    def test_batch_create_missing_tickets(self):
+    async def test_batch_create_missing_tickets(self, client):
         """Missing tickets key returns validation error."""
-        result = asyncio.run(_handle_batch_create(self.mock_client, {}))
+        result = await _handle_batch_create(client, {})
 
-        self.assertIsInstance(result, types.CallToolResult)
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
-        self.assertIn(
-            "tickets list is required", result.content[0].text
-        )
+        assert isinstance(result, types.CallToolResult)
+        assert result.isError
+        assert "validation_error" in result.content[0].text
+        assert "tickets list is required" in result.content[0].text
 
-    def test_batch_create_empty_list(self):
+    async def test_batch_create_empty_list(self, client):
         """Empty tickets list returns validation error."""
-        result = asyncio.run(
-            _handle_batch_create(self.mock_client, {"tickets": []})
-        )
+        result = await _handle_batch_create(client, {"tickets": []})
 
-        self.assertIsInstance(result, types.CallToolResult)
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
+        assert isinstance(result, types.CallToolResult)
+        assert result.isError
+        assert "validation_error" in result.content[0].text
 
-    def test_batch_create_exceeds_max_batch_size(self):
+    async def test_batch_create_exceeds_max_batch_size(self, client):
         """Batch exceeding max size returns validation error."""
-        self.mock_client.config.max_batch_size = 2
+        client.config.max_batch_size = 2
         tickets = [
             {"summary": f"T{i}", "description": f"D{i}"}
             for i in range(3)
         ]
-        result = asyncio.run(
-            _handle_batch_create(self.mock_client, {"tickets": tickets})
+
+        result = await _handle_batch_create(
+            client, {"tickets": tickets}
         )
 
-        self.assertIsInstance(result, types.CallToolResult)
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
-        self.assertIn(
-            "Batch size 3 exceeds maximum 2", result.content[0].text
+        assert isinstance(result, types.CallToolResult)
+        assert result.isError
+        assert "validation_error" in result.content[0].text
+        assert (
+            "Batch size 3 exceeds maximum 2" in result.content[0].text
         )
 
-    def test_batch_create_missing_summary(self):
+    async def test_batch_create_missing_summary(
+        self, client, mock_rsl, mock_convert
+    ):
         """Ticket missing summary appears in failed list."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-            ) as mock_rsl,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_rsl.return_value = 1
-            mock_convert.side_effect = lambda x: x
-
-            result = asyncio.run(
-                _handle_batch_create(
-                    self.mock_client,
+        mock_rsl.return_value = [1]
+
+        result = await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"description": "No summary here"},
                     {
-                        "tickets": [
-                            {"description": "No summary here"},
-                            {
-                                "summary": "Good ticket",
-                                "description": "With desc",
-                            },
-                        ]
+                        "summary": "Good ticket",
+                        "description": "With desc",
                     },
-                )
-            )
+                ]
+            },
+        )
 
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 1)
-            self.assertEqual(sc["failed_count"], 1)
-            self.assertEqual(
-                sc["failed"][0]["error"], "summary is required"
-            )
+        sc = result.structuredContent
+        assert sc["succeeded"] == 1
+        assert sc["failed_count"] == 1
+        assert sc["failed"][0]["error"] == "summary is required"
 
-    def test_batch_create_missing_description(self):
+    async def test_batch_create_missing_description(
+        self, client, mock_rsl, mock_convert
+    ):
         """Ticket missing description appears in failed list."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-            ) as mock_rsl,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_rsl.return_value = 1
-            mock_convert.side_effect = lambda x: x
-
-            result = asyncio.run(
-                _handle_batch_create(
-                    self.mock_client,
-                    {
-                        "tickets": [
-                            {"summary": "No description"},
-                            {
-                                "summary": "Good ticket",
-                                "description": "With desc",
-                            },
-                        ]
-                    },
-                )
-            )
-
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 1)
-            self.assertEqual(sc["failed_count"], 1)
-            self.assertEqual(
-                sc["failed"][0]["error"], "description is required"
-            )
+        mock_rsl.return_value = [1]
 
-    def test_batch_create_calls_markdown_to_tracwiki(self):
-        """Each ticket description is converted via markdown_to_tracwiki."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-            ) as mock_rsl,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_rsl.side_effect = [10, 11]
-            mock_convert.side_effect = lambda x: f"wiki:{x}"
-
-            asyncio.run(
-                _handle_batch_create(
-                    self.mock_client,
+        result = await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"summary": "No description"},
                     {
-                        "tickets": [
-                            {"summary": "A", "description": "**bold**"},
-                            {
-                                "summary": "B",
-                                "description": "# heading",
-                            },
-                        ]
+                        "summary": "Good ticket",
+                        "description": "With desc",
                     },
-                )
-            )
+                ]
+            },
+        )
 
-            self.assertEqual(mock_convert.call_count, 2)
-            mock_convert.assert_any_call("**bold**")
-            mock_convert.assert_any_call("# heading")
-            # Verify converted description passed to create_ticket
-            first_call = mock_rsl.call_args_list[0]
-            self.assertEqual(first_call[0][2], "wiki:**bold**")
+        sc = result.structuredContent
+        assert sc["succeeded"] == 1
+        assert sc["failed_count"] == 1
+        assert sc["failed"][0]["error"] == "description is required"
+
+    async def test_batch_create_calls_markdown_to_tracwiki(
+        self, client, mock_rsl, mock_convert
+    ):
+        """All descriptions are converted in one markdown_to_tracwiki_batch call."""
+        mock_rsl.return_value = [10, 11]
+
+        await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"summary": "A", "description": "**bold**"},
+                    {"summary": "B", "description": "# heading"},
+                ]
+            },
+        )
 
+        mock_convert.assert_called_once_with(["**bold**", "# heading"])
+        # Verify converted descriptions passed to create_tickets
+        fn, items = mock_rsl.call_args[0]
+        assert fn is client.create_tickets
+        assert [item[1] for item in items] == [
+            "wiki:**bold**",
+            "wiki:# heading",
+        ]
 
-class TestHandleBatchDelete(unittest.TestCase):
-    """Tests for _handle_batch_delete handler."""
+    async def test_batch_create_conversion_failure_fails_one_ticket(
+        self, client, mock_rsl, mock_convert
+    ):
+        """A description that fails to convert only fails its ticket."""
+
+        def convert(texts):
+            if "bad" in texts:
+                raise RuntimeError("parser exploded")
+            return [f"wiki:{x}" for x in texts]
+
+        mock_convert.side_effect = convert
+        mock_rsl.return_value = [1, 3]
+
+        result = await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"summary": "A", "description": "good"},
+                    {"summary": "B", "description": "bad"},
+                    {"summary": "C", "description": "fine"},
+                ]
+            },
+        )
 
-    def setUp(self):
-        self.mock_client = MagicMock()
-        self.mock_client.config.max_batch_size = 500
+        sc = result.structuredContent
+        assert [c["id"] for c in sc["created"]] == [1, 3]
+        assert sc["failed"] == [
+            {
+                "index": 1,
+                "summary": "B",
+                "error": "description conversion failed: parser exploded",
+            }
+        ]
+        _, items = mock_rsl.call_args[0]
+        assert [item[1] for item in items] == ["wiki:good", "wiki:fine"]
+
+    async def test_batch_create_unencodable_field_fails_one_ticket(
+        self, mock_config
+    ):
+        """A None field fails its ticket; the rest are still created."""
+        response = MagicMock(
+            content=xmlrpc.client.dumps(
+                ([[1], [3]],), methodresponse=True
+            ).encode()
+        )
+        client = TracClient(mock_config)
 
-    def test_batch_delete_success(self):
-        """Batch delete all succeed."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-        ) as mock_rsl:
-            mock_rsl.return_value = True
-
-            result = asyncio.run(
-                _handle_batch_delete(
-                    self.mock_client, {"ticket_ids": [1, 2, 3]}
-                )
+        with patch.object(
+            requests.Session, "post", return_value=response
+        ) as mock_post:
+            result = await _handle_batch_create(
+                client,
+                {
+                    "tickets": [
+                        {"summary": "A", "description": "a"},
+                        {
+                            "summary": "B",
+                            "description": "b",
+                            "priority": None,
+                        },
+                        {"summary": "C", "description": "c"},
+                    ]
+                },
             )
 
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertIn("3/3 succeeded", result.content[0].text)
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 3)
-            self.assertEqual(sc["failed_count"], 0)
-            self.assertEqual(sc["deleted"], [1, 2, 3])
+        sc = result.structuredContent
+        assert [c["id"] for c in sc["created"]] == [1, 3]
+        assert [f["index"] for f in sc["failed"]] == [1]
+        assert "cannot marshal None" in sc["failed"][0]["error"]
+        assert sc["unknown_count"] == 0
+        assert mock_post.call_count == 1
+
+    async def test_batch_create_splits_into_multicall_chunks(
+        self, client, mock_rsl, mock_convert
+    ):
+        """Batches larger than one chunk go out as several multicalls."""
+        size = _tb._MULTICALL_CHUNK * 2 + 5
+        mock_rsl.side_effect = lambda fn, items: [
+            int(item[0]) for item in items
+        ]
 
-    def test_batch_delete_partial_failure(self):
-        """One delete fails, others succeed."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-        ) as mock_rsl:
-            mock_rsl.side_effect = [
-                True,
-                xmlrpc.client.Fault(403, "Permission denied"),
-                True,
-            ]
+        result = await _handle_batch_create(
+            client,
+            {
+                "tickets": [
+                    {"summary": str(i), "description": "D"}
+                    for i in range(size)
+                ]
+            },
+        )
 
-            result = asyncio.run(
-                _handle_batch_delete(
-                    self.mock_client, {"ticket_ids": [10, 20, 30]}
-                )
-            )
+        sizes = [len(c.args[1]) for c in mock_rsl.call_args_list]
+        assert sizes == [_tb._MULTICALL_CHUNK, _tb._MULTICALL_CHUNK, 5]
+        sc = result.structuredContent
+        assert [c["id"] for c in sc["created"]] == list(range(size))
+        assert sc["unknown_count"] == 0
 
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 2)
-            self.assertEqual(sc["failed_count"], 1)
-            self.assertIn(10, sc["deleted"])
-            self.assertIn(30, sc["deleted"])
-            self.assertEqual(sc["failed"][0]["id"], 20)
 
-    def test_batch_delete_missing_ids(self):
-        """Missing ticket_ids returns validation error."""
-        result = asyncio.run(_handle_batch_delete(self.mock_client, {}))
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleBatchDelete:
+    """Tests for _handle_batch_delete handler."""
 
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
+    async def test_batch_delete_success(self, client, mock_rsl):
+        """Batch delete all succeed."""
+        mock_rsl.return_value = [True, True, True]
 
-    def test_batch_delete_empty_list(self):
-        """Empty ticket_ids list returns validation error."""
-        result = asyncio.run(
-            _handle_batch_delete(self.mock_client, {"ticket_ids": []})
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [1, 2, 3]}
         )
 
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
+        assert isinstance(result, types.CallToolResult)
+        assert "3/3 succeeded" in result.content[0].text
+        sc = result.structuredContent
+        assert sc["succeeded"] == 3
+        assert sc["failed_count"] == 0
+        assert sc["deleted"] == [1, 2, 3]
 
-    def test_batch_delete_exceeds_max_batch_size(self):
-        """Batch exceeding max size returns validation error."""
-        self.mock_client.config.max_batch_size = 2
-        result = asyncio.run(
-            _handle_batch_delete(
-                self.mock_client, {"ticket_ids": [1, 2, 3]}
-            )
+    async def test_batch_delete_partial_failure(self, client, mock_rsl):
+        """One delete fails, others succeed."""
+        mock_rsl.return_value = [
+            True,
+            xmlrpc.client.Fault(403, "Permission denied"),
+            True,
+        ]
+
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [10, 20, 30]}
         )
 
-        self.assertTrue(result.isError)
-        self.assertIn(
-            "Batch size 3 exceeds maximum 2", result.content[0].text
+        sc = result.structuredContent
+        assert sc["succeeded"] == 2
+        assert sc["failed_count"] == 1
+        assert sc["deleted"] == [10, 30]
+        assert sc["failed"][0]["id"] == 20
+
+    async def test_batch_delete_falls_back_without_multicall(
+        self, client, mock_rsl
+    ):
+        """Servers without system.multicall get one delete per ticket."""
+        unsupported = xmlrpc.client.Fault(
+            -32601, 'RPC method "system.multicall" not found'
         )
 
+        async def fake_rsl(fn, *args):
+            if fn is client.delete_tickets:
+                raise unsupported
+            if args == (20,):
+                raise xmlrpc.client.Fault(403, "Permission denied")
+            return True
 
-class TestHandleBatchUpdate(unittest.TestCase):
-    """Tests for _handle_batch_update handler."""
+        mock_rsl.side_effect = fake_rsl
 
-    def setUp(self):
-        self.mock_client = MagicMock()
-        self.mock_client.config.max_batch_size = 500
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [10, 20, 30]}
+        )
 
-    def test_batch_update_success(self):
-        """Batch update all succeed."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-        ) as mock_rsl:
-            mock_rsl.return_value = True
-
-            result = asyncio.run(
-                _handle_batch_update(
-                    self.mock_client,
-                    {
-                        "updates": [
-                            {"ticket_id": 1, "status": "closed"},
-                            {"ticket_id": 2, "priority": "high"},
-                        ]
-                    },
+        sc = result.structuredContent
+        assert sc["deleted"] == [10, 30]
+        assert sc["failed"][0]["id"] == 20
+        assert mock_rsl.call_count == 4
+        mock_rsl.assert_any_call(client.delete_ticket, 10)
+
+    async def test_batch_delete_falls_back_on_no_such_method(
+        self, client, mock_rsl
+    ):
+        """A "no such method" fault without -32601 also falls back."""
+
+        async def fake_rsl(fn, *args):
+            if fn is client.delete_tickets:
+                raise xmlrpc.client.Fault(
+                    1, "No such method 'system.multicall'"
                 )
-            )
+            return True
 
-            self.assertIsInstance(result, types.CallToolResult)
-            self.assertIn("2/2 succeeded", result.content[0].text)
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 2)
-            self.assertEqual(sc["failed_count"], 0)
-            self.assertEqual(sc["updated"], [1, 2])
+        mock_rsl.side_effect = fake_rsl
 
-    def test_batch_update_partial_failure(self):
-        """One update fails, others succeed."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-        ) as mock_rsl:
-            mock_rsl.side_effect = [
-                True,
-                RuntimeError("connection lost"),
-            ]
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [10, 20]}
+        )
 
-            result = asyncio.run(
-                _handle_batch_update(
-                    self.mock_client,
-                    {
-                        "updates": [
-                            {"ticket_id": 5, "status": "assigned"},
-                            {"ticket_id": 6, "status": "closed"},
-                        ]
-                    },
-                )
-            )
+        assert result.structuredContent["deleted"] == [10, 20]
+        mock_rsl.assert_any_call(client.delete_ticket, 20)
 
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 1)
-            self.assertEqual(sc["failed_count"], 1)
-            self.assertIn(5, sc["updated"])
-            self.assertEqual(sc["failed"][0]["id"], 6)
-            self.assertIn("connection lost", sc["failed"][0]["error"])
+    async def test_batch_delete_transport_error_marks_chunk_unknown(
+        self, client, mock_rsl
+    ):
+        """A chunk lost in transit is unknown; other chunks still count."""
+        ticket_ids = list(range(1, _tb._MULTICALL_CHUNK + 3))
 
-    def test_batch_update_missing_updates(self):
-        """Missing updates key returns validation error."""
-        result = asyncio.run(_handle_batch_update(self.mock_client, {}))
+        async def fake_rsl(fn, ids):
+            if len(ids) < _tb._MULTICALL_CHUNK:
+                raise requests.exceptions.ReadTimeout("read timed out")
+            return [True] * len(ids)
 
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
+        mock_rsl.side_effect = fake_rsl
 
-    def test_batch_update_empty_list(self):
-        """Empty updates list returns validation error."""
-        result = asyncio.run(
-            _handle_batch_update(self.mock_client, {"updates": []})
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": ticket_ids}
         )
 
-        self.assertTrue(result.isError)
-        self.assertIn("validation_error", result.content[0].text)
+        sc = result.structuredContent
+        assert sc["deleted"] == ticket_ids[: _tb._MULTICALL_CHUNK]
+        assert sc["failed_count"] == 0
+        assert sc["unknown_count"] == 2
+        assert [u["id"] for u in sc["unknown"]] == ticket_ids[-2:]
+        assert (
+            "outcome unknown (read timed out)"
+            in (sc["unknown"][0]["unknown"])
+        )
+        text = result.content[0].text
+        assert "0 failed, 2 unknown." in text
+        assert "Outcome unknown:" in text
+
+    @pytest.mark.parametrize(
+        ("error", "unknown"),
+        [
+            (_http_error(403), False),
+            (_http_error(502), True),
+            (
+                requests.exceptions.ConnectTimeout("connect timed out"),
+                False,
+            ),
+            (
+                requests.exceptions.ConnectionError(
+                    urllib3.exceptions.MaxRetryError(
+                        None,
+                        "/rpc",
+                        urllib3.exceptions.NewConnectionError(
+                            None, "Connection refused"
+                        ),
+                    )
+                ),
+                False,
+            ),
+            (
+                requests.exceptions.ConnectionError(
+                    urllib3.exceptions.ProtocolError(
+                        "Connection aborted."
+                    )
+                ),
+                True,
+            ),
+            (TypeError("cannot marshal None objects"), False),
+        ],
+    )
+    async def test_batch_delete_request_error_classification(
+        self, client, mock_rsl, error, unknown
+    ):
+        """Only errors after the request may have reached Trac are unknown."""
+        mock_rsl.side_effect = error
+
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [1, 2]}
+        )
 
-    def test_batch_update_missing_ticket_id(self):
-        """Update missing ticket_id appears in failed list."""
-        with patch(
-            "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-        ) as mock_rsl:
-            mock_rsl.return_value = True
-
-            result = asyncio.run(
-                _handle_batch_update(
-                    self.mock_client,
-                    {
-                        "updates": [
-                            {"status": "closed"},  # missing ticket_id
-                            {"ticket_id": 1, "status": "closed"},
-                        ]
-                    },
-                )
-            )
+        sc = result.structuredContent
+        assert sc["unknown_count"] == (2 if unknown else 0)
+        assert sc["failed_count"] == (0 if unknown else 2)
 
-            sc = result.structuredContent
-            self.assertEqual(sc["succeeded"], 1)
-            self.assertEqual(sc["failed_count"], 1)
-            self.assertIn(
-                "ticket_id is required", sc["failed"][0]["error"]
-            )
+    async def test_batch_delete_request_fault_fails_every_item(
+        self, client, mock_rsl
+    ):
+        """A fault for the whole multicall marks every ticket failed."""
+        mock_rsl.side_effect = xmlrpc.client.Fault(500, "Server error")
 
-    def test_batch_update_with_comment_converts_markdown(self):
-        """Comments in updates are converted via markdown_to_tracwiki."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.run_sync_limited"
-            ) as mock_rsl,
-            patch(
-                "trac_mcp_server.mcp.tools.ticket_batch.markdown_to_tracwiki"
-            ) as mock_convert,
-        ):
-            mock_rsl.return_value = True
-            mock_convert.side_effect = lambda x: f"wiki:{x}"
-
-            asyncio.run(
-                _handle_batch_update(
-                    self.mock_client,
-                    {
-                        "updates": [
-                            {
-                                "ticket_id": 1,
-                                "comment": "**bold comment**",
-                            },
-                        ]
-                    },
-                )
-            )
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [1, 2]}
+        )
 
-            mock_convert.assert_called_once_with("**bold comment**")
-            # Verify converted comment passed to update_ticket
-            call_args = mock_rsl.call_args[0]
-            self.assertEqual(call_args[2], "wiki:**bold comment**")
+        sc = result.structuredContent
+        assert sc["succeeded"] == 0
+        assert [f["id"] for f in sc["failed"]] == [1, 2]
+
+    async def test_batch_delete_missing_ids(self, client):
+        """Missing ticket_ids returns validation error."""
+        result = await _handle_batch_delete(client, {})
 
-    def test_batch_update_exceeds_max_batch_size(self):
+        assert result.isError
+        assert "validation_error" in result.content[0].text
+
+    async def test_batch_delete_empty_list(self, client):
+        """Empty ticket_ids list returns validation error."""
+        result = await _handle_batch_delete(client, {"ticket_ids": []})
+
+        assert result.isError
+        assert "validation_error" in result.content[0].text
+
+    async def test_batch_delete_exceeds_max_batch_size(self, client):
         """Batch exceeding max size returns validation error."""
-        self.mock_client.config.max_batch_size = 1
-        result = asyncio.run(
-            _handle_batch_update(
-                self.mock_client,
-                {
-                    "updates": [
-                        {"ticket_id": 1, "status": "closed"},
-                        {"ticket_id": 2, "status": "closed"},
-                    ]
-                },
-            )
+        client.config.max_batch_size = 2
+
+        result = await _handle_batch_delete(
+            client, {"ticket_ids": [1, 2, 3]}
         )
 
-        self.assertTrue(result.isError)
-        self.assertIn(
-            "Batch size 2 exceeds maximum 1", result.content[0].text
+        assert result.isError
+        assert (
+            "Batch size 3 exceeds maximum 2" in result.content[0].text
         )
 
 
-class TestHandleTicketBatchToolDispatcher(unittest.TestCase):
-    """Tests for ToolRegistry dispatch of ticket batch tools."""
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleBatchUpdate:
+    """Tests for _handle_batch_update handler."""
 
-    def setUp(self):
-        self.mock_client = MagicMock()
-        self.mock_client.config.max_batch_size = 500
-        self.registry = ToolRegistry(TICKET_BATCH_SPECS)
-
-    def _make_registry_with_mock(self, tool_name, mock_handler):
-        """Build a ToolRegistry with a single mock-handler ToolSpec."""
-        tool_def = next(
-            s.tool
-            for s in TICKET_BATCH_SPECS
-            if s.tool.name == tool_name
-        )
-        spec = ToolSpec(
-            tool=tool_def,
-            permissions=frozenset(),
-            handler=mock_handler,
-        )
-        return ToolRegistry([spec])
-
-    def test_routes_to_batch_create(self):
-        """Registry routes ticket_batch_create to _handle_batch_create."""
-        mock_handler = AsyncMock(
-            return_value=types.CallToolResult(
-                content=[
-                    types.TextContent(type="text", text="batch created")
+    async def test_batch_update_success(self, client, mock_rsl):
+        """Batch update all succeed."""
+        mock_rsl.return_value = [[1], [2]]
+
+        result = await _handle_batch_update(
+            client,
+            {
+                "updates": [
+                    {"ticket_id": 1, "status": "closed"},
+                    {"ticket_id": 2, "priority": "high"},
                 ]
-            )
-        )
-        registry = self._make_registry_with_mock(
-            "ticket_batch_create", mock_handler
+            },
         )
 
-        result = asyncio.run(
-            registry.call_tool(
-                "ticket_batch_create",
-                {"tickets": []},
-                self.mock_client,
-            )
-        )
+        assert isinstance(result, types.CallToolResult)
+        assert "2/2 succeeded" in result.content[0].text
+        sc = result.structuredContent
+        assert sc["succeeded"] == 2
+        assert sc["failed_count"] == 0
+        assert sc["updated"] == [1, 2]
 
-        mock_handler.assert_awaited_once_with(
-            self.mock_client, {"tickets": []}
-        )
-        self.assertEqual(result.content[0].text, "batch created")
-
-    def test_routes_to_batch_delete(self):
-        """Registry routes ticket_batch_delete to _handle_batch_delete."""
-        mock_handler = AsyncMock(
-            return_value=types.CallToolResult(
-                content=[
-                    types.TextContent(type="text", text="batch deleted")
+    async def test_batch_update_partial_failure(self, client, mock_rsl):
+        """One update fails, others succeed."""
+        mock_rsl.return_value = [
+            [5],
+            RuntimeError("connection lost"),
+        ]
+
+        result = await _handle_batch_update(
+            client,
+            {
+                "updates": [
+                    {"ticket_id": 5, "status": "assigned"},
+                    {"ticket_id": 6, "status": "closed"},
                 ]
-            )
-        )
-        registry = self._make_registry_with_mock(
-            "ticket_batch_delete", mock_handler
+            },
         )
 
-        result = asyncio.run(
-            registry.call_tool(
-                "ticket_batch_delete",
-                {"ticket_ids": [1]},
-                self.mock_client,
-            )
-        )
+        sc = result.structuredContent
+        assert sc["succeeded"] == 1
+        assert sc["failed_count"] == 1
+        assert sc["updated"] == [5]
+        assert sc["failed"][0]["id"] == 6
+        assert "connection lost" in sc["failed"][0]["error"]
+
+    async def test_batch_update_missing_updates(self, client):
+        """Missing updates key returns validation error."""
+        result = await _handle_batch_update(client, {})
+
+        assert result.isError
+        assert "validation_error" in result.content[0].text
 
-        mock_handler.assert_awaited_once_with(
-            self.mock_client, {"ticket_ids": [1]}
+    async def test_batch_update_empty_list(self, client):
+        """Empty updates list returns validation error."""
+        result = await _handle_batch_update(client, {"updates": []})
+
+        assert result.isError
+        assert "validation_error" in result.content[0].text
+
+    async def test_batch_update_missing_ticket_id(
+        self, client, mock_rsl
+    ):
+        """Update missing ticket_id appears in failed list."""
+        mock_rsl.return_value = [[1]]
+
+        result = await _handle_batch_update(
+            client,
+            {
+                "updates": [
+                    {"status": "closed"},  # missing ticket_id
+                    {"ticket_id": 1, "status": "closed"},
+                ]
+            },
         )
-        self.assertEqual(result.content[0].text, "batch deleted")
-
-    def test_routes_to_batch_update(self):
-        """Registry routes ticket_batch_update to _handle_batch_update."""
-        mock_handler = AsyncMock(
-            return_value=types.CallToolResult(
-                content=[
-                    types.TextContent(type="text", text="batch updated")
+
+        sc = result.structuredContent
+        assert sc["succeeded"] == 1
+        assert sc["failed_count"] == 1
+        assert "ticket_id is required" in sc["failed"][0]["error"]
+
+    async def test_batch_update_with_comment_converts_markdown(
+        self, client, mock_rsl, mock_convert
+    ):
+        """Comments in updates are converted via markdown_to_tracwiki_batch."""
+        mock_rsl.return_value = [[1]]
+
+        await _handle_batch_update(
+            client,
+            {
+                "updates": [
+                    {"ticket_id": 1, "comment": "**bold comment**"}
                 ]
-            )
+            },
         )
-        registry = self._make_registry_with_mock(
-            "ticket_batch_update", mock_handler
+
+        mock_convert.assert_called_once_with(["**bold comment**"])
+        # Verify converted comment passed to update_tickets
+        fn, items = mock_rsl.call_args[0]
+        assert fn is client.update_tickets
+        assert items == [(1, "wiki:**bold comment**", {})]
+
+    async def test_batch_update_conversion_failure_fails_one_update(
+        self, client, mock_rsl, mock_convert
+    ):
+        """A comment that fails to convert only fails its update."""
+
+        def convert(texts):
+            if "bad" in texts:
+                raise RuntimeError("parser exploded")
+            return [f"wiki:{x}" for x in texts]
+
+        mock_convert.side_effect = convert
+        mock_rsl.return_value = [[1], [3]]
+
+        result = await _handle_batch_update(
+            client,
+            {
+                "updates": [
+                    {"ticket_id": 1, "comment": "good"},
+                    {"ticket_id": 2, "comment": "bad"},
+                    {"ticket_id": 3, "status": "closed"},
+                ]
+            },
         )
 
-        result = asyncio.run(
-            registry.call_tool(
-                "ticket_batch_update",
-                {"updates": []},
-                self.mock_client,
-            )
+        sc = result.structuredContent
+        assert sc["updated"] == [1, 3]
+        assert sc["failed"] == [
+            {
+                "id": 2,
+                "error": "comment conversion failed: parser exploded",
+            }
+        ]
+        _, items = mock_rsl.call_args[0]
+        assert items == [
+            (1, "wiki:good", {}),
+            (3, "", {"status": "closed"}),
+        ]
+
+    async def test_batch_update_exceeds_max_batch_size(self, client):
+        """Batch exceeding max size returns validation error."""
+        client.config.max_batch_size = 1
+
+        result = await _handle_batch_update(
+            client,
+            {
+                "updates": [
+                    {"ticket_id": 1, "status": "closed"},
+                    {"ticket_id": 2, "status": "closed"},
+                ]
+            },
         )
 
-        mock_handler.assert_awaited_once_with(
-            self.mock_client, {"updates": []}
+        assert result.isError
+        assert (
+            "Batch size 2 exceeds maximum 1" in result.content[0].text
         )
-        self.assertEqual(result.content[0].text, "batch updated")
 
-    def test_unknown_batch_tool(self):
+
+def _registry_with_mock(tool_name, mock_handler):
+    """Build a ToolRegistry with a single mock-handler ToolSpec."""
+    spec = ToolSpec(
+        tool=_TOOLS_BY_NAME[tool_name],
+        permissions=frozenset(),
+        handler=mock_handler,
+    )
+    return ToolRegistry([spec])
+
+
+def _text_result(text):
+    """Build a single-text CallToolResult for a mock handler."""
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=text)]
+    )
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleTicketBatchToolDispatcher:
+    """Tests for ToolRegistry dispatch of ticket batch tools."""
+
+    @pytest.mark.parametrize(
+        ("tool_name", "args", "text"),
+        [
+            ("ticket_batch_create", {"tickets": []}, "batch created"),
+            (
+                "ticket_batch_delete",
+                {"ticket_ids": [1]},
+                "batch deleted",
+            ),
+            ("ticket_batch_update", {"updates": []}, "batch updated"),
+        ],
+    )
+    async def test_routes_to_handler(
+        self, client, tool_name, args, text
+    ):
+        """Registry routes each batch tool to its handler."""
+        mock_handler = AsyncMock(return_value=_text_result(text))
+        registry = _registry_with_mock(tool_name, mock_handler)
+
+        result = await registry.call_tool(tool_name, args, client)
+
+        mock_handler.assert_awaited_once_with(client, args)
+        assert result.content[0].text == text
+
+    async def test_unknown_batch_tool(self, client):
         """Unknown batch tool name raises ValueError."""
-        with self.assertRaises(ValueError, msg="Unknown tool"):
-            asyncio.run(
-                self.registry.call_tool(
-                    "ticket_batch_unknown", {}, self.mock_client
-                )
-            )
+        registry = ToolRegistry(TICKET_BATCH_SPECS)
 
-    def test_none_arguments_defaults_to_empty_dict(self):
+        with pytest.raises(ValueError, match="Unknown tool"):
+            await registry.call_tool("ticket_batch_unknown", {}, client)
+
+    async def test_none_arguments_defaults_to_empty_dict(self, client):
         """Passing None arguments is converted to empty dict."""
-        mock_handler = AsyncMock(
-            return_value=types.CallToolResult(
-                content=[types.TextContent(type="text", text="result")]
-            )
-        )
-        registry = self._make_registry_with_mock(
+        mock_handler = AsyncMock(return_value=_text_result("result"))
+        registry = _registry_with_mock(
             "ticket_batch_create", mock_handler
         )
 
-        asyncio.run(
-            registry.call_tool(
-                "ticket_batch_create", None, self.mock_client
-            )
-        )
+        await registry.call_tool("ticket_batch_create", None, client)
 
-        mock_handler.assert_awaited_once_with(self.mock_client, {})
+        mock_handler.assert_awaited_once_with(client, {})
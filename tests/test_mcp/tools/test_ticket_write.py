@@ -0,0 +1,446 @@
+"""Tests for ticket_create and ticket_update tool handlers."""
+
+import unittest
+import xmlrpc.client
+from unittest.mock import patch
+
+import mcp.types as types
+
+from trac_mcp_server.mcp.tools import ticket_write as _tw
+from trac_mcp_server.mcp.tools.registry import ToolRegistry
+from trac_mcp_server.mcp.tools.ticket_write import (
+    TICKET_WRITE_SPECS,
+    _handle_create,
+    _handle_update,
+)
+
+from .conftest import stub_client
+
+# XML-RPC faults raised by the mocked write calls
+_FAULT_NOT_FOUND = xmlrpc.client.Fault(404, "Ticket 99999 not found")
+_FAULT_SERVER = xmlrpc.client.Fault(500, "Internal server error")
+_FAULT_PERM_CREATE = xmlrpc.client.Fault(
+    403, "TICKET_CREATE permission denied"
+)
+_FAULT_PERM_MODIFY = xmlrpc.client.Fault(
+    403, "TICKET_MODIFY permission denied"
+)
+
+
+# ---------------------------------------------------------------------------
+# Ticket Create handler tests
+# ---------------------------------------------------------------------------
+
+
+@patch.object(_tw, "markdown_to_tracwiki", return_value="Converted")
+@patch.object(_tw, "run_sync")
+class TestHandleTicketCreate(unittest.IsolatedAsyncioTestCase):
+    """Tests for _handle_create handler."""
+
+    def setUp(self):
+        self.mock_client = stub_client()
+
+    async def test_create_success(self, mock_run_sync, mock_convert):
+        """Create ticket with summary and markdown description."""
+        mock_run_sync.return_value = 42
+        mock_convert.return_value = (
+            "== Description ==\n\nWith '''markdown'''"
+        )
+
+        result = await _handle_create(
+            self.mock_client,
+            {
+                "summary": "Test ticket",
+                "description": "## Description\n\nWith **markdown**",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Created ticket #42", text)
+        self.assertIn("Test ticket", text)
+
+        # Verify markdown_to_tracwiki was called on description
+        mock_convert.assert_called_once_with(
+            "## Description\n\nWith **markdown**"
+        )
+
+        # Verify run_sync called with correct args
+        mock_run_sync.assert_called_once()
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(call_args[0], self.mock_client.create_ticket)
+        self.assertEqual(call_args[1], "Test ticket")  # summary
+        self.assertEqual(
+            call_args[2], "== Description ==\n\nWith '''markdown'''"
+        )  # converted desc
+        self.assertEqual(call_args[3], "defect")  # default ticket_type
+
+    async def test_create_minimal(self, mock_run_sync, mock_convert):
+        """Create ticket with summary and minimal description uses default type."""
+        mock_run_sync.return_value = 1
+
+        result = await _handle_create(
+            self.mock_client,
+            {
+                "summary": "Minimal ticket",
+                "description": "Simple description",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        self.assertIn("Created ticket #1", result.content[0].text)
+
+        # Verify default ticket_type is "defect"
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(call_args[3], "defect")
+        # Verify empty attributes dict (no optional fields)
+        self.assertEqual(call_args[4], {})
+
+    async def test_create_with_all_fields(
+        self, mock_run_sync, mock_convert
+    ):
+        """Create ticket with all optional fields passed through."""
+        mock_run_sync.return_value = 99
+
+        result = await _handle_create(
+            self.mock_client,
+            {
+                "summary": "Full ticket",
+                "description": "Full description",
+                "ticket_type": "enhancement",
+                "priority": "major",
+                "component": "core",
+                "milestone": "v1.0",
+                "owner": "alice",
+                "cc": "bob@test.com",
+                "keywords": "test",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        self.assertIn("Created ticket #99", result.content[0].text)
+
+        # Verify ticket_type override
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(call_args[3], "enhancement")
+
+        # Verify all optional attributes passed
+        self.assertEqual(
+            call_args[4],
+            {
+                "priority": "major",
+                "component": "core",
+                "milestone": "v1.0",
+                "owner": "alice",
+                "cc": "bob@test.com",
+                "keywords": "test",
+            },
+        )
+
+    async def test_validation_errors(self, mock_run_sync, mock_convert):
+        """Missing or empty summary/description returns validation_error."""
+        cases = [
+            (
+                {"description": "No summary provided"},
+                "summary is required",
+            ),
+            (
+                {"summary": "", "description": "Has description"},
+                "summary is required",
+            ),
+            ({"summary": "Has summary"}, "description is required"),
+            (
+                {"summary": "Has summary", "description": ""},
+                "description is required",
+            ),
+        ]
+        for args, message in cases:
+            with self.subTest(args=args):
+                result = await _handle_create(self.mock_client, args)
+
+                self.assertIsInstance(result, types.CallToolResult)
+                self.assertTrue(result.isError)
+                self.assertEqual(len(result.content), 1)
+                text = result.content[0].text
+                self.assertIn("Error (validation_error)", text)
+                self.assertIn(message, text)
+
+    async def test_create_xmlrpc_fault(
+        self, mock_run_sync, mock_convert
+    ):
+        """XML-RPC fault during create produces structured error via dispatcher."""
+        mock_run_sync.side_effect = _FAULT_SERVER
+
+        registry = ToolRegistry(TICKET_WRITE_SPECS)
+        result = await registry.call_tool(
+            "ticket_create",
+            {
+                "summary": "Test",
+                "description": "Test desc",
+            },
+            self.mock_client,
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertTrue(result.isError)
+        self.assertEqual(len(result.content), 1)
+        self.assertIn("Error (server_error)", result.content[0].text)
+
+    async def test_create_permission_denied(
+        self, mock_run_sync, mock_convert
+    ):
+        """Permission denied fault returns permission_denied error."""
+        mock_run_sync.side_effect = _FAULT_PERM_CREATE
+
+        registry = ToolRegistry(TICKET_WRITE_SPECS)
+        result = await registry.call_tool(
+            "ticket_create",
+            {
+                "summary": "Test",
+                "description": "Test desc",
+            },
+            self.mock_client,
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertTrue(result.isError)
+        self.assertEqual(len(result.content), 1)
+        self.assertIn(
+            "Error (permission_denied)", result.content[0].text
+        )
+
+
+# ---------------------------------------------------------------------------
+# Ticket Update handler tests
+# ---------------------------------------------------------------------------
+
+
+@patch.object(_tw, "markdown_to_tracwiki")
+@patch.object(_tw, "run_sync")
+class TestHandleTicketUpdate(unittest.IsolatedAsyncioTestCase):
+    """Tests for _handle_update handler."""
+
+    def setUp(self):
+        self.mock_client = stub_client()
+
+    async def test_update_with_comment(
+        self, mock_run_sync, mock_convert
+    ):
+        """Update ticket with markdown comment converts and includes it."""
+        mock_run_sync.return_value = True
+        mock_convert.return_value = (
+            "=== Update ===\n\nWith '''markdown'''"
+        )
+
+        result = await _handle_update(
+            self.mock_client,
+            {
+                "ticket_id": 42,
+                "comment": "### Update\n\nWith **markdown**",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Updated ticket #42", text)
+        self.assertIn("added comment", text)
+
+        # Verify markdown_to_tracwiki was called on comment
+        mock_convert.assert_called_once_with(
+            "### Update\n\nWith **markdown**"
+        )
+
+        # Verify run_sync called with converted comment
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(call_args[0], self.mock_client.update_ticket)
+        self.assertEqual(call_args[1], 42)
+        self.assertEqual(
+            call_args[2], "=== Update ===\n\nWith '''markdown'''"
+        )
+        self.assertEqual(call_args[3], {})  # no attribute changes
+
+    async def test_update_fields(self, mock_run_sync, mock_convert):
+        """Update ticket fields without comment."""
+        mock_run_sync.return_value = True
+
+        result = await _handle_update(
+            self.mock_client,
+            {
+                "ticket_id": 42,
+                "priority": "major",
+                "keywords": "updated",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Updated ticket #42", text)
+        self.assertIn("updated 2 field(s)", text)
+
+        # Verify attributes passed to client
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(call_args[1], 42)
+        self.assertEqual(call_args[2], "")  # empty comment
+        self.assertEqual(
+            call_args[3],
+            {"priority": "major", "keywords": "updated"},
+        )
+
+    async def test_update_comment_and_fields(
+        self, mock_run_sync, mock_convert
+    ):
+        """Update ticket with both comment and field changes."""
+        mock_run_sync.return_value = True
+        mock_convert.return_value = "Converted comment"
+
+        result = await _handle_update(
+            self.mock_client,
+            {
+                "ticket_id": 10,
+                "comment": "Adding a note",
+                "status": "assigned",
+                "owner": "alice",
+                "milestone": "v2.0",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Updated ticket #10", text)
+        self.assertIn("added comment", text)
+        self.assertIn("updated 3 field(s)", text)
+
+        # Verify both comment and attributes passed
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(call_args[2], "Converted comment")
+        self.assertEqual(
+            call_args[3],
+            {
+                "status": "assigned",
+                "owner": "alice",
+                "milestone": "v2.0",
+            },
+        )
+
+    async def test_update_missing_ticket_id(
+        self, mock_run_sync, mock_convert
+    ):
+        """Missing ticket_id returns validation_error."""
+        result = await _handle_update(
+            self.mock_client,
+            {
+                "comment": "orphan comment",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertTrue(result.isError)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Error (validation_error)", text)
+        self.assertIn("ticket_id is required", text)
+
+    async def test_update_no_changes(self, mock_run_sync, mock_convert):
+        """Update with ticket_id only but no comment or fields returns no-changes."""
+        mock_run_sync.return_value = True
+
+        result = await _handle_update(
+            self.mock_client,
+            {
+                "ticket_id": 42,
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Updated ticket #42", text)
+        self.assertIn("no changes", text)
+
+    async def test_update_not_found(self, mock_run_sync, mock_convert):
+        """Ticket not found returns not_found error via dispatcher."""
+        mock_run_sync.side_effect = _FAULT_NOT_FOUND
+
+        registry = ToolRegistry(TICKET_WRITE_SPECS)
+        result = await registry.call_tool(
+            "ticket_update",
+            {
+                "ticket_id": 99999,
+            },
+            self.mock_client,
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertTrue(result.isError)
+        self.assertEqual(len(result.content), 1)
+        self.assertIn("Error (not_found)", result.content[0].text)
+
+    async def test_update_permission_denied(
+        self, mock_run_sync, mock_convert
+    ):
+        """Permission denied fault returns permission_denied error."""
+        mock_run_sync.side_effect = _FAULT_PERM_MODIFY
+
+        registry = ToolRegistry(TICKET_WRITE_SPECS)
+        result = await registry.call_tool(
+            "ticket_update",
+            {
+                "ticket_id": 42,
+            },
+            self.mock_client,
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertTrue(result.isError)
+        self.assertEqual(len(result.content), 1)
+        self.assertIn(
+            "Error (permission_denied)", result.content[0].text
+        )
+
+    async def test_update_all_attribute_fields(
+        self, mock_run_sync, mock_convert
+    ):
+        """All supported update attributes are passed through."""
+        mock_run_sync.return_value = True
+
+        result = await _handle_update(
+            self.mock_client,
+            {
+                "ticket_id": 7,
+                "status": "closed",
+                "priority": "critical",
+                "component": "auth",
+                "milestone": "v3.0",
+                "owner": "bob",
+                "resolution": "fixed",
+                "cc": "team@test.com",
+                "keywords": "release",
+            },
+        )
+
+        self.assertIsInstance(result, types.CallToolResult)
+        self.assertEqual(len(result.content), 1)
+        text = result.content[0].text
+        self.assertIn("Updated ticket #7", text)
+        self.assertIn("updated 8 field(s)", text)
+
+        call_args = mock_run_sync.call_args[0]
+        self.assertEqual(
+            call_args[3],
+            {
+                "status": "closed",
+                "priority": "critical",
+                "component": "auth",
+                "milestone": "v3.0",
+                "owner": "bob",
+                "resolution": "fixed",
+                "cc": "team@test.com",
+                "keywords": "release",
+            },
+        )
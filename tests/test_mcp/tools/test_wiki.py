@@ -5,17 +5,18 @@ These tests verify wiki tool definitions, cursor encoding/decoding,
 and handler behavior with mocked TracClient.
 """
 
-import asyncio
 import base64
 import json
-import unittest
+import struct
 import xmlrpc.client
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, call
+
+import pytest
+from mcp.types import CallToolResult
 
-from trac_mcp_server.config import Config
 from trac_mcp_server.converters import ConversionResult
-from trac_mcp_server.mcp.tools import WIKI_TOOLS
+from trac_mcp_server.mcp.tools import WIKI_TOOLS, wiki_read, wiki_write
 from trac_mcp_server.mcp.tools.errors import format_timestamp
 from trac_mcp_server.mcp.tools.registry import ToolRegistry
 from trac_mcp_server.mcp.tools.wiki_read import (
@@ -32,143 +33,216 @@ from trac_mcp_server.mcp.tools.wiki_write import (
     _handle_update,
 )
 
+# Canned server responses; never mutated by the tests
+_PAGE_TEXT = "= Test Page =\n\nTest content."
+_PAGE_INFO = {
+    "name": "TestPage",
+    "version": 5,
+    "author": "alice",
+    "lastModified": datetime(2026, 2, 1, 14, 0, 0),
+}
+_SEARCH_RESULTS = (
+    {"name": "PageOne", "snippet": "matched text in page one"},
+    {"name": "PageTwo", "snippet": "matched text in page two"},
+    {"name": "PageThree", "snippet": "matched text in page three"},
+)
+_PREFIX_SEARCH_RESULTS = (
+    {"name": "User/Alice", "snippet": "alice page"},
+    {"name": "User/Bob", "snippet": "bob page"},
+    {"name": "System/Config", "snippet": "config page"},
+)
+_RECENT_CHANGES = (
+    {
+        "name": "PageA",
+        "author": "alice",
+        "lastModified": 1707900000,
+        "version": 3,
+    },
+    {
+        "name": "PageB",
+        "author": "bob",
+        "lastModified": 1707800000,
+        "version": 1,
+    },
+)
 
-class TestCursorEncoding(unittest.TestCase):
-    """Test cursor encoding and decoding."""
+# Ten recent changes, for exercising the limit parameter
+_LIMIT_PAGES = tuple(
+    {
+        "name": f"Page{i}",
+        "author": "alice",
+        "lastModified": 1707900000 - i * 1000,
+        "version": 1,
+    }
+    for i in range(10)
+)
 
-    def test_encode_cursor(self):
-        """Test encode_cursor creates valid base64."""
-        cursor = encode_cursor(10, 100)
 
-        # Should be valid base64
-        self.assertIsInstance(cursor, str)
+@pytest.fixture
+def mock_run_sync(monkeypatch):
+    """Replace wiki_read.run_sync with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(wiki_read, "run_sync", mock)
+    return mock
 
-        # Should be decodable
-        decoded = base64.b64decode(cursor.encode("utf-8"))
-        data = json.loads(decoded.decode("utf-8"))
 
-        self.assertEqual(data["offset"], 10)
-        self.assertEqual(data["total"], 100)
+@pytest.fixture
+def mock_run_sync_limited(monkeypatch):
+    """Replace wiki_read.run_sync_limited with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(wiki_read, "run_sync_limited", mock)
+    return mock
 
-    def test_decode_cursor(self):
-        """Test decode_cursor returns correct offset and total."""
-        cursor = encode_cursor(20, 150)
-        offset, total = decode_cursor(cursor)
 
-        self.assertEqual(offset, 20)
-        self.assertEqual(total, 150)
+@pytest.fixture
+def mock_write_run_sync(monkeypatch):
+    """Replace wiki_write.run_sync with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(wiki_write, "run_sync", mock)
+    return mock
 
-    def test_decode_cursor_invalid(self):
-        """Test decode_cursor raises ValueError on invalid input."""
-        with self.assertRaises(ValueError):
-            decode_cursor("not-valid-base64")
 
-        with self.assertRaises(ValueError):
-            # Valid base64 but not valid JSON
-            invalid = base64.b64encode(b"not json").decode("utf-8")
-            decode_cursor(invalid)
+# Markdown-to-TracWiki result returned by the auto_convert mock
+_DEFAULT_CONVERSION = ConversionResult(
+    text="= x =",
+    source_format="markdown",
+    target_format="tracwiki",
+    converted=True,
+    warnings=[],
+)
+
+# Same conversion, reporting a lossy table warning
+_TABLE_WARNING_CONVERSION = ConversionResult(
+    text="= x =",
+    source_format="markdown",
+    target_format="tracwiki",
+    converted=True,
+    warnings=[
+        "Tables detected - TracWiki uses different table syntax. "
+        "Manual conversion may be needed."
+    ],
+)
 
-        with self.assertRaises(ValueError):
-            # Valid JSON but missing required keys
-            invalid_json = json.dumps({"foo": "bar"})
-            invalid = base64.b64encode(
-                invalid_json.encode("utf-8")
-            ).decode("utf-8")
-            decode_cursor(invalid)
 
+@pytest.fixture
+def mock_convert(monkeypatch):
+    """Replace wiki_write.auto_convert with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(wiki_write, "auto_convert", mock)
+    return mock
 
-class TestWikiTools(unittest.TestCase):
-    """Test WIKI_TOOLS definitions."""
 
-    def test_five_tools_defined(self):
-        """Test WIKI_TOOLS contains exactly 6 tools."""
-        self.assertEqual(len(WIKI_TOOLS), 6)
+@pytest.fixture(scope="module")
+def sample_cursor():
+    """One encoded cursor with the offset and total it was built from."""
+    return encode_cursor(10, 100), 10, 100
 
-    def test_tool_names(self):
-        """Test tool names are correct."""
-        tool_names = [tool.name for tool in WIKI_TOOLS]
 
-        self.assertIn("wiki_get", tool_names)
-        self.assertIn("wiki_search", tool_names)
-        self.assertIn("wiki_create", tool_names)
-        self.assertIn("wiki_update", tool_names)
-        self.assertIn("wiki_delete", tool_names)
-        self.assertIn("wiki_recent_changes", tool_names)
+class TestCursorEncoding:
+    """Test cursor encoding and decoding."""
 
-    def test_wiki_get_schema(self):
-        """Test wiki_get has correct required fields."""
-        get_tool = next(t for t in WIKI_TOOLS if t.name == "wiki_get")
+    def test_encode_cursor(self, sample_cursor):
+        """Test encode_cursor packs offset and total as base64."""
+        cursor, offset, total = sample_cursor
 
-        self.assertIn("page_name", get_tool.inputSchema["properties"])
-        self.assertIn("version", get_tool.inputSchema["properties"])
-        self.assertEqual(
-            get_tool.inputSchema["required"], ["page_name"]
-        )
+        assert isinstance(cursor, str)
 
-    def test_wiki_search_schema(self):
-        """Test wiki_search has correct required fields."""
-        search_tool = next(
-            t for t in WIKI_TOOLS if t.name == "wiki_search"
-        )
+        decoded = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        assert struct.unpack(">II", decoded) == (offset, total)
 
-        self.assertIn("query", search_tool.inputSchema["properties"])
-        self.assertIn("prefix", search_tool.inputSchema["properties"])
-        self.assertIn("limit", search_tool.inputSchema["properties"])
-        self.assertIn("cursor", search_tool.inputSchema["properties"])
-        self.assertEqual(search_tool.inputSchema["required"], ["query"])
+    def test_cursor_size_bound(self):
+        """Test the largest cursor stays within 16 characters."""
+        cursor = encode_cursor(2**31 - 1, 2**31 - 1)
 
-    def test_wiki_create_schema(self):
-        """Test wiki_create has correct required fields."""
-        create_tool = next(
-            t for t in WIKI_TOOLS if t.name == "wiki_create"
-        )
+        assert len(cursor) <= 16
+        assert decode_cursor(cursor) == (2**31 - 1, 2**31 - 1)
 
-        self.assertIn(
-            "page_name", create_tool.inputSchema["properties"]
-        )
-        self.assertIn("content", create_tool.inputSchema["properties"])
-        self.assertIn("comment", create_tool.inputSchema["properties"])
-        self.assertEqual(
-            create_tool.inputSchema["required"],
-            ["page_name", "content"],
-        )
+    def test_decode_cursor(self, sample_cursor):
+        """Test decode_cursor returns correct offset and total."""
+        cursor, offset, total = sample_cursor
 
-    def test_wiki_update_schema(self):
-        """Test wiki_update has correct required fields."""
-        update_tool = next(
-            t for t in WIKI_TOOLS if t.name == "wiki_update"
-        )
+        assert decode_cursor(cursor) == (offset, total)
 
-        self.assertIn(
-            "page_name", update_tool.inputSchema["properties"]
-        )
-        self.assertIn("content", update_tool.inputSchema["properties"])
-        self.assertIn("version", update_tool.inputSchema["properties"])
-        self.assertIn("comment", update_tool.inputSchema["properties"])
-        self.assertEqual(
-            update_tool.inputSchema["required"],
-            ["page_name", "content", "version"],
-        )
+    def test_decode_cursor_invalid(self):
+        """Test decode_cursor raises ValueError on invalid input."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-valid-base64")
 
-    def test_wiki_delete_schema(self):
-        """Test wiki_delete has correct required fields."""
-        delete_tool = next(
-            t for t in WIKI_TOOLS if t.name == "wiki_delete"
-        )
+        with pytest.raises(ValueError):
+            # Valid base64 but wrong payload length
+            invalid = base64.urlsafe_b64encode(b"short").decode("ascii")
+            decode_cursor(invalid)
 
-        self.assertIn(
-            "page_name", delete_tool.inputSchema["properties"]
-        )
-        self.assertEqual(
-            delete_tool.inputSchema["required"], ["page_name"]
-        )
-        # Verify description mentions warning about irreversibility
-        self.assertIsNotNone(delete_tool.description)
-        self.assertIn("cannot be undone", delete_tool.description or "")
-        self.assertIn("WIKI_DELETE", delete_tool.description or "")
+        with pytest.raises(ValueError):
+            # Old JSON-style cursors are rejected
+            invalid_json = json.dumps({"offset": 10, "total": 100})
+            invalid = base64.b64encode(
+                invalid_json.encode("utf-8")
+            ).decode("utf-8")
+            decode_cursor(invalid)
+
+        with pytest.raises(ValueError):
+            decode_cursor("caf\u00e9")
+
+
+# Expected inputSchema properties (subset) and required per wiki tool
+_EXPECTED_SCHEMAS = {
+    "wiki_get": {
+        "properties": {"page_name", "version"},
+        "required": ["page_name"],
+    },
+    "wiki_search": {
+        "properties": {"query", "prefix", "limit", "cursor"},
+        "required": ["query"],
+    },
+    "wiki_create": {
+        "properties": {"page_name", "content", "comment"},
+        "required": ["page_name", "content"],
+    },
+    "wiki_update": {
+        "properties": {"page_name", "content", "version", "comment"},
+        "required": ["page_name", "content", "version"],
+    },
+    "wiki_delete": {
+        "properties": {"page_name"},
+        "required": ["page_name"],
+    },
+    "wiki_recent_changes": {
+        "properties": {"since_days", "limit"},
+        "required": [],
+    },
+}
+
+_WIKI_TOOLS_BY_NAME = {tool.name: tool for tool in WIKI_TOOLS}
+
+
+def test_six_tools_defined():
+    """Test WIKI_TOOLS contains exactly the expected 6 tools."""
+    assert len(WIKI_TOOLS) == 6
+    assert _WIKI_TOOLS_BY_NAME.keys() == _EXPECTED_SCHEMAS.keys()
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    _EXPECTED_SCHEMAS.items(),
+    ids=list(_EXPECTED_SCHEMAS),
+)
+def test_tool_schema(name, expected):
+    """Test each wiki tool declares its properties and required fields."""
+    schema = _WIKI_TOOLS_BY_NAME[name].inputSchema
+    assert expected["properties"] <= schema["properties"].keys()
+    assert schema["required"] == expected["required"]
 
 
-class TestFormatTimestamp(unittest.TestCase):
+def test_wiki_delete_description_warns():
+    """Test wiki_delete description warns about irreversibility."""
+    description = _WIKI_TOOLS_BY_NAME["wiki_delete"].description
+    assert description is not None
+    assert "cannot be undone" in description
+    assert "WIKI_DELETE" in description
+
+
+class TestFormatTimestamp:
     """Test format_timestamp helper."""
 
     def test_datetime_input(self):
@@ -176,7 +250,7 @@ class TestFormatTimestamp(unittest.TestCase):
         dt = datetime(2026, 2, 1, 14, 30, 0)
         result = format_timestamp(dt)
 
-        self.assertEqual(result, "2026-02-01 14:30")
+        assert result == "2026-02-01 14:30"
 
     def test_int_timestamp_input(self):
         """Test formatting integer timestamps."""
@@ -185,7 +259,7 @@ class TestFormatTimestamp(unittest.TestCase):
         result = format_timestamp(timestamp)
 
         # Should be formatted (local time may differ)
-        self.assertIn("2026-02-01", result)
+        assert "2026-02-01" in result
 
     def test_float_timestamp_input(self):
         """Test formatting float timestamps."""
@@ -193,709 +267,469 @@ class TestFormatTimestamp(unittest.TestCase):
         result = format_timestamp(timestamp)
 
         # Should be formatted
-        self.assertIn("2026-02-01", result)
+        assert "2026-02-01" in result
 
     def test_string_passthrough(self):
         """Test string values pass through."""
         result = format_timestamp("2026-02-01")
 
-        self.assertEqual(result, "2026-02-01")
+        assert result == "2026-02-01"
 
 
-class TestHandleGet(unittest.TestCase):
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleGet:
     """Test _handle_get handler."""
 
-    def setUp(self):
-        """Set up mock client."""
-        self.mock_client = MagicMock()
-
-    def test_handle_get_success(self):
+    async def test_handle_get_success(
+        self, trac_client, mock_run_sync_limited
+    ):
         """Test _handle_get formats response correctly."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync_limited"
-        ) as mock_run_sync_limited:
-            # Set up run_sync_limited to return values directly (not coroutines)
-            mock_run_sync_limited.side_effect = [
-                "= Test Page =\n\nTest content.",  # get_wiki_page result
-                {  # get_wiki_page_info result
-                    "name": "TestPage",
-                    "version": 5,
-                    "author": "alice",
-                    "lastModified": datetime(2026, 2, 1, 14, 0, 0),
-                },
-            ]
-
-            # Call handler
-            result = asyncio.run(
-                _handle_get(self.mock_client, {"page_name": "TestPage"})
-            )
-
-            # Verify response - now returns CallToolResult
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("# TestPage", text)
-            self.assertIn("Version: 5", text)
-            self.assertIn("Author: alice", text)
-            self.assertIn("2026-02-01 14:00", text)
-            # Verify structured content
-            self.assertIsNotNone(result.structuredContent)
-            self.assertEqual(
-                result.structuredContent["name"], "TestPage"
-            )
-            self.assertEqual(result.structuredContent["version"], 5)
-
-    def test_handle_get_missing_page_name(self):
+        # Set up run_sync_limited to return values directly (not coroutines)
+        # get_wiki_page, then get_wiki_page_info
+        mock_run_sync_limited.side_effect = (_PAGE_TEXT, _PAGE_INFO)
+
+        # Call handler
+        result = await _handle_get(
+            trac_client, {"page_name": "TestPage"}
+        )
+
+        # Verify response - now returns CallToolResult
+        assert isinstance(result, CallToolResult)
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "# TestPage" in text
+        assert "Version: 5" in text
+        assert "Author: alice" in text
+        assert "2026-02-01 14:00" in text
+        # Verify structured content
+        assert result.structuredContent is not None
+        assert result.structuredContent["name"] == "TestPage"
+        assert result.structuredContent["version"] == 5
+
+    async def test_handle_get_missing_page_name(self, trac_client):
         """Test _handle_get returns error when page_name is missing."""
-        result = asyncio.run(_handle_get(self.mock_client, {}))
+        result = await _handle_get(trac_client, {})
 
-        self.assertTrue(result.isError)
-        self.assertEqual(len(result.content), 1)
+        assert result.isError
+        assert len(result.content) == 1
         text = result.content[0].text
 
-        self.assertIn("Error (validation_error)", text)
-        self.assertIn("page_name is required", text)
+        assert "Error (validation_error)" in text
+        assert "page_name is required" in text
 
 
-class TestHandleSearch(unittest.TestCase):
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleSearch:
     """Test _handle_search handler."""
 
-    def setUp(self):
-        """Set up mock client."""
-        self.mock_client = MagicMock()
-
-    def test_handle_search_success(self):
+    async def test_handle_search_success(
+        self, trac_client, mock_run_sync
+    ):
         """Test _handle_search returns paginated results."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            # Return search results directly
-            mock_run_sync.return_value = [
-                {
-                    "name": "PageOne",
-                    "snippet": "matched text in page one",
-                },
-                {
-                    "name": "PageTwo",
-                    "snippet": "matched text in page two",
-                },
-                {
-                    "name": "PageThree",
-                    "snippet": "matched text in page three",
-                },
-            ]
-
-            # Call handler with limit=2
-            result = asyncio.run(
-                _handle_search(
-                    self.mock_client, {"query": "test", "limit": 2}
-                )
-            )
-
-            # Verify response
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Found 3 wiki pages", text)
-            self.assertIn("**PageOne**", text)
-            self.assertIn("**PageTwo**", text)
-            self.assertNotIn("**PageThree**", text)
-            self.assertIn("cursor", text)  # Should have next cursor
-
-    def test_handle_search_with_prefix(self):
+        mock_run_sync.return_value = _SEARCH_RESULTS
+
+        # Call handler with limit=2
+        result = await _handle_search(
+            trac_client, {"query": "test", "limit": 2}
+        )
+
+        # Verify response
+        assert isinstance(result, CallToolResult)
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Found 3 wiki pages" in text
+        assert "**PageOne**" in text
+        assert "**PageTwo**" in text
+        assert "**PageThree**" not in text
+        assert "cursor" in text  # Should have next cursor
+
+    async def test_handle_search_with_prefix(
+        self, trac_client, mock_run_sync
+    ):
         """Test _handle_search filters by prefix."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            # Return search results directly
-            mock_run_sync.return_value = [
-                {"name": "User/Alice", "snippet": "alice page"},
-                {"name": "User/Bob", "snippet": "bob page"},
-                {"name": "System/Config", "snippet": "config page"},
-            ]
-
-            # Call handler with prefix filter
-            result = asyncio.run(
-                _handle_search(
-                    self.mock_client,
-                    {"query": "test", "prefix": "User/"},
-                )
-            )
-
-            # Verify response
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Found 2 wiki pages", text)
-            self.assertIn("**User/Alice**", text)
-            self.assertIn("**User/Bob**", text)
-            self.assertNotIn("**System/Config**", text)
-
-    def test_handle_search_missing_query(self):
+        mock_run_sync.return_value = _PREFIX_SEARCH_RESULTS
+
+        # Call handler with prefix filter
+        result = await _handle_search(
+            trac_client,
+            {"query": "test", "prefix": "User/"},
+        )
+
+        # Verify response
+        assert isinstance(result, CallToolResult)
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Found 2 wiki pages" in text
+        assert "**User/Alice**" in text
+        assert "**User/Bob**" in text
+        assert "**System/Config**" not in text
+
+    async def test_handle_search_missing_query(self, trac_client):
         """Test _handle_search returns error when query is missing."""
-        result = asyncio.run(_handle_search(self.mock_client, {}))
+        result = await _handle_search(trac_client, {})
 
-        self.assertTrue(result.isError)
-        self.assertEqual(len(result.content), 1)
+        assert result.isError
+        assert len(result.content) == 1
         text = result.content[0].text
 
-        self.assertIn("Error (validation_error)", text)
-        self.assertIn("query is required", text)
+        assert "Error (validation_error)" in text
+        assert "query is required" in text
 
 
-class TestHandleRecentChanges(unittest.TestCase):
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleRecentChanges:
     """Test _handle_recent_changes handler."""
 
-    def setUp(self):
-        """Set up mock client."""
-        self.mock_client = MagicMock()
-
-    def test_recent_changes_success(self):
+    async def test_recent_changes_success(
+        self, trac_client, mock_run_sync
+    ):
         """Test _handle_recent_changes returns formatted page list."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                {
-                    "name": "PageA",
-                    "author": "alice",
-                    "lastModified": 1707900000,
-                    "version": 3,
-                },
-                {
-                    "name": "PageB",
-                    "author": "bob",
-                    "lastModified": 1707800000,
-                    "version": 1,
-                },
-            ]
-
-            result = asyncio.run(
-                _handle_recent_changes(
-                    self.mock_client, {"since_days": 30}
-                )
-            )
-
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            text = result.content[0].text
-
-            self.assertIn("PageA", text)
-            self.assertIn("PageB", text)
-            self.assertIn("alice", text)
-            self.assertIn("bob", text)
-            self.assertIn("30 days", text)
-
-            # Verify structured content
-            self.assertIsNotNone(result.structuredContent)
-            self.assertEqual(len(result.structuredContent["pages"]), 2)
-            self.assertEqual(result.structuredContent["since_days"], 30)
-
-    def test_recent_changes_default_days(self):
+        # The handler sorts the list in place
+        mock_run_sync.return_value = list(_RECENT_CHANGES)
+
+        result = await _handle_recent_changes(
+            trac_client, {"since_days": 30}
+        )
+
+        assert isinstance(result, CallToolResult)
+        text = result.content[0].text
+
+        assert "PageA" in text
+        assert "PageB" in text
+        assert "alice" in text
+        assert "bob" in text
+        assert "30 days" in text
+
+        # Verify structured content
+        assert result.structuredContent is not None
+        assert len(result.structuredContent["pages"]) == 2
+        assert result.structuredContent["since_days"] == 30
+
+    async def test_recent_changes_default_days(
+        self, trac_client, mock_run_sync
+    ):
         """Test _handle_recent_changes uses default since_days=30 when not provided."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = [
-                {
-                    "name": "RecentPage",
-                    "author": "charlie",
-                    "lastModified": 1707900000,
-                    "version": 2,
-                },
-            ]
-
-            result = asyncio.run(
-                _handle_recent_changes(self.mock_client, {})
-            )
-
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            text = result.content[0].text
-
-            # Default is 30 days
-            self.assertIn("30 days", text)
-            self.assertEqual(result.structuredContent["since_days"], 30)
-
-            # Verify run_sync was called (client.get_recent_wiki_changes)
-            mock_run_sync.assert_called_once()
-
-    def test_recent_changes_empty(self):
-        """Test _handle_recent_changes with no results."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = []
+        mock_run_sync.return_value = [
+            {
+                "name": "RecentPage",
+                "author": "charlie",
+                "lastModified": 1707900000,
+                "version": 2,
+            },
+        ]
+
+        result = await _handle_recent_changes(trac_client, {})
+
+        assert isinstance(result, CallToolResult)
+        text = result.content[0].text
 
-            result = asyncio.run(
-                _handle_recent_changes(
-                    self.mock_client, {"since_days": 7}
-                )
-            )
+        # Default is 30 days
+        assert "30 days" in text
+        assert result.structuredContent["since_days"] == 30
 
-            from mcp.types import CallToolResult
+        # Verify run_sync was called (trac_client.get_recent_wiki_changes)
+        mock_run_sync.assert_called_once()
 
-            self.assertIsInstance(result, CallToolResult)
-            text = result.content[0].text
+    async def test_recent_changes_empty(
+        self, trac_client, mock_run_sync
+    ):
+        """Test _handle_recent_changes with no results."""
+        mock_run_sync.return_value = []
 
-            self.assertIn("No wiki pages modified", text)
-            self.assertIn("7 days", text)
-            self.assertEqual(result.structuredContent["pages"], [])
+        result = await _handle_recent_changes(
+            trac_client, {"since_days": 7}
+        )
+
+        assert isinstance(result, CallToolResult)
+        text = result.content[0].text
 
-    def test_recent_changes_with_limit(self):
+        assert "No wiki pages modified" in text
+        assert "7 days" in text
+        assert result.structuredContent["pages"] == []
+
+    async def test_recent_changes_with_limit(
+        self, trac_client, mock_run_sync
+    ):
         """Test _handle_recent_changes respects limit parameter."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            # Return more results than the limit
-            mock_run_sync.return_value = [
-                {
-                    "name": f"Page{i}",
-                    "author": "alice",
-                    "lastModified": 1707900000 - i * 1000,
-                    "version": 1,
-                }
-                for i in range(10)
-            ]
-
-            result = asyncio.run(
-                _handle_recent_changes(self.mock_client, {"limit": 3})
-            )
-
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            text = result.content[0].text
-
-            # Should show "showing 3 of 10"
-            self.assertIn("showing 3 of 10", text)
-            # Structured content should only have 3 pages
-            self.assertEqual(len(result.structuredContent["pages"]), 3)
-
-    def test_recent_changes_xmlrpc_datetime(self):
+        # Return more results than the limit; the handler sorts in place
+        mock_run_sync.return_value = list(_LIMIT_PAGES)
+
+        result = await _handle_recent_changes(trac_client, {"limit": 3})
+
+        assert isinstance(result, CallToolResult)
+        text = result.content[0].text
+
+        # Should show "showing 3 of 10"
+        assert "showing 3 of 10" in text
+        # Structured content should only have 3 pages
+        assert len(result.structuredContent["pages"]) == 3
+
+    async def test_recent_changes_xmlrpc_datetime(
+        self, trac_client, mock_run_sync
+    ):
         """Test _handle_recent_changes handles xmlrpc.client.DateTime timestamps."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_read.run_sync"
-        ) as mock_run_sync:
-            # Use xmlrpc.client.DateTime like the real server returns
-            xml_dt = xmlrpc.client.DateTime("20260201T14:00:00")
-            mock_run_sync.return_value = [
-                {
-                    "name": "XmlRpcPage",
-                    "author": "admin",
-                    "lastModified": xml_dt,
-                    "version": 5,
-                },
-            ]
-
-            result = asyncio.run(
-                _handle_recent_changes(
-                    self.mock_client, {"since_days": 30}
-                )
-            )
-
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            text = result.content[0].text
-
-            self.assertIn("XmlRpcPage", text)
-            self.assertIn("admin", text)
-            # Should have formatted the DateTime properly
-            self.assertIn("2026-02-01", text)
-
-
-class TestHandleCreate(unittest.TestCase):
+        # Use xmlrpc.client.DateTime like the real server returns
+        xml_dt = xmlrpc.client.DateTime("20260201T14:00:00")
+        mock_run_sync.return_value = [
+            {
+                "name": "XmlRpcPage",
+                "author": "admin",
+                "lastModified": xml_dt,
+                "version": 5,
+            },
+        ]
+
+        result = await _handle_recent_changes(
+            trac_client, {"since_days": 30}
+        )
+
+        assert isinstance(result, CallToolResult)
+        text = result.content[0].text
+
+        assert "XmlRpcPage" in text
+        assert "admin" in text
+        # Should have formatted the DateTime properly
+        assert "2026-02-01" in text
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleCreate:
     """Test _handle_create handler."""
 
-    def setUp(self):
-        """Set up mock client and config."""
-        self.mock_client = MagicMock()
-        self.mock_config = Config(
-            trac_url="http://test", username="test", password="test"
+    async def test_handle_create_success(
+        self, trac_client, mock_write_run_sync, mock_convert
+    ):
+        """Test _handle_create creates page and reports warnings."""
+        mock_write_run_sync.side_effect = (
+            # Existence check: page not found
+            xmlrpc.client.Fault(404, "Page not found"),
+            # put_wiki_page (create)
+            {"name": "NewPage", "version": 1, "author": "alice"},
+        )
+
+        mock_convert.return_value = _TABLE_WARNING_CONVERSION
+
+        # Call handler
+        result = await _handle_create(
+            trac_client,
+            {"page_name": "NewPage", "content": "# New Page"},
         )
-        self.mock_client.config = self.mock_config
 
-    def test_handle_create_success(self):
-        """Test _handle_create creates page and reports warnings."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.auto_convert"
-            ) as mock_convert,
-        ):
-            # Set up side effect - first call raises not found, second returns success
-            call_count = [0]
-
-            def side_effect_func(*args, **kwargs):
-                call_count[0] += 1
-                if call_count[0] == 1:
-                    # First call is get_wiki_page_info (check if exists)
-                    raise xmlrpc.client.Fault(404, "Page not found")
-                else:
-                    # Second call is put_wiki_page (create)
-                    return {
-                        "name": "NewPage",
-                        "version": 1,
-                        "author": "alice",
-                    }
-
-            mock_run_sync.side_effect = side_effect_func
-
-            # Mock auto_convert as async coroutine
-            async def mock_auto_convert(*args, **kwargs):
-                return ConversionResult(
-                    text="= New Page =",
-                    source_format="markdown",
-                    target_format="tracwiki",
-                    converted=True,
-                    warnings=[
-                        "Tables detected - TracWiki uses different table syntax. Manual conversion may be needed."
-                    ],
-                )
-
-            mock_convert.side_effect = mock_auto_convert
-
-            # Call handler
-            result = asyncio.run(
-                _handle_create(
-                    self.mock_client,
-                    {"page_name": "NewPage", "content": "# New Page"},
-                )
-            )
-
-            # Verify response
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Created wiki page 'NewPage'", text)
-            self.assertIn("version 1", text)
-            self.assertIn("Conversion warnings:", text)
-            self.assertIn("Tables detected", text)
-
-    def test_handle_create_already_exists(self):
+        # Verify response
+        assert isinstance(result, CallToolResult)
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Created wiki page 'NewPage'" in text
+        assert "version 1" in text
+        assert "Conversion warnings:" in text
+        assert "Tables detected" in text
+
+    async def test_handle_create_already_exists(
+        self, trac_client, mock_write_run_sync, mock_convert
+    ):
         """Test _handle_create detects existing page."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.auto_convert"
-            ) as mock_convert,
-        ):
-            # Return page info (page exists)
-            mock_run_sync.return_value = {
-                "name": "ExistingPage",
-                "version": 3,
-            }
-
-            # Mock auto_convert as async coroutine
-            async def mock_auto_convert(*args, **kwargs):
-                return ConversionResult(
-                    text="= Existing =",
-                    source_format="markdown",
-                    target_format="tracwiki",
-                    converted=True,
-                )
-
-            mock_convert.side_effect = mock_auto_convert
-
-            # Call handler
-            result = asyncio.run(
-                _handle_create(
-                    self.mock_client,
-                    {"page_name": "ExistingPage", "content": "content"},
-                )
-            )
-
-            # Verify response
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Error (already_exists)", text)
-            self.assertIn("already exists", text)
-            self.assertIn("wiki_update", text)
-
-
-class TestHandleUpdate(unittest.TestCase):
+        # Return page info (page exists)
+        mock_write_run_sync.return_value = {
+            "name": "ExistingPage",
+            "version": 3,
+        }
+
+        mock_convert.return_value = _DEFAULT_CONVERSION
+
+        # Call handler
+        result = await _handle_create(
+            trac_client,
+            {"page_name": "ExistingPage", "content": "content"},
+        )
+
+        # Verify response
+        assert result.isError
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Error (already_exists)" in text
+        assert "already exists" in text
+        assert "wiki_update" in text
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleUpdate:
     """Test _handle_update handler."""
 
-    def setUp(self):
-        """Set up mock client and config."""
-        self.mock_client = MagicMock()
-        self.mock_config = Config(
-            trac_url="http://test", username="test", password="test"
+    async def test_handle_update_success(
+        self, trac_client, mock_write_run_sync, mock_convert
+    ):
+        """Test _handle_update updates page successfully."""
+        # Set up mocks
+        mock_write_run_sync.return_value = {
+            "name": "TestPage",
+            "version": 6,
+            "author": "alice",
+        }
+
+        mock_convert.return_value = _DEFAULT_CONVERSION
+
+        # Call handler
+        result = await _handle_update(
+            trac_client,
+            {
+                "page_name": "TestPage",
+                "content": "# Updated",
+                "version": 5,
+            },
         )
-        self.mock_client.config = self.mock_config
 
-    def test_handle_update_success(self):
-        """Test _handle_update updates page successfully."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.auto_convert"
-            ) as mock_convert,
-        ):
-            # Set up mocks
-            mock_run_sync.return_value = {
-                "name": "TestPage",
-                "version": 6,
-                "author": "alice",
-            }
-
-            # Mock auto_convert as async coroutine
-            async def mock_auto_convert(*args, **kwargs):
-                return ConversionResult(
-                    text="= Updated Page =",
-                    source_format="markdown",
-                    target_format="tracwiki",
-                    converted=True,
-                    warnings=[],
-                )
-
-            mock_convert.side_effect = mock_auto_convert
-
-            # Call handler
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "page_name": "TestPage",
-                        "content": "# Updated",
-                        "version": 5,
-                    },
-                )
-            )
-
-            # Verify response
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Updated wiki page 'TestPage'", text)
-            self.assertIn("version 6", text)
-
-    def test_handle_update_version_conflict(self):
+        # Verify response
+        assert isinstance(result, CallToolResult)
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Updated wiki page 'TestPage'" in text
+        assert "version 6" in text
+
+    async def test_handle_update_version_conflict(
+        self, trac_client, mock_write_run_sync, mock_convert
+    ):
         """Test _handle_update handles version conflict."""
-        with (
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-            ) as mock_run_sync,
-            patch(
-                "trac_mcp_server.mcp.tools.wiki_write.auto_convert"
-            ) as mock_convert,
-        ):
-            # Set up side effect - first call raises conflict, second returns current version
-            call_count = [0]
-
-            def side_effect_func(*args, **kwargs):
-                call_count[0] += 1
-                if call_count[0] == 1:
-                    # First call is put_wiki_page
-                    raise xmlrpc.client.Fault(
-                        409, "Version conflict - page not modified"
-                    )
-                else:
-                    # Second call is get_wiki_page_info
-                    return {"name": "TestPage", "version": 7}
-
-            mock_run_sync.side_effect = side_effect_func
-
-            # Mock auto_convert as async coroutine
-            async def mock_auto_convert(*args, **kwargs):
-                return ConversionResult(
-                    text="= Updated =",
-                    source_format="markdown",
-                    target_format="tracwiki",
-                    converted=True,
-                    warnings=[],
-                )
-
-            mock_convert.side_effect = mock_auto_convert
-
-            # Call handler
-            result = asyncio.run(
-                _handle_update(
-                    self.mock_client,
-                    {
-                        "page_name": "TestPage",
-                        "content": "# Updated",
-                        "version": 5,
-                    },
-                )
-            )
-
-            # Verify response
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Error (version_conflict)", text)
-            self.assertIn("Current version is 7", text)
-            self.assertIn("you tried to update version 5", text)
-            self.assertIn("version=7", text)
-
-
-class TestHandleDelete(unittest.TestCase):
-    """Test _handle_delete handler."""
+        mock_write_run_sync.side_effect = (
+            # put_wiki_page: conflict
+            xmlrpc.client.Fault(
+                409, "Version conflict - page not modified"
+            ),
+            # get_wiki_page_info: current version
+            {"name": "TestPage", "version": 7},
+        )
+
+        mock_convert.return_value = _DEFAULT_CONVERSION
+
+        # Call handler
+        result = await _handle_update(
+            trac_client,
+            {
+                "page_name": "TestPage",
+                "content": "# Updated",
+                "version": 5,
+            },
+        )
+
+        # Verify response
+        assert result.isError
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Error (version_conflict)" in text
+        assert "Current version is 7" in text
+        assert "you tried to update version 5" in text
+        assert "version=7" in text
+
 
-    def setUp(self):
-        """Set up mock client."""
-        self.mock_client = MagicMock()
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleDelete:
+    """Test _handle_delete handler."""
 
-    def test_handle_delete_success(self):
+    async def test_handle_delete_success(
+        self, trac_client, mock_write_run_sync
+    ):
         """Test _handle_delete deletes page successfully."""
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-        ) as mock_run_sync:
-            # Return page content for existence check, True for deletion
-            mock_run_sync.return_value = True
-
-            # Call handler
-            result = asyncio.run(
-                _handle_delete(
-                    self.mock_client, {"page_name": "TestPage"}
-                )
-            )
-
-            # Verify response
-            from mcp.types import CallToolResult
-
-            self.assertIsInstance(result, CallToolResult)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Deleted wiki page 'TestPage'", text)
-
-            # Verify get_wiki_page (existence check) and delete_wiki_page were called
-            self.assertEqual(mock_run_sync.call_count, 2)
-            # First call: existence check with get_wiki_page
-            first_call_args = mock_run_sync.call_args_list[0][0]
-            self.assertEqual(first_call_args[1], "TestPage")
-            # Second call: delete_wiki_page
-            second_call_args = mock_run_sync.call_args_list[1][0]
-            self.assertEqual(second_call_args[1], "TestPage")
-
-    def test_handle_delete_missing_page_name(self):
+        # True for both the existence check and the deletion
+        mock_write_run_sync.return_value = True
+
+        # Call handler
+        result = await _handle_delete(
+            trac_client, {"page_name": "TestPage"}
+        )
+
+        # Verify response
+        assert isinstance(result, CallToolResult)
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Deleted wiki page 'TestPage'" in text
+
+        # Existence check with get_wiki_page, then delete_wiki_page
+        assert mock_write_run_sync.call_args_list == [
+            call(trac_client.get_wiki_page, "TestPage"),
+            call(trac_client.delete_wiki_page, "TestPage"),
+        ]
+
+    async def test_handle_delete_missing_page_name(self, trac_client):
         """Test _handle_delete returns error when page_name is missing."""
-        result = asyncio.run(_handle_delete(self.mock_client, {}))
+        result = await _handle_delete(trac_client, {})
 
-        self.assertTrue(result.isError)
-        self.assertEqual(len(result.content), 1)
+        assert result.isError
+        assert len(result.content) == 1
         text = result.content[0].text
 
-        self.assertIn("Error (validation_error)", text)
-        self.assertIn("page_name is required", text)
+        assert "Error (validation_error)" in text
+        assert "page_name is required" in text
 
-    def test_handle_delete_page_not_found(self):
+    async def test_handle_delete_page_not_found(
+        self, trac_client, mock_write_run_sync
+    ):
         """Test _handle_delete handles page not found error."""
-        config = Config(
-            trac_url="http://test", username="test", password="test"
+        # Raise not found error
+        mock_write_run_sync.side_effect = xmlrpc.client.Fault(
+            404, "Page not found"
+        )
+
+        # Call through ToolRegistry to test error translation
+        registry = ToolRegistry(WIKI_WRITE_SPECS)
+        result = await registry.call_tool(
+            "wiki_delete",
+            {"page_name": "NonExistentPage"},
+            trac_client,
         )
-        mock_client = MagicMock()
-        mock_client.config = config
-
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-        ) as mock_run_sync:
-            # Raise not found error
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                404, "Page not found"
-            )
-
-            # Call through ToolRegistry to test error translation
-            registry = ToolRegistry(WIKI_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "wiki_delete",
-                    {"page_name": "NonExistentPage"},
-                    mock_client,
-                )
-            )
-
-            # Verify error response
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Error (not_found)", text)
-            # Error message may say "not found" or "does not exist"
-            self.assertTrue(
-                "not found" in text.lower()
-                or "does not exist" in text.lower()
-            )
-
-    def test_handle_delete_permission_denied(self):
+
+        # Verify error response
+        assert result.isError
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Error (not_found)" in text
+        # Error message may say "not found" or "does not exist"
+        assert (
+            "not found" in text.lower()
+            or "does not exist" in text.lower()
+        )
+
+    async def test_handle_delete_permission_denied(
+        self, trac_client, mock_write_run_sync
+    ):
         """Test _handle_delete handles permission denied error."""
-        config = Config(
-            trac_url="http://test", username="test", password="test"
+        # Raise permission denied error
+        mock_write_run_sync.side_effect = xmlrpc.client.Fault(
+            403, "Permission denied"
+        )
+
+        # Call through ToolRegistry to test error translation
+        registry = ToolRegistry(WIKI_WRITE_SPECS)
+        result = await registry.call_tool(
+            "wiki_delete",
+            {"page_name": "ProtectedPage"},
+            trac_client,
         )
-        mock_client = MagicMock()
-        mock_client.config = config
-
-        with patch(
-            "trac_mcp_server.mcp.tools.wiki_write.run_sync"
-        ) as mock_run_sync:
-            # Raise permission denied error
-            mock_run_sync.side_effect = xmlrpc.client.Fault(
-                403, "Permission denied"
-            )
-
-            # Call through ToolRegistry to test error translation
-            registry = ToolRegistry(WIKI_WRITE_SPECS)
-            result = asyncio.run(
-                registry.call_tool(
-                    "wiki_delete",
-                    {"page_name": "ProtectedPage"},
-                    mock_client,
-                )
-            )
-
-            # Verify error response
-            self.assertTrue(result.isError)
-            self.assertEqual(len(result.content), 1)
-            text = result.content[0].text
-
-            self.assertIn("Error (permission_denied)", text)
-            self.assertIn("permission", text.lower())
-
-
-class TestHandleWikiTool(unittest.TestCase):
+
+        # Verify error response
+        assert result.isError
+        assert len(result.content) == 1
+        text = result.content[0].text
+
+        assert "Error (permission_denied)" in text
+        assert "permission" in text.lower()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandleWikiTool:
     """Test wiki tool dispatch via ToolRegistry."""
 
-    def test_unknown_tool(self):
+    async def test_unknown_tool(self, trac_client):
         """Test ToolRegistry raises ValueError for unknown tool."""
-        mock_client = MagicMock()
-
         registry = ToolRegistry(WIKI_WRITE_SPECS)
 
         # ToolRegistry raises ValueError for unregistered tool names
-        with self.assertRaises(ValueError):
-            asyncio.run(
-                registry.call_tool("wiki_unknown", {}, mock_client)
-            )
-
-
-if __name__ == "__main__":
-    unittest.main()
+        with pytest.raises(ValueError):
+            await registry.call_tool("wiki_unknown", {}, trac_client)
@@ -1,17 +1,12 @@
 """Tests for wiki_file tool handlers: detect_format, push, pull, and frontmatter stripping."""
 
 import xmlrpc.client
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, patch
 
 import mcp.types as types
 
-from trac_mcp_server.mcp.tools.registry import ToolRegistry
-from trac_mcp_server.mcp.tools.wiki_file import (
-    WIKI_FILE_SPECS,
-    _strip_yaml_frontmatter,
-)
-
-_registry = ToolRegistry(WIKI_FILE_SPECS)
+from trac_mcp_server.converters import ConversionResult
+from trac_mcp_server.mcp.tools.wiki_file import _strip_yaml_frontmatter
 
 # =============================================================================
 # _strip_yaml_frontmatter
@@ -46,6 +41,14 @@ class TestStripYamlFrontmatter:
         content = "---\nx: 1\n---\n\n\n# Title"
         assert _strip_yaml_frontmatter(content) == "# Title"
 
+    def test_crlf_frontmatter(self):
+        content = "---\r\nx: 1\r\n---\r\n\r\n# Title\r\nBody"
+        assert _strip_yaml_frontmatter(content) == "# Title\r\nBody"
+
+    def test_indented_body_kept(self):
+        content = "---\nx: 1\n---\n    code line"
+        assert _strip_yaml_frontmatter(content) == "    code line"
+
 
 # =============================================================================
 # _handle_detect_format (via ToolRegistry.call_tool)
@@ -55,59 +58,64 @@ class TestStripYamlFrontmatter:
 class TestDetectFormat:
     """Tests for wiki_file_detect_format handler."""
 
-    async def test_md_file(self, tmp_path):
-        md_file = tmp_path / "page.md"
-        md_file.write_text("# Hello\n\nSome **bold** text.")
-        client = MagicMock()
-        result = await _registry.call_tool(
+    async def test_md_file(
+        self, wiki_corpus, wiki_file_registry, trac_client
+    ):
+        md_file = wiki_corpus["bold.md"]
+        result = await wiki_file_registry.call_tool(
             "wiki_file_detect_format",
             {"file_path": str(md_file)},
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["format"] == "markdown"
-        assert result.structuredContent["encoding"] == "utf-8"
-        assert result.structuredContent["size_bytes"] > 0
-
-    async def test_wiki_file(self, tmp_path):
-        wiki_file = tmp_path / "page.wiki"
-        wiki_file.write_text("= Title =\n\n'''bold''' text.")
-        client = MagicMock()
-        result = await _registry.call_tool(
+        assert result.structuredContent == {
+            "file_path": str(md_file),
+            "format": "markdown",
+            "encoding": "utf-8",
+            "size_bytes": md_file.stat().st_size,
+        }
+
+    async def test_wiki_file(
+        self, wiki_corpus, wiki_file_registry, trac_client
+    ):
+        wiki_file = wiki_corpus["bold.wiki"]
+        result = await wiki_file_registry.call_tool(
             "wiki_file_detect_format",
             {"file_path": str(wiki_file)},
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
         assert result.structuredContent["format"] == "tracwiki"
 
-    async def test_txt_with_tracwiki_content(self, tmp_path):
-        txt_file = tmp_path / "page.txt"
-        txt_file.write_text("= Heading =\n\n'''bold''' and {{{code}}}")
-        client = MagicMock()
-        result = await _registry.call_tool(
+    async def test_txt_with_tracwiki_content(
+        self, wiki_corpus, wiki_file_registry, trac_client
+    ):
+        txt_file = wiki_corpus["tracwiki.txt"]
+        result = await wiki_file_registry.call_tool(
             "wiki_file_detect_format",
             {"file_path": str(txt_file)},
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
         assert result.structuredContent["format"] == "tracwiki"
 
-    async def test_missing_file_path(self):
-        client = MagicMock()
-        result = await _registry.call_tool(
-            "wiki_file_detect_format", {}, client
+    async def test_missing_file_path(
+        self, wiki_file_registry, trac_client
+    ):
+        result = await wiki_file_registry.call_tool(
+            "wiki_file_detect_format", {}, trac_client
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
         assert "file_path is required" in result.content[0].text
 
-    async def test_nonexistent_file(self, tmp_path):
-        client = MagicMock()
-        result = await _registry.call_tool(
+    async def test_nonexistent_file(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
+        result = await wiki_file_registry.call_tool(
             "wiki_file_detect_format",
             {"file_path": str(tmp_path / "no_such_file.md")},
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
@@ -119,116 +127,109 @@ class TestDetectFormat:
 # =============================================================================
 
 
-def _make_client():
-    """Create a minimal mock TracClient with config attribute."""
-    client = MagicMock()
-    client.config = MagicMock()
-    client.config.trac_url = "http://localhost/trac"
-    client.config.username = "user"
-    client.config.password = "pass"
-    client.config.verify_ssl = True
-    client.config.auto_convert = True
-    return client
-
-
 class TestPush:
     """Tests for wiki_file_push handler."""
 
     @patch("trac_mcp_server.mcp.tools.wiki_file.auto_convert")
-    async def test_push_new_page(self, mock_convert, tmp_path):
+    async def test_push_new_page(
+        self, mock_convert, wiki_corpus, wiki_file_registry, trac_client
+    ):
         """Push a .md file to a new wiki page (page doesn't exist)."""
-        md_file = tmp_path / "page.md"
-        md_file.write_text("# Hello\nWorld")
+        md_file = wiki_corpus["hello.md"]
 
         # auto_convert returns converted content
-        mock_result = MagicMock()
-        mock_result.text = "= Hello =\nWorld"
-        mock_result.converted = True
-        mock_result.warnings = []
-        mock_convert.return_value = mock_result
+        mock_convert.return_value = ConversionResult(
+            text="= Hello =\nWorld", converted=True
+        )
 
         # TracClient: get_wiki_page_info raises Fault (not found)
-        client = _make_client()
-        client.get_wiki_page_info.side_effect = xmlrpc.client.Fault(
-            1, "Page TestPage does not exist"
+        trac_client.get_wiki_page_info.side_effect = (
+            xmlrpc.client.Fault(1, "Page TestPage does not exist")
         )
-        client.put_wiki_page.return_value = {
+        trac_client.put_wiki_page.return_value = {
             "version": 1,
             "name": "TestPage",
         }
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_push",
             {"file_path": str(md_file), "page_name": "TestPage"},
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["action"] == "created"
-        assert result.structuredContent["version"] == 1
-        assert result.structuredContent["converted"] is True
+        assert result.structuredContent == {
+            "page_name": "TestPage",
+            "action": "created",
+            "version": 1,
+            "source_format": "markdown",
+            "converted": True,
+            "file_path": str(md_file),
+            "warnings": [],
+        }
 
     @patch("trac_mcp_server.mcp.tools.wiki_file.auto_convert")
-    async def test_push_update_existing(self, mock_convert, tmp_path):
+    async def test_push_update_existing(
+        self, mock_convert, wiki_corpus, wiki_file_registry, trac_client
+    ):
         """Push a .md file updating an existing wiki page."""
-        md_file = tmp_path / "page.md"
-        md_file.write_text("# Updated\nContent")
-
-        mock_result = MagicMock()
-        mock_result.text = "= Updated =\nContent"
-        mock_result.converted = True
-        mock_result.warnings = []
-        mock_convert.return_value = mock_result
-
-        client = _make_client()
-        client.get_wiki_page_info.return_value = {"version": 3}
-        client.put_wiki_page.return_value = {
+        md_file = wiki_corpus["updated.md"]
+
+        mock_convert.return_value = ConversionResult(
+            text="= Updated =\nContent", converted=True
+        )
+
+        trac_client.get_wiki_page_info.return_value = {"version": 3}
+        trac_client.put_wiki_page.return_value = {
             "version": 4,
             "name": "TestPage",
         }
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_push",
             {"file_path": str(md_file), "page_name": "TestPage"},
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["action"] == "updated"
-        assert result.structuredContent["version"] == 4
+        assert result.structuredContent == {
+            "page_name": "TestPage",
+            "action": "updated",
+            "version": 4,
+            "source_format": "markdown",
+            "converted": True,
+            "file_path": str(md_file),
+            "warnings": [],
+        }
         # Verify optimistic locking: put_wiki_page called with version=3
-        client.put_wiki_page.assert_called_once()
-        call_args = client.put_wiki_page.call_args
+        trac_client.put_wiki_page.assert_called_once()
+        call_args = trac_client.put_wiki_page.call_args
         assert call_args[0][3] == 3  # version argument
 
     @patch("trac_mcp_server.mcp.tools.wiki_file.auto_convert")
     async def test_push_strips_frontmatter(
-        self, mock_convert, tmp_path
+        self, mock_convert, wiki_corpus, wiki_file_registry, trac_client
     ):
         """Frontmatter is stripped before conversion when strip_frontmatter=True."""
-        md_file = tmp_path / "page.md"
-        md_file.write_text("---\ntitle: Hello\n---\n# Hello\nWorld")
+        md_file = wiki_corpus["frontmatter.md"]
 
-        mock_result = MagicMock()
-        mock_result.text = "= Hello =\nWorld"
-        mock_result.converted = True
-        mock_result.warnings = []
-        mock_convert.return_value = mock_result
+        mock_convert.return_value = ConversionResult(
+            text="= Hello =\nWorld", converted=True
+        )
 
-        client = _make_client()
-        client.get_wiki_page_info.side_effect = xmlrpc.client.Fault(
-            1, "not found"
+        trac_client.get_wiki_page_info.side_effect = (
+            xmlrpc.client.Fault(1, "not found")
         )
-        client.put_wiki_page.return_value = {"version": 1}
+        trac_client.put_wiki_page.return_value = {"version": 1}
 
-        await _registry.call_tool(
+        await wiki_file_registry.call_tool(
             "wiki_file_push",
             {
                 "file_path": str(md_file),
                 "page_name": "TestPage",
                 "strip_frontmatter": True,
             },
-            client,
+            trac_client,
         )
 
         # auto_convert should have received content without frontmatter
@@ -238,66 +239,69 @@ class TestPush:
 
     @patch("trac_mcp_server.mcp.tools.wiki_file.auto_convert")
     async def test_push_preserves_frontmatter(
-        self, mock_convert, tmp_path
+        self, mock_convert, wiki_corpus, wiki_file_registry, trac_client
     ):
         """Frontmatter is preserved when strip_frontmatter=False."""
-        md_file = tmp_path / "page.md"
-        md_file.write_text("---\ntitle: Hello\n---\n# Hello")
+        md_file = wiki_corpus["frontmatter_heading.md"]
 
-        mock_result = MagicMock()
-        mock_result.text = "converted"
-        mock_result.converted = True
-        mock_result.warnings = []
-        mock_convert.return_value = mock_result
+        mock_convert.return_value = ConversionResult(
+            text="converted", converted=True
+        )
 
-        client = _make_client()
-        client.get_wiki_page_info.side_effect = xmlrpc.client.Fault(
-            1, "not found"
+        trac_client.get_wiki_page_info.side_effect = (
+            xmlrpc.client.Fault(1, "not found")
         )
-        client.put_wiki_page.return_value = {"version": 1}
+        trac_client.put_wiki_page.return_value = {"version": 1}
 
-        await _registry.call_tool(
+        await wiki_file_registry.call_tool(
             "wiki_file_push",
             {
                 "file_path": str(md_file),
                 "page_name": "TestPage",
                 "strip_frontmatter": False,
             },
-            client,
+            trac_client,
         )
 
         # auto_convert should have received content WITH frontmatter
         convert_call = mock_convert.call_args
         assert "---" in convert_call[0][0]
 
-    async def test_push_tracwiki_no_conversion(self, tmp_path):
+    async def test_push_tracwiki_no_conversion(
+        self, wiki_corpus, wiki_file_registry, trac_client
+    ):
         """Push a .wiki file passes content through without conversion."""
-        wiki_file = tmp_path / "page.wiki"
         wiki_content = "= Title =\n\n'''bold'''"
-        wiki_file.write_text(wiki_content)
+        wiki_file = wiki_corpus["title.wiki"]
 
-        client = _make_client()
-        client.get_wiki_page_info.side_effect = xmlrpc.client.Fault(
-            1, "not found"
+        trac_client.get_wiki_page_info.side_effect = (
+            xmlrpc.client.Fault(1, "not found")
         )
-        client.put_wiki_page.return_value = {"version": 1}
+        trac_client.put_wiki_page.return_value = {"version": 1}
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_push",
             {"file_path": str(wiki_file), "page_name": "TestPage"},
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["converted"] is False
-        assert result.structuredContent["source_format"] == "tracwiki"
+        assert result.structuredContent == {
+            "page_name": "TestPage",
+            "action": "created",
+            "version": 1,
+            "source_format": "tracwiki",
+            "converted": False,
+            "file_path": str(wiki_file),
+            "warnings": [],
+        }
         # put_wiki_page should receive the original content
-        put_call = client.put_wiki_page.call_args
+        put_call = trac_client.put_wiki_page.call_args
         assert put_call[0][1] == wiki_content
 
     @patch("trac_mcp_server.mcp.tools.wiki_file.auto_convert")
     async def test_push_new_page_info_returns_zero(
-        self, mock_convert, tmp_path
+        self, mock_convert, wiki_corpus, wiki_file_registry, trac_client
     ):
         """Push creates page when get_wiki_page_info returns 0 instead of Fault.
 
@@ -305,51 +309,55 @@ class TestPush:
         raising xmlrpc.client.Fault. The handler must treat falsy/non-dict
         returns as 'page not found' and create the page.
         """
-        md_file = tmp_path / "page.md"
-        md_file.write_text("# New Page\nContent here")
+        md_file = wiki_corpus["new_page.md"]
 
-        mock_result = MagicMock()
-        mock_result.text = "= New Page =\nContent here"
-        mock_result.converted = True
-        mock_result.warnings = []
-        mock_convert.return_value = mock_result
+        mock_convert.return_value = ConversionResult(
+            text="= New Page =\nContent here", converted=True
+        )
 
         # TracClient: get_wiki_page_info returns 0 (the bug scenario)
-        client = _make_client()
-        client.get_wiki_page_info.return_value = 0
-        client.put_wiki_page.return_value = {
+        trac_client.get_wiki_page_info.return_value = 0
+        trac_client.put_wiki_page.return_value = {
             "version": 1,
             "name": "NewPage",
         }
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_push",
             {"file_path": str(md_file), "page_name": "NewPage"},
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["action"] == "created"
-        assert result.structuredContent["version"] == 1
+        assert result.structuredContent == {
+            "page_name": "NewPage",
+            "action": "created",
+            "version": 1,
+            "source_format": "markdown",
+            "converted": True,
+            "file_path": str(md_file),
+            "warnings": [],
+        }
         # put_wiki_page should have been called with version=None (create mode)
-        call_args = client.put_wiki_page.call_args
+        call_args = trac_client.put_wiki_page.call_args
         assert call_args[0][3] is None  # version argument
 
-    async def test_push_missing_file_path(self):
-        client = _make_client()
-        result = await _registry.call_tool(
-            "wiki_file_push", {"page_name": "TestPage"}, client
+    async def test_push_missing_file_path(
+        self, wiki_file_registry, trac_client
+    ):
+        result = await wiki_file_registry.call_tool(
+            "wiki_file_push", {"page_name": "TestPage"}, trac_client
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
         assert "file_path is required" in result.content[0].text
 
-    async def test_push_missing_page_name(self, tmp_path):
-        md_file = tmp_path / "page.md"
-        md_file.write_text("hello")
-        client = _make_client()
-        result = await _registry.call_tool(
-            "wiki_file_push", {"file_path": str(md_file)}, client
+    async def test_push_missing_page_name(
+        self, wiki_corpus, wiki_file_registry, trac_client
+    ):
+        md_file = wiki_corpus["plain.md"]
+        result = await wiki_file_registry.call_tool(
+            "wiki_file_push", {"file_path": str(md_file)}, trac_client
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
@@ -364,34 +372,39 @@ class TestPush:
 class TestPull:
     """Tests for wiki_file_pull handler."""
 
-    async def test_pull_markdown_format(self, tmp_path):
+    async def test_pull_markdown_format(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Pull a wiki page to a .md file with TracWiki-to-Markdown conversion."""
         out_file = tmp_path / "page.md"
 
-        client = _make_client()
-        client.get_wiki_page.return_value = (
+        trac_client.get_wiki_page.return_value = (
             "= Hello =\n\n'''bold''' text."
         )
-        client.get_wiki_page_info.return_value = {
+        trac_client.get_wiki_page_info.return_value = {
             "version": 5,
             "author": "admin",
         }
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {
                 "page_name": "TestPage",
                 "file_path": str(out_file),
                 "format": "markdown",
             },
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["page_name"] == "TestPage"
-        assert result.structuredContent["format"] == "markdown"
-        assert result.structuredContent["version"] == 5
-        assert result.structuredContent["converted"] is True
+        assert result.structuredContent == {
+            "page_name": "TestPage",
+            "file_path": str(out_file),
+            "format": "markdown",
+            "version": 5,
+            "bytes_written": ANY,
+            "converted": True,
+        }
         assert result.structuredContent["bytes_written"] > 0
 
         # Verify file was actually written with converted markdown content
@@ -399,95 +412,113 @@ class TestPull:
         assert "# Hello" in written
         assert "**bold**" in written
 
-    async def test_pull_tracwiki_format(self, tmp_path):
+    async def test_pull_tracwiki_format(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Pull a wiki page to a .wiki file without conversion."""
         out_file = tmp_path / "page.wiki"
         wiki_content = "= Title =\n\n'''bold''' and {{{code}}}"
 
-        client = _make_client()
-        client.get_wiki_page.return_value = wiki_content
-        client.get_wiki_page_info.return_value = {
+        trac_client.get_wiki_page.return_value = wiki_content
+        trac_client.get_wiki_page_info.return_value = {
             "version": 3,
             "author": "admin",
         }
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {
                 "page_name": "TestPage",
                 "file_path": str(out_file),
                 "format": "tracwiki",
             },
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["format"] == "tracwiki"
-        assert result.structuredContent["converted"] is False
+        assert result.structuredContent == {
+            "page_name": "TestPage",
+            "file_path": str(out_file),
+            "format": "tracwiki",
+            "version": 3,
+            "bytes_written": ANY,
+            "converted": False,
+        }
 
         # Verify file was written with original TracWiki content unchanged
         written = out_file.read_text()
         assert written == wiki_content
 
-    async def test_pull_default_format_is_markdown(self, tmp_path):
+    async def test_pull_default_format_is_markdown(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Default format is markdown when not specified."""
         out_file = tmp_path / "page.md"
 
-        client = _make_client()
-        client.get_wiki_page.return_value = "= Hello ="
-        client.get_wiki_page_info.return_value = {"version": 1}
+        trac_client.get_wiki_page.return_value = "= Hello ="
+        trac_client.get_wiki_page_info.return_value = {"version": 1}
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {"page_name": "TestPage", "file_path": str(out_file)},
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
-        assert result.structuredContent["format"] == "markdown"
-        assert result.structuredContent["converted"] is True
+        assert result.structuredContent == {
+            "page_name": "TestPage",
+            "file_path": str(out_file),
+            "format": "markdown",
+            "version": 1,
+            "bytes_written": ANY,
+            "converted": True,
+        }
 
-    async def test_pull_specific_version(self, tmp_path):
+    async def test_pull_specific_version(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Pull a specific version of a wiki page."""
         out_file = tmp_path / "page.md"
 
-        client = _make_client()
-        client.get_wiki_page.return_value = "= Old Version ="
-        client.get_wiki_page_info.return_value = {
+        trac_client.get_wiki_page.return_value = "= Old Version ="
+        trac_client.get_wiki_page_info.return_value = {
             "version": 2,
             "author": "admin",
         }
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {
                 "page_name": "TestPage",
                 "file_path": str(out_file),
                 "version": 2,
             },
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
         assert result.structuredContent["version"] == 2
 
         # Verify get_wiki_page was called with version=2
-        client.get_wiki_page.assert_called_once_with("TestPage", 2)
-        client.get_wiki_page_info.assert_called_once_with("TestPage", 2)
+        trac_client.get_wiki_page.assert_called_once_with("TestPage", 2)
+        trac_client.get_wiki_page_info.assert_called_once_with(
+            "TestPage", 2
+        )
 
-    async def test_pull_nonexistent_page(self, tmp_path):
+    async def test_pull_nonexistent_page(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Pull a page that doesn't exist returns not_found error."""
         out_file = tmp_path / "page.md"
 
-        client = _make_client()
-        client.get_wiki_page.side_effect = xmlrpc.client.Fault(
+        trac_client.get_wiki_page.side_effect = xmlrpc.client.Fault(
             1, "Page NoSuchPage does not exist"
         )
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {"page_name": "NoSuchPage", "file_path": str(out_file)},
-            client,
+            trac_client,
         )
 
         assert isinstance(result, types.CallToolResult)
@@ -499,59 +530,63 @@ class TestPull:
         # File should not have been created
         assert not out_file.exists()
 
-    async def test_pull_missing_page_name(self, tmp_path):
+    async def test_pull_missing_page_name(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Missing page_name returns validation error."""
         out_file = tmp_path / "page.md"
-        client = _make_client()
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {"file_path": str(out_file)},
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
         assert "page_name is required" in result.content[0].text
 
-    async def test_pull_missing_file_path(self):
+    async def test_pull_missing_file_path(
+        self, wiki_file_registry, trac_client
+    ):
         """Missing file_path returns validation error."""
-        client = _make_client()
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {"page_name": "TestPage"},
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
         assert "file_path is required" in result.content[0].text
 
-    async def test_pull_invalid_output_path(self):
+    async def test_pull_invalid_output_path(
+        self, wiki_file_registry, trac_client
+    ):
         """Invalid output path (parent doesn't exist) returns validation error."""
-        client = _make_client()
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {
                 "page_name": "TestPage",
                 "file_path": "/nonexistent/dir/page.md",
             },
-            client,
+            trac_client,
         )
         assert isinstance(result, types.CallToolResult)
         assert result.isError is True
         assert "validation_error" in result.content[0].text
 
-    async def test_pull_other_fault_reraises(self, tmp_path):
+    async def test_pull_other_fault_reraises(
+        self, tmp_path, wiki_file_registry, trac_client
+    ):
         """Non-not-found Fault is caught by the registry error handler."""
         out_file = tmp_path / "page.md"
 
-        client = _make_client()
-        client.get_wiki_page.side_effect = xmlrpc.client.Fault(
+        trac_client.get_wiki_page.side_effect = xmlrpc.client.Fault(
             403, "Permission denied"
         )
 
-        result = await _registry.call_tool(
+        result = await wiki_file_registry.call_tool(
             "wiki_file_pull",
             {"page_name": "SecretPage", "file_path": str(out_file)},
-            client,
+            trac_client,
         )
 
         # ToolRegistry classifies fault 403 as permission_denied